@@ -0,0 +1,68 @@
+import argparse
+import json
+import subprocess
+import sys
+
+import pandas as pd
+
+# modules that `from neuralforecast import NeuralForecast` must not import
+LAZY_MODULES = [
+    'ray',
+    'optuna',
+    'pyspark',
+    'fugue',
+    'neuralforecast.auto',
+    'neuralforecast.common._base_auto',
+    'neuralforecast.models.nhits',
+]
+
+IMPORT_CODE = '''
+import json
+import sys
+import time
+
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"time": elapsed, "modules": sorted(sys.modules)}}))
+'''
+
+
+def time_import(statement):
+    # every import runs in a new interpreter, like the short-lived workers of a batch job
+    out = subprocess.run(
+        [sys.executable, '-c', IMPORT_CODE.format(statement=statement)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n_repeats", type=int, default=5)
+    parser.add_argument("--max_time", type=float, default=None, help="fail if the core import takes longer (seconds)")
+    args = parser.parse_args()
+
+    statements = {
+        'import torch, pytorch_lightning': 'import torch, pytorch_lightning',
+        'NeuralForecast': 'from neuralforecast import NeuralForecast',
+        'NeuralForecast + NHITS': 'from neuralforecast import NeuralForecast\nfrom neuralforecast.models import NHITS',
+        'NeuralForecast + auto': 'from neuralforecast import NeuralForecast\nimport neuralforecast.auto',
+    }
+    results = []
+    for name, statement in statements.items():
+        runs = [time_import(statement) for _ in range(args.n_repeats)]
+        results.append([name, len(runs[0]['modules']), min(run['time'] for run in runs)])
+        if name == 'NeuralForecast':
+            imported = [module for module in LAZY_MODULES if module in runs[0]['modules']]
+
+    results_df = pd.DataFrame(data=results, columns=['import', 'modules', 'time (s)'])
+    print(results_df.to_string(index=False))
+
+    if imported:
+        sys.exit(f'`from neuralforecast import NeuralForecast` imported {imported}')
+    core_time = results_df.set_index('import').loc['NeuralForecast', 'time (s)']
+    if args.max_time is not None and core_time > args.max_time:
+        sys.exit(f'`from neuralforecast import NeuralForecast` took {core_time:.2f}s, more than {args.max_time}s')
@@ -0,0 +1,89 @@
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+import torch
+
+from neuralforecast.tsdataset import TimeSeriesDataset
+
+
+def make_dataset(sizes, n_cols, seed):
+    rng = np.random.default_rng(seed)
+    indptr = np.append(0, np.cumsum(sizes)).astype(np.int32)
+    temporal = rng.random((indptr[-1], n_cols), dtype=np.float32)
+    return TimeSeriesDataset(
+        temporal=temporal,
+        temporal_cols=[f'col_{i}' for i in range(n_cols - 1)] + ['available_mask'],
+        indptr=indptr,
+        max_size=sizes.max(),
+        min_size=sizes.min(),
+        y_idx=0,
+    )
+
+
+def loop_append(dataset, futr_dataset):
+    # per-group implementation used before the vectorized append
+    new_temporal = torch.empty(size=(dataset.temporal.shape[0] + futr_dataset.temporal.shape[0], dataset.temporal.shape[1]))
+    new_indptr = dataset.indptr + futr_dataset.indptr
+    for i in range(dataset.n_groups):
+        curr_size = dataset.indptr[i + 1] - dataset.indptr[i]
+        new_temporal[new_indptr[i] : new_indptr[i] + curr_size] = dataset.temporal[dataset.indptr[i] : dataset.indptr[i + 1]]
+        new_temporal[new_indptr[i] + curr_size : new_indptr[i + 1]] = futr_dataset.temporal[futr_dataset.indptr[i] : futr_dataset.indptr[i + 1]]
+    return new_temporal
+
+
+def loop_trim(dataset, left_trim, right_trim):
+    # per-group implementation used before the vectorized trim_dataset
+    new_temporal = torch.zeros(size=(dataset.temporal.shape[0] - (left_trim + right_trim) * dataset.n_groups, dataset.temporal.shape[1]))
+    acum = 0
+    for i in range(dataset.n_groups):
+        new_length = dataset.indptr[i + 1] - dataset.indptr[i] - left_trim - right_trim
+        new_temporal[acum : acum + new_length] = dataset.temporal[dataset.indptr[i] + left_trim : dataset.indptr[i + 1] - right_trim]
+        acum += new_length
+    return new_temporal
+
+
+def timeit(fn, n_repeats):
+    times = []
+    for _ in range(n_repeats):
+        start = time.perf_counter()
+        out = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), out
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n_groups", type=int, default=1_000_000)
+    parser.add_argument("--min_length", type=int, default=20)
+    parser.add_argument("--max_length", type=int, default=60)
+    parser.add_argument("--n_cols", type=int, default=3)
+    parser.add_argument("--h", type=int, default=12)
+    parser.add_argument("--n_repeats", type=int, default=3)
+    parser.add_argument("--reference", action="store_true", help="also time the per-group loops")
+
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    sizes = rng.integers(args.min_length, args.max_length + 1, size=args.n_groups)
+    dataset = make_dataset(sizes, args.n_cols, seed=0)
+    futr_dataset = make_dataset(np.full(args.n_groups, args.h), args.n_cols, seed=1)
+
+    results = []
+    elapsed, appended = timeit(lambda: dataset.append(futr_dataset), args.n_repeats)
+    results.append(['append', 'vectorized', elapsed])
+    elapsed, trimmed = timeit(lambda: TimeSeriesDataset.trim_dataset(appended, left_trim=1, right_trim=args.h), args.n_repeats)
+    results.append(['trim_dataset', 'vectorized', elapsed])
+
+    if args.reference:
+        elapsed, expected = timeit(lambda: loop_append(dataset, futr_dataset), 1)
+        torch.testing.assert_close(appended.temporal, expected)
+        results.append(['append', 'loop', elapsed])
+        elapsed, expected = timeit(lambda: loop_trim(appended, 1, args.h), 1)
+        torch.testing.assert_close(trimmed.temporal, expected)
+        results.append(['trim_dataset', 'loop', elapsed])
+
+    results_df = pd.DataFrame(data=results, columns=['method', 'implementation', 'time (s)'])
+    print(f'n_groups={args.n_groups:,}, n_rows={dataset.temporal.shape[0]:,}')
+    print(results_df.to_string(index=False))
@@ -156,10 +156,18 @@ d = { 'settings': { 'branch': 'main',
                                                                                         'neuralforecast/auto.py'),
                                      'neuralforecast.auto.AutoiTransformer.get_default_config': ( 'models.html#autoitransformer.get_default_config',
                                                                                                   'neuralforecast/auto.py')},
-            'neuralforecast.compat': {},
+            'neuralforecast.compat': { 'neuralforecast.compat.SparkDataFrame': ('compat.html#sparkdataframe', 'neuralforecast/compat.py'),
+                                       'neuralforecast.compat._SparkDataFrameMeta': ( 'compat.html#_sparkdataframemeta',
+                                                                                      'neuralforecast/compat.py'),
+                                       'neuralforecast.compat._SparkDataFrameMeta.__instancecheck__': ( 'compat.html#_sparkdataframemeta.__instancecheck__',
+                                                                                                        'neuralforecast/compat.py')},
             'neuralforecast.core': { 'neuralforecast.core.NeuralForecast': ('core.html#neuralforecast', 'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.__init__': ( 'core.html#neuralforecast.__init__',
                                                                                       'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._check_futr_exog': ( 'core.html#neuralforecast._check_futr_exog',
+                                                                                              'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._check_level': ( 'core.html#neuralforecast._check_level',
+                                                                                          'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._check_nan': ( 'core.html#neuralforecast._check_nan',
                                                                                         'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._conformity_scores': ( 'core.html#neuralforecast._conformity_scores',
@@ -170,16 +178,28 @@ d = { 'settings': { 'branch': 'main',
                                                                                               'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._get_needed_futr_exog': ( 'core.html#neuralforecast._get_needed_futr_exog',
                                                                                                    'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._invalidate_predict_cache': ( 'core.html#neuralforecast._invalidate_predict_cache',
+                                                                                                       'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._no_refit_cross_validation': ( 'core.html#neuralforecast._no_refit_cross_validation',
                                                                                                         'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._parallel_fit': ( 'core.html#neuralforecast._parallel_fit',
+                                                                                           'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._parallel_refit_cross_validation': ( 'core.html#neuralforecast._parallel_refit_cross_validation',
+                                                                                                              'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._predict_cache_key': ( 'core.html#neuralforecast._predict_cache_key',
+                                                                                                'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._predict_distributed': ( 'core.html#neuralforecast._predict_distributed',
                                                                                                   'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._predict_series': ( 'core.html#neuralforecast._predict_series',
+                                                                                             'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._prepare_fit': ( 'core.html#neuralforecast._prepare_fit',
                                                                                           'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._prepare_fit_distributed': ( 'core.html#neuralforecast._prepare_fit_distributed',
                                                                                                       'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._prepare_fit_for_local_files': ( 'core.html#neuralforecast._prepare_fit_for_local_files',
                                                                                                           'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._refit_cross_validation': ( 'core.html#neuralforecast._refit_cross_validation',
+                                                                                                     'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._reset_models': ( 'core.html#neuralforecast._reset_models',
                                                                                            'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._scalers_fit_transform': ( 'core.html#neuralforecast._scalers_fit_transform',
@@ -188,6 +208,12 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._scalers_transform': ( 'core.html#neuralforecast._scalers_transform',
                                                                                                 'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._shared_windows_fit': ( 'core.html#neuralforecast._shared_windows_fit',
+                                                                                                 'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._slice_scalers': ( 'core.html#neuralforecast._slice_scalers',
+                                                                                            'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast.cache_predictions': ( 'core.html#neuralforecast.cache_predictions',
+                                                                                               'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.cross_validation': ( 'core.html#neuralforecast.cross_validation',
                                                                                               'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.fit': ('core.html#neuralforecast.fit', 'neuralforecast/core.py'),
@@ -198,12 +224,49 @@ d = { 'settings': { 'branch': 'main',
                                                                                                    'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.predict': ( 'core.html#neuralforecast.predict',
                                                                                      'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast.predict_cache_info': ( 'core.html#neuralforecast.predict_cache_info',
+                                                                                                'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.predict_insample': ( 'core.html#neuralforecast.predict_insample',
                                                                                               'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast.predict_iter': ( 'core.html#neuralforecast.predict_iter',
+                                                                                          'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.save': ('core.html#neuralforecast.save', 'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast.update': ( 'core.html#neuralforecast.update',
+                                                                                    'neuralforecast/core.py'),
+                                     'neuralforecast.core._ModelRegistry': ('core.html#_modelregistry', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._ModelRegistry.__getitem__': ( 'core.html#_modelregistry.__getitem__',
+                                                                                         'neuralforecast/core.py'),
+                                     'neuralforecast.core._ModelRegistry.__init__': ( 'core.html#_modelregistry.__init__',
+                                                                                      'neuralforecast/core.py'),
+                                     'neuralforecast.core._ModelRegistry.__iter__': ( 'core.html#_modelregistry.__iter__',
+                                                                                      'neuralforecast/core.py'),
+                                     'neuralforecast.core._ModelRegistry.__len__': ( 'core.html#_modelregistry.__len__',
+                                                                                     'neuralforecast/core.py'),
+                                     'neuralforecast.core._PredictCache': ('core.html#_predictcache', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._PredictCache.__init__': ( 'core.html#_predictcache.__init__',
+                                                                                     'neuralforecast/core.py'),
+                                     'neuralforecast.core._PredictCache.clear': ('core.html#_predictcache.clear', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._PredictCache.get': ('core.html#_predictcache.get', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._PredictCache.info': ('core.html#_predictcache.info', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._PredictCache.put': ('core.html#_predictcache.put', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._PredictCacheInfo': ('core.html#_predictcacheinfo', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._assign_columns': ('core.html#_assign_columns', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._cross_validation_worker': ( 'core.html#_cross_validation_worker',
+                                                                                       'neuralforecast/core.py'),
+                                     'neuralforecast.core._fingerprint': ('core.html#_fingerprint', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._fit_worker': ('core.html#_fit_worker', 'neuralforecast/core.py'),
                                      'neuralforecast.core._id_as_idx': ('core.html#_id_as_idx', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._index_to_numpy': ('core.html#_index_to_numpy', 'neuralforecast/core.py'),
                                      'neuralforecast.core._insample_times': ('core.html#_insample_times', 'neuralforecast/core.py'),
-                                     'neuralforecast.core._warn_id_as_idx': ('core.html#_warn_id_as_idx', 'neuralforecast/core.py')},
+                                     'neuralforecast.core._is_auto': ('core.html#_is_auto', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._process_pool': ('core.html#_process_pool', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._read_config': ('core.html#_read_config', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._read_legacy_config': ('core.html#_read_legacy_config', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._stack_columns': ('core.html#_stack_columns', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._stack_scalers': ('core.html#_stack_scalers', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._unique_model_names': ('core.html#_unique_model_names', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._warn_id_as_idx': ('core.html#_warn_id_as_idx', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._worker_init': ('core.html#_worker_init', 'neuralforecast/core.py')},
             'neuralforecast.losses.numpy': { 'neuralforecast.losses.numpy._divide_no_nan': ( 'losses.numpy.html#_divide_no_nan',
                                                                                              'neuralforecast/losses/numpy.py'),
                                              'neuralforecast.losses.numpy._metric_protections': ( 'losses.numpy.html#_metric_protections',
@@ -254,6 +317,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                     'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.BaseISQF.loss': ( 'losses.pytorch.html#baseisqf.loss',
                                                                                                 'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.BaseISQF.mean': ( 'losses.pytorch.html#baseisqf.mean',
+                                                                                                'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.BaseISQF.parameterize_qk': ( 'losses.pytorch.html#baseisqf.parameterize_qk',
                                                                                                            'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.BaseISQF.parameterize_spline': ( 'losses.pytorch.html#baseisqf.parameterize_spline',
@@ -286,6 +351,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                             'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.DistributionLoss.get_distribution': ( 'losses.pytorch.html#distributionloss.get_distribution',
                                                                                                                     'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.DistributionLoss.get_quantiles': ( 'losses.pytorch.html#distributionloss.get_quantiles',
+                                                                                                                 'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.DistributionLoss.sample': ( 'losses.pytorch.html#distributionloss.sample',
                                                                                                           'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.GMM': ( 'losses.pytorch.html#gmm',
@@ -294,8 +361,12 @@ d = { 'settings': { 'branch': 'main',
                                                                                                'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.GMM.__init__': ( 'losses.pytorch.html#gmm.__init__',
                                                                                                'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.GMM._sample_mixture': ( 'losses.pytorch.html#gmm._sample_mixture',
+                                                                                                      'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.GMM.domain_map': ( 'losses.pytorch.html#gmm.domain_map',
                                                                                                  'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.GMM.get_quantiles': ( 'losses.pytorch.html#gmm.get_quantiles',
+                                                                                                    'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.GMM.neglog_likelihood': ( 'losses.pytorch.html#gmm.neglog_likelihood',
                                                                                                         'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.GMM.sample': ( 'losses.pytorch.html#gmm.sample',
@@ -342,6 +413,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                 'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.ISQF.crps': ( 'losses.pytorch.html#isqf.crps',
                                                                                             'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.ISQF.mean': ( 'losses.pytorch.html#isqf.mean',
+                                                                                            'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.MAE': ( 'losses.pytorch.html#mae',
                                                                                       'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.MAE.__call__': ( 'losses.pytorch.html#mae.__call__',
@@ -382,8 +455,12 @@ d = { 'settings': { 'branch': 'main',
                                                                                                 'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.NBMM.__init__': ( 'losses.pytorch.html#nbmm.__init__',
                                                                                                 'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.NBMM._sample_mixture': ( 'losses.pytorch.html#nbmm._sample_mixture',
+                                                                                                       'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.NBMM.domain_map': ( 'losses.pytorch.html#nbmm.domain_map',
                                                                                                   'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.NBMM.get_quantiles': ( 'losses.pytorch.html#nbmm.get_quantiles',
+                                                                                                     'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.NBMM.neglog_likelihood': ( 'losses.pytorch.html#nbmm.neglog_likelihood',
                                                                                                          'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.NBMM.sample': ( 'losses.pytorch.html#nbmm.sample',
@@ -396,8 +473,12 @@ d = { 'settings': { 'branch': 'main',
                                                                                                'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.PMM.__init__': ( 'losses.pytorch.html#pmm.__init__',
                                                                                                'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.PMM._sample_mixture': ( 'losses.pytorch.html#pmm._sample_mixture',
+                                                                                                      'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.PMM.domain_map': ( 'losses.pytorch.html#pmm.domain_map',
                                                                                                  'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.PMM.get_quantiles': ( 'losses.pytorch.html#pmm.get_quantiles',
+                                                                                                    'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.PMM.neglog_likelihood': ( 'losses.pytorch.html#pmm.neglog_likelihood',
                                                                                                         'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.PMM.sample': ( 'losses.pytorch.html#pmm.sample',
@@ -458,6 +539,12 @@ d = { 'settings': { 'branch': 'main',
                                                                                                        'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.bernoulli_scale_decouple': ( 'losses.pytorch.html#bernoulli_scale_decouple',
                                                                                                            'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.bisect_count_quantiles': ( 'losses.pytorch.html#bisect_count_quantiles',
+                                                                                                         'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.bisect_quantiles': ( 'losses.pytorch.html#bisect_quantiles',
+                                                                                                   'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.chunked_sample_quantiles': ( 'losses.pytorch.html#chunked_sample_quantiles',
+                                                                                                           'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.est_alpha': ( 'losses.pytorch.html#est_alpha',
                                                                                             'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.est_beta': ( 'losses.pytorch.html#est_beta',
@@ -470,6 +557,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                       'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.level_to_outputs': ( 'losses.pytorch.html#level_to_outputs',
                                                                                                    'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.mixture_sample_quantiles': ( 'losses.pytorch.html#mixture_sample_quantiles',
+                                                                                                           'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.nbinomial_domain_map': ( 'losses.pytorch.html#nbinomial_domain_map',
                                                                                                        'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.nbinomial_scale_decouple': ( 'losses.pytorch.html#nbinomial_scale_decouple',
@@ -500,12 +589,16 @@ d = { 'settings': { 'branch': 'main',
                                                                                                      'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.student_scale_decouple': ( 'losses.pytorch.html#student_scale_decouple',
                                                                                                          'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.student_t_icdf': ( 'losses.pytorch.html#student_t_icdf',
+                                                                                                 'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.tweedie_domain_map': ( 'losses.pytorch.html#tweedie_domain_map',
                                                                                                      'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.tweedie_scale_decouple': ( 'losses.pytorch.html#tweedie_scale_decouple',
                                                                                                          'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.weighted_average': ( 'losses.pytorch.html#weighted_average',
-                                                                                                   'neuralforecast/losses/pytorch.py')},
+                                                                                                   'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.weighted_quantiles': ( 'losses.pytorch.html#weighted_quantiles',
+                                                                                                     'neuralforecast/losses/pytorch.py')},
             'neuralforecast.models.autoformer': { 'neuralforecast.models.autoformer.AutoCorrelation': ( 'models.autoformer.html#autocorrelation',
                                                                                                         'neuralforecast/models/autoformer.py'),
                                                   'neuralforecast.models.autoformer.AutoCorrelation.__init__': ( 'models.autoformer.html#autocorrelation.__init__',
@@ -616,18 +709,24 @@ d = { 'settings': { 'branch': 'main',
                                                                                                         'neuralforecast/models/dilated_rnn.py'),
                                                    'neuralforecast.models.dilated_rnn.DRNN._apply_cell': ( 'models.dilated_rnn.html#drnn._apply_cell',
                                                                                                            'neuralforecast/models/dilated_rnn.py'),
+                                                   'neuralforecast.models.dilated_rnn.DRNN._apply_stateful_cell': ( 'models.dilated_rnn.html#drnn._apply_stateful_cell',
+                                                                                                                    'neuralforecast/models/dilated_rnn.py'),
                                                    'neuralforecast.models.dilated_rnn.DRNN._pad_inputs': ( 'models.dilated_rnn.html#drnn._pad_inputs',
                                                                                                            'neuralforecast/models/dilated_rnn.py'),
                                                    'neuralforecast.models.dilated_rnn.DRNN._prepare_inputs': ( 'models.dilated_rnn.html#drnn._prepare_inputs',
                                                                                                                'neuralforecast/models/dilated_rnn.py'),
                                                    'neuralforecast.models.dilated_rnn.DRNN._split_outputs': ( 'models.dilated_rnn.html#drnn._split_outputs',
                                                                                                               'neuralforecast/models/dilated_rnn.py'),
+                                                   'neuralforecast.models.dilated_rnn.DRNN._stateful_layer': ( 'models.dilated_rnn.html#drnn._stateful_layer',
+                                                                                                               'neuralforecast/models/dilated_rnn.py'),
                                                    'neuralforecast.models.dilated_rnn.DRNN._unpad_outputs': ( 'models.dilated_rnn.html#drnn._unpad_outputs',
                                                                                                               'neuralforecast/models/dilated_rnn.py'),
                                                    'neuralforecast.models.dilated_rnn.DRNN.drnn_layer': ( 'models.dilated_rnn.html#drnn.drnn_layer',
                                                                                                           'neuralforecast/models/dilated_rnn.py'),
                                                    'neuralforecast.models.dilated_rnn.DRNN.forward': ( 'models.dilated_rnn.html#drnn.forward',
                                                                                                        'neuralforecast/models/dilated_rnn.py'),
+                                                   'neuralforecast.models.dilated_rnn.DRNN.forward_stateful': ( 'models.dilated_rnn.html#drnn.forward_stateful',
+                                                                                                                'neuralforecast/models/dilated_rnn.py'),
                                                    'neuralforecast.models.dilated_rnn.DilatedRNN': ( 'models.dilated_rnn.html#dilatedrnn',
                                                                                                      'neuralforecast/models/dilated_rnn.py'),
                                                    'neuralforecast.models.dilated_rnn.DilatedRNN.__init__': ( 'models.dilated_rnn.html#dilatedrnn.__init__',
@@ -1380,24 +1479,71 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                     'neuralforecast/models/vanillatransformer.py'),
                                                           'neuralforecast.models.vanillatransformer.VanillaTransformer.forward': ( 'models.vanillatransformer.html#vanillatransformer.forward',
                                                                                                                                    'neuralforecast/models/vanillatransformer.py')},
+            'neuralforecast.serve': { 'neuralforecast.serve.ForecastServer': ('serve.html#forecastserver', 'neuralforecast/serve.py'),
+                                      'neuralforecast.serve.ForecastServer.__enter__': ( 'serve.html#forecastserver.__enter__',
+                                                                                         'neuralforecast/serve.py'),
+                                      'neuralforecast.serve.ForecastServer.__exit__': ( 'serve.html#forecastserver.__exit__',
+                                                                                        'neuralforecast/serve.py'),
+                                      'neuralforecast.serve.ForecastServer.__init__': ( 'serve.html#forecastserver.__init__',
+                                                                                        'neuralforecast/serve.py'),
+                                      'neuralforecast.serve.ForecastServer._predict': ( 'serve.html#forecastserver._predict',
+                                                                                        'neuralforecast/serve.py'),
+                                      'neuralforecast.serve.ForecastServer._predict_batch': ( 'serve.html#forecastserver._predict_batch',
+                                                                                              'neuralforecast/serve.py'),
+                                      'neuralforecast.serve.ForecastServer._run': ( 'serve.html#forecastserver._run',
+                                                                                    'neuralforecast/serve.py'),
+                                      'neuralforecast.serve.ForecastServer.forecast': ( 'serve.html#forecastserver.forecast',
+                                                                                        'neuralforecast/serve.py'),
+                                      'neuralforecast.serve.ForecastServer.metrics': ( 'serve.html#forecastserver.metrics',
+                                                                                       'neuralforecast/serve.py'),
+                                      'neuralforecast.serve.ForecastServer.start': ( 'serve.html#forecastserver.start',
+                                                                                     'neuralforecast/serve.py'),
+                                      'neuralforecast.serve.ForecastServer.stop': ( 'serve.html#forecastserver.stop',
+                                                                                    'neuralforecast/serve.py'),
+                                      'neuralforecast.serve.ForecastServer.submit': ( 'serve.html#forecastserver.submit',
+                                                                                      'neuralforecast/serve.py'),
+                                      'neuralforecast.serve._ForecastHandler': ('serve.html#_forecasthandler', 'neuralforecast/serve.py'),
+                                      'neuralforecast.serve._ForecastHandler._send': ( 'serve.html#_forecasthandler._send',
+                                                                                       'neuralforecast/serve.py'),
+                                      'neuralforecast.serve._ForecastHandler.address_string': ( 'serve.html#_forecasthandler.address_string',
+                                                                                                'neuralforecast/serve.py'),
+                                      'neuralforecast.serve._ForecastHandler.do_GET': ( 'serve.html#_forecasthandler.do_get',
+                                                                                        'neuralforecast/serve.py'),
+                                      'neuralforecast.serve._ForecastHandler.do_POST': ( 'serve.html#_forecasthandler.do_post',
+                                                                                         'neuralforecast/serve.py'),
+                                      'neuralforecast.serve._ForecastHandler.log_message': ( 'serve.html#_forecasthandler.log_message',
+                                                                                             'neuralforecast/serve.py'),
+                                      'neuralforecast.serve._Request': ('serve.html#_request', 'neuralforecast/serve.py'),
+                                      'neuralforecast.serve._df_to_payload': ('serve.html#_df_to_payload', 'neuralforecast/serve.py'),
+                                      'neuralforecast.serve._payload_to_dfs': ('serve.html#_payload_to_dfs', 'neuralforecast/serve.py'),
+                                      'neuralforecast.serve.main': ('serve.html#main', 'neuralforecast/serve.py'),
+                                      'neuralforecast.serve.make_http_server': ('serve.html#make_http_server', 'neuralforecast/serve.py')},
             'neuralforecast.tsdataset': { 'neuralforecast.tsdataset.BaseTimeSeriesDataset': ( 'tsdataset.html#basetimeseriesdataset',
                                                                                               'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.BaseTimeSeriesDataset.__init__': ( 'tsdataset.html#basetimeseriesdataset.__init__',
                                                                                                        'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.BaseTimeSeriesDataset.__len__': ( 'tsdataset.html#basetimeseriesdataset.__len__',
                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.BaseTimeSeriesDataset._add_series_tensors': ( 'tsdataset.html#basetimeseriesdataset._add_series_tensors',
+                                                                                                                  'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.BaseTimeSeriesDataset._as_torch_copy': ( 'tsdataset.html#basetimeseriesdataset._as_torch_copy',
                                                                                                              'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.BaseTimeSeriesDataset._ensure_available_mask': ( 'tsdataset.html#basetimeseriesdataset._ensure_available_mask',
                                                                                                                      'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.BaseTimeSeriesDataset._extract_static_features': ( 'tsdataset.html#basetimeseriesdataset._extract_static_features',
                                                                                                                        'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.BaseTimeSeriesDataset.with_series_tensors': ( 'tsdataset.html#basetimeseriesdataset.with_series_tensors',
+                                                                                                                  'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset': ( 'tsdataset.html#localfilestimeseriesdataset',
                                                                                                     'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset.__getitem__': ( 'tsdataset.html#localfilestimeseriesdataset.__getitem__',
                                                                                                                 'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset.__init__': ( 'tsdataset.html#localfilestimeseriesdataset.__init__',
                                                                                                              'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset._read_row_groups': ( 'tsdataset.html#localfilestimeseriesdataset._read_row_groups',
+                                                                                                                     'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset._read_serie': ( 'tsdataset.html#localfilestimeseriesdataset._read_serie',
+                                                                                                                'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset.from_data_directories': ( 'tsdataset.html#localfilestimeseriesdataset.from_data_directories',
                                                                                                                           'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataModule': ( 'tsdataset.html#timeseriesdatamodule',
@@ -1420,12 +1566,24 @@ d = { 'settings': { 'branch': 'main',
                                                                                                    'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.__repr__': ( 'tsdataset.html#timeseriesdataset.__repr__',
                                                                                                    'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._append_idxs': ( 'tsdataset.html#timeseriesdataset._append_idxs',
+                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._get_batch': ( 'tsdataset.html#timeseriesdataset._get_batch',
+                                                                                                     'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._slice': ( 'tsdataset.html#timeseriesdataset._slice',
+                                                                                                 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._trim_mask': ( 'tsdataset.html#timeseriesdataset._trim_mask',
+                                                                                                     'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.align': ( 'tsdataset.html#timeseriesdataset.align',
                                                                                                 'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.append': ( 'tsdataset.html#timeseriesdataset.append',
                                                                                                  'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.from_df': ( 'tsdataset.html#timeseriesdataset.from_df',
                                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.load': ( 'tsdataset.html#timeseriesdataset.load',
+                                                                                               'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.save': ( 'tsdataset.html#timeseriesdataset.save',
+                                                                                               'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.trim_dataset': ( 'tsdataset.html#timeseriesdataset.trim_dataset',
                                                                                                        'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.update_dataset': ( 'tsdataset.html#timeseriesdataset.update_dataset',
@@ -1436,6 +1594,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                   'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesLoader._collate_fn': ( 'tsdataset.html#timeseriesloader._collate_fn',
                                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesLoader._ragged_collate_fn': ( 'tsdataset.html#timeseriesloader._ragged_collate_fn',
+                                                                                                            'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset._DistributedTimeSeriesDataModule': ( 'tsdataset.html#_distributedtimeseriesdatamodule',
                                                                                                          'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset._DistributedTimeSeriesDataModule.__init__': ( 'tsdataset.html#_distributedtimeseriesdatamodule.__init__',
@@ -1483,6 +1643,13 @@ d = { 'settings': { 'branch': 'main',
                                       'neuralforecast.utils.WeekOfYear': ('utils.html#weekofyear', 'neuralforecast/utils.py'),
                                       'neuralforecast.utils.WeekOfYear.__call__': ( 'utils.html#weekofyear.__call__',
                                                                                     'neuralforecast/utils.py'),
+                                      'neuralforecast.utils._add_conformal_intervals': ( 'utils.html#_add_conformal_intervals',
+                                                                                         'neuralforecast/utils.py'),
+                                      'neuralforecast.utils._conformal_intervals': ( 'utils.html#_conformal_intervals',
+                                                                                     'neuralforecast/utils.py'),
+                                      'neuralforecast.utils._quantile_positions': ( 'utils.html#_quantile_positions',
+                                                                                    'neuralforecast/utils.py'),
+                                      'neuralforecast.utils._scores_from_df': ('utils.html#_scores_from_df', 'neuralforecast/utils.py'),
                                       'neuralforecast.utils.add_conformal_distribution_intervals': ( 'utils.html#add_conformal_distribution_intervals',
                                                                                                      'neuralforecast/utils.py'),
                                       'neuralforecast.utils.add_conformal_error_intervals': ( 'utils.html#add_conformal_error_intervals',
@@ -179,6 +179,8 @@ class BaseAuto(pl.LightningModule):
 
         # Base Class attributes
         self.SAMPLING_TYPE = cls_model.SAMPLING_TYPE
+        # Stateful inference is only supported on the models themselves
+        self.STATEFUL_INFERENCE = False
 
     def __repr__(self):
         return type(self).__name__ if self.alias is None else self.alias
@@ -5,6 +5,8 @@ __all__ = ['DistributedConfig', 'BaseModel']
 
 # %% ../../nbs/common.base_model.ipynb 2
 import inspect
+import json
+import pickle
 import random
 import warnings
 from contextlib import contextmanager
@@ -12,11 +14,14 @@ from copy import deepcopy
 from dataclasses import dataclass
 
 import fsspec
+from fsspec.implementations.local import LocalFileSystem
 import numpy as np
+import safetensors.torch
 import torch
 import torch.nn as nn
 import pytorch_lightning as pl
 from pytorch_lightning.callbacks.early_stopping import EarlyStopping
+from safetensors import safe_open
 from neuralforecast.tsdataset import (
     TimeSeriesDataModule,
     BaseTimeSeriesDataset,
@@ -61,11 +66,73 @@ def _disable_torch_init():
         nn.init.xavier_uniform_ = xavier_uniform
         nn.init.xavier_normal_ = xavier_normal
 
+
+def _is_gpu_accelerator(accelerator):
+    from pytorch_lightning.accelerators.cuda import CUDAAccelerator
+
+    return (
+        accelerator == "gpu"
+        or isinstance(accelerator, CUDAAccelerator)
+        or (accelerator == "auto" and CUDAAccelerator.is_available())
+    )
+
+
+def _save_tensors(tensors, path, metadata=None):
+    """Write `tensors` and the `metadata`, a dict of strings, to `path` in the safetensors format.
+    The tensors that share their memory with a previous one, like the weights of a module that is used twice,
+    aren't written again, their names are stored in the metadata to restore them in `_load_tensors`.
+    """
+    unique, shared, names = {}, {}, {}
+    for name, tensor in tensors.items():
+        key = (tensor.data_ptr(), tensor.dtype, tuple(tensor.shape), tensor.stride())
+        if key in names:
+            shared[name] = names[key]
+        else:
+            names[key] = name
+            unique[name] = tensor.detach().cpu().contiguous()
+    metadata = {**(metadata or {}), "shared_tensors": json.dumps(shared)}
+    with fsspec.open(path, "wb") as f:
+        f.write(safetensors.torch.save(unique, metadata=metadata))
+
+
+def _load_tensors(path, mmap=True):
+    """Read a file written by `_save_tensors`, returns the tensors and the metadata.
+    With `mmap=True` and a local `path` the tensors are read from a memory map of the file.
+    """
+    fs, _, _ = fsspec.get_fs_token_paths(path)
+    if mmap and isinstance(fs, LocalFileSystem):
+        with safe_open(path, framework="pt") as f:
+            tensors = {name: f.get_tensor(name) for name in f.keys()}
+            metadata = f.metadata()
+    else:
+        with fsspec.open(path, "rb") as f:
+            data = f.read()
+        tensors = safetensors.torch.load(data)
+        # the metadata is in the JSON header, which follows its size as a little-endian uint64
+        header_size = int.from_bytes(data[:8], "little")
+        metadata = json.loads(data[8 : 8 + header_size])["__metadata__"]
+    for name, source in json.loads(metadata.pop("shared_tensors")).items():
+        tensors[name] = tensors[source]
+    return tensors, metadata
+
+
+def _is_json(value):
+    try:
+        return json.loads(json.dumps(value)) == value
+    except (TypeError, ValueError):
+        return False
+
+
+def _hparams_pickle_path(path):
+    """File with the hyperparameters of the model saved in `path` that are not JSON-serializable."""
+    return path[: -len(".safetensors")] + ".pkl"
+
 # %% ../../nbs/common.base_model.ipynb 5
 class BaseModel(pl.LightningModule):
     EXOGENOUS_FUTR = True
     EXOGENOUS_HIST = True
     EXOGENOUS_STAT = True
+    STATEFUL_INFERENCE = False
 
     def __init__(
         self,
@@ -185,9 +252,19 @@ class BaseModel(pl.LightningModule):
 
         self.trainer_kwargs = trainer_kwargs
 
+        # Warm start state, see `_warm_start`
+        self._warm_start_steps = None
+        self._optimizer_state = None
+
     def __repr__(self):
         return type(self).__name__ if self.alias is None else self.alias
 
+    def __getstate__(self):
+        state = super().__getstate__()
+        # The predict trainer is only reused within this process
+        state["_predict_trainer"] = None
+        return state
+
     def _check_exog(self, dataset):
         temporal_cols = set(dataset.temporal_cols.tolist())
         static_cols = set(
@@ -276,15 +353,6 @@ class BaseModel(pl.LightningModule):
             model.__dict__.pop("_trainer", None)
             return model
 
-        def is_gpu_accelerator(accelerator):
-            from pytorch_lightning.accelerators.cuda import CUDAAccelerator
-
-            return (
-                accelerator == "gpu"
-                or isinstance(accelerator, CUDAAccelerator)
-                or (accelerator == "auto" and CUDAAccelerator.is_available())
-            )
-
         local_mode = distributed_config.num_nodes == 1
         if local_mode:
             num_tasks = 1
@@ -293,7 +361,7 @@ class BaseModel(pl.LightningModule):
             num_tasks = distributed_config.num_nodes * distributed_config.devices
             num_proc_per_task = 1  # number of GPUs per task
         num_proc = num_tasks * num_proc_per_task
-        use_gpu = is_gpu_accelerator(self.trainer_kwargs["accelerator"])
+        use_gpu = _is_gpu_accelerator(self.trainer_kwargs["accelerator"])
         model = TorchDistributor(
             num_processes=num_proc,
             local_mode=local_mode,
@@ -311,7 +379,7 @@ class BaseModel(pl.LightningModule):
         )
         return model
 
-    def _fit(
+    def _setup_fit(
         self,
         dataset,
         batch_size,
@@ -320,13 +388,14 @@ class BaseModel(pl.LightningModule):
         test_size=0,
         random_seed=None,
         shuffle_train=True,
-        distributed_config=None,
     ):
+        # Checks the dataset, sets the validation schedule and returns the datamodule
         self._check_exog(dataset)
         self._restart_seed(random_seed)
 
         self.val_size = val_size
         self.test_size = test_size
+        self._train_max_size = getattr(dataset, "max_size", 0) - val_size - test_size
         is_local = isinstance(dataset, BaseTimeSeriesDataset)
         if is_local:
             datamodule_constructor = TimeSeriesDataModule
@@ -334,7 +403,7 @@ class BaseModel(pl.LightningModule):
             datamodule_constructor = _DistributedTimeSeriesDataModule
 
         dataloader_kwargs = (
-            self.dataloader_kwargs if self.dataloader_kwargs is not None else {}
+            {**self.dataloader_kwargs} if self.dataloader_kwargs is not None else {}
         )
 
         if self.num_workers_loader != 0:  # value is not at its default
@@ -346,6 +415,12 @@ class BaseModel(pl.LightningModule):
             )
             dataloader_kwargs["num_workers"] = self.num_workers_loader
 
+        # Keep the workers and their prefetched batches alive across epochs and validation checks
+        if dataloader_kwargs.get("num_workers", 0) > 0:
+            dataloader_kwargs.setdefault("persistent_workers", True)
+        if _is_gpu_accelerator(self.trainer_kwargs.get("accelerator", None)):
+            dataloader_kwargs.setdefault("pin_memory", True)
+
         datamodule = datamodule_constructor(
             dataset=dataset,
             batch_size=batch_size,
@@ -355,6 +430,11 @@ class BaseModel(pl.LightningModule):
             **dataloader_kwargs,
         )
 
+        if self._optimizer_state is not None:
+            # Continue the previous fit with the reduced step budget
+            self.max_steps = self._warm_start_steps
+            self.trainer_kwargs["max_steps"] = self._warm_start_steps
+
         if self.val_check_steps > self.max_steps:
             warnings.warn(
                 "val_check_steps is greater than max_steps, "
@@ -363,12 +443,35 @@ class BaseModel(pl.LightningModule):
         val_check_interval = min(self.val_check_steps, self.max_steps)
         self.trainer_kwargs["val_check_interval"] = int(val_check_interval)
         self.trainer_kwargs["check_val_every_n_epoch"] = None
+        return datamodule
 
-        if is_local:
+    def _fit(
+        self,
+        dataset,
+        batch_size,
+        valid_batch_size=1024,
+        val_size=0,
+        test_size=0,
+        random_seed=None,
+        shuffle_train=True,
+        distributed_config=None,
+    ):
+        datamodule = self._setup_fit(
+            dataset=dataset,
+            batch_size=batch_size,
+            valid_batch_size=valid_batch_size,
+            val_size=val_size,
+            test_size=test_size,
+            random_seed=random_seed,
+            shuffle_train=shuffle_train,
+        )
+        if isinstance(dataset, BaseTimeSeriesDataset):
             model = self
             trainer = pl.Trainer(**model.trainer_kwargs)
             trainer.fit(model, datamodule=datamodule)
             model.metrics = trainer.callback_metrics
+            if model._warm_start_steps is not None:
+                model._optimizer_state = trainer.optimizers[0].state_dict()
             model.__dict__.pop("_trainer", None)
         else:
             model = self._fit_distributed(
@@ -379,6 +482,63 @@ class BaseModel(pl.LightningModule):
             )
         return model
 
+    @contextmanager
+    def _warm_start(self, max_steps):
+        """Within the context, every fit after the first one continues from the weights
+        and optimizer state of the previous fit, training for `max_steps` steps."""
+        init_max_steps = self.max_steps
+        self._warm_start_steps = max_steps
+        try:
+            yield
+        finally:
+            self.max_steps = init_max_steps
+            self.trainer_kwargs["max_steps"] = init_max_steps
+            self._warm_start_steps = None
+            self._optimizer_state = None
+
+    def _get_predict_trainer(self):
+        # Protect when case of multiple gpu. PL does not support return preds with multiple gpu.
+        pred_trainer_kwargs = self.trainer_kwargs.copy()
+        if (pred_trainer_kwargs.get("accelerator", None) == "gpu") and (
+            torch.cuda.device_count() > 1
+        ):
+            pred_trainer_kwargs["devices"] = [0]
+
+        # Reuse the trainer of previous predictions, building one sets up the accelerator,
+        # callbacks and loggers on every call
+        cached = getattr(self, "_predict_trainer", None)
+        if cached is None or cached[0] != pred_trainer_kwargs:
+            self._predict_trainer = (
+                pred_trainer_kwargs,
+                pl.Trainer(**pred_trainer_kwargs),
+            )
+        return self._predict_trainer[1]
+
+    def _predict_loop(self, datamodule, engine="lightning"):
+        """Returns the `predict_step` outputs for each batch of the datamodule's predict dataloader."""
+        if engine == "lightning":
+            trainer = self._get_predict_trainer()
+            return trainer.predict(self, datamodule=datamodule)
+        if engine != "torch":
+            raise ValueError(f"engine must be 'lightning' or 'torch', got {engine}")
+
+        # Plain forward passes on the parameters' device, without trainer, callbacks or loggers
+        device = next(self.parameters()).device
+        training = self.training
+        self.eval()
+        fcsts = []
+        try:
+            with torch.inference_mode():
+                for batch_idx, batch in enumerate(datamodule.predict_dataloader()):
+                    batch = {
+                        k: v.to(device) if isinstance(v, torch.Tensor) else v
+                        for k, v in batch.items()
+                    }
+                    fcsts.append(self.predict_step(batch, batch_idx).cpu())
+        finally:
+            self.train(training)
+        return fcsts
+
     def on_fit_start(self):
         torch.manual_seed(self.random_seed)
         np.random.seed(self.random_seed)
@@ -402,6 +562,13 @@ class BaseModel(pl.LightningModule):
                 )
             optimizer = torch.optim.Adam(self.parameters(), lr=self.learning_rate)
 
+        if self._optimizer_state is not None:
+            # Resume the optimizer moments, the learning rate schedule restarts with each fit
+            lrs = [group["lr"] for group in optimizer.param_groups]
+            optimizer.load_state_dict(self._optimizer_state)
+            for group, lr in zip(optimizer.param_groups, lrs):
+                group["lr"] = lr
+
         lr_scheduler = {"frequency": 1, "interval": "step"}
         if self.lr_scheduler:
             lr_scheduler_signature = inspect.signature(self.lr_scheduler)
@@ -446,6 +613,31 @@ class BaseModel(pl.LightningModule):
         self.validation_step_outputs.clear()  # free memory (compute `avg_loss` per epoch)
 
     def save(self, path):
+        """Save the hyperparameters and weights of the model.
+        If `path` ends with `.safetensors` the weights are written in the safetensors format,
+        which `load` can memory-map, along with the JSON-serializable hyperparameters. The rest of them,
+        such as the losses, are pickled to a file with the same name and the `.pkl` extension.
+        Otherwise a torch checkpoint is written."""
+        if path.endswith(".safetensors"):
+            hparams = dict(self.hparams)
+            pickled = {
+                name: value for name, value in hparams.items() if not _is_json(value)
+            }
+            metadata = {
+                "hyper_parameters": json.dumps(
+                    {
+                        name: value
+                        for name, value in hparams.items()
+                        if name not in pickled
+                    }
+                ),
+                "pickled_hyper_parameters": json.dumps(sorted(pickled)),
+            }
+            _save_tensors(self.state_dict(), path, metadata=metadata)
+            if pickled:
+                with fsspec.open(_hparams_pickle_path(path), "wb") as f:
+                    pickle.dump(pickled, f)
+            return
         with fsspec.open(path, "wb") as f:
             torch.save(
                 {"hyper_parameters": self.hparams, "state_dict": self.state_dict()},
@@ -453,9 +645,29 @@ class BaseModel(pl.LightningModule):
             )
 
     @classmethod
-    def load(cls, path, **kwargs):
-        with fsspec.open(path, "rb") as f:
-            content = torch.load(f, **kwargs)
+    def load(cls, path, mmap=True, allow_pickle=False, **kwargs):
+        """Load a model saved with `save`. `mmap` only applies to local `.safetensors` files,
+        `kwargs` are passed to `torch.load` for checkpoints.
+        The hyperparameters of a `.safetensors` file that are not JSON-serializable are read from
+        its `.pkl` file only with `allow_pickle=True`, since unpickling an untrusted file can run arbitrary code.
+        """
+        if path.endswith(".safetensors"):
+            state_dict, metadata = _load_tensors(path, mmap=mmap)
+            hparams = json.loads(metadata["hyper_parameters"])
+            pickled = json.loads(metadata["pickled_hyper_parameters"])
+            if pickled:
+                pickle_path = _hparams_pickle_path(path)
+                if not allow_pickle:
+                    raise ValueError(
+                        f"The hyperparameters {pickled} are stored in the pickle file {pickle_path}. "
+                        "Set `allow_pickle=True` to load them if you trust its source."
+                    )
+                with fsspec.open(pickle_path, "rb") as f:
+                    hparams.update(pickle.load(f))
+            content = {"hyper_parameters": hparams, "state_dict": state_dict}
+        else:
+            with fsspec.open(path, "rb") as f:
+                content = torch.load(f, **kwargs)
         with _disable_torch_init():
             model = cls(**content["hyper_parameters"])
         if "assign" in inspect.signature(model.load_state_dict).parameters:
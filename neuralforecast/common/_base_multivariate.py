@@ -563,6 +563,7 @@ class BaseMultivariate(BaseModel):
         test_size=None,
         step_size=1,
         random_seed=None,
+        engine="lightning",
         **data_module_kwargs,
     ):
         """Predict.
@@ -573,6 +574,7 @@ class BaseMultivariate(BaseModel):
         `dataset`: NeuralForecast's `TimeSeriesDataset`, see [documentation](https://nixtla.github.io/neuralforecast/tsdataset.html).<br>
         `test_size`: int=None, test size for temporal cross-validation.<br>
         `step_size`: int=1, Step size between each window.<br>
+        `engine`: str='lightning', 'lightning' runs PL's `Trainer`, 'torch' runs plain forward passes under `torch.inference_mode` on the model's device, without trainer setup.<br>
         `**data_module_kwargs`: PL's TimeSeriesDataModule args, see [documentation](https://pytorch-lightning.readthedocs.io/en/1.6.1/extensions/datamodules.html#using-a-datamodule).
         """
         self._check_exog(dataset)
@@ -588,15 +590,7 @@ class BaseMultivariate(BaseModel):
             **data_module_kwargs,
         )
 
-        # Protect when case of multiple gpu. PL does not support return preds with multiple gpu.
-        pred_trainer_kwargs = self.trainer_kwargs.copy()
-        if (pred_trainer_kwargs.get("accelerator", None) == "gpu") and (
-            torch.cuda.device_count() > 1
-        ):
-            pred_trainer_kwargs["devices"] = [0]
-
-        trainer = pl.Trainer(**pred_trainer_kwargs)
-        fcsts = trainer.predict(self, datamodule=datamodule)
+        fcsts = self._predict_loop(datamodule, engine=engine)
         fcsts = torch.vstack(fcsts).numpy()
 
         fcsts = np.transpose(fcsts, (2, 0, 1))
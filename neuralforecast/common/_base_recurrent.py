@@ -5,6 +5,7 @@ __all__ = ['BaseRecurrent']
 
 # %% ../../nbs/common.base_recurrent.ipynb 6
 import numpy as np
+import pandas as pd
 import torch
 import torch.nn as nn
 import pytorch_lightning as pl
@@ -12,7 +13,8 @@ import neuralforecast.losses.pytorch as losses
 
 from ._base_model import BaseModel
 from ._scalers import TemporalNorm
-from ..tsdataset import TimeSeriesDataModule
+from ..tsdataset import BaseTimeSeriesDataset, TimeSeriesDataModule
+from ..tsdataset import TimeSeriesDataset, TimeSeriesLoader
 from ..utils import get_indexer_raise_missing
 
 # %% ../../nbs/common.base_recurrent.ipynb 7
@@ -41,6 +43,7 @@ class BaseRecurrent(BaseModel):
         batch_size,
         valid_batch_size,
         scaler_type="robust",
+        precompute_scaler_stats=False,
         num_lr_decays=0,
         early_stop_patience_steps=-1,
         futr_exog_list=None,
@@ -112,6 +115,11 @@ class BaseRecurrent(BaseModel):
             dim=-1,  # Time dimension is -1.
             num_features=1 + len(self.hist_exog_list) + len(self.futr_exog_list),
         )
+        self.precompute_scaler_stats = precompute_scaler_stats
+
+        # Encoder states and scaler statistics of each serie kept by stateful inference
+        self.encoder_states = None
+        self._predict_encoder_states = None
 
         # Fit arguments
         self.val_size = 0
@@ -125,7 +133,7 @@ class BaseRecurrent(BaseModel):
         self.validation_step_outputs = []
         self.alias = alias
 
-    def _normalization(self, batch, val_size=0, test_size=0):
+    def _scaler_inputs(self, batch, val_size=0, test_size=0):
         temporal = batch["temporal"]  # B, C, T
         temporal_cols = batch["temporal_cols"].copy()
         y_idx = batch["y_idx"]
@@ -144,11 +152,26 @@ class BaseRecurrent(BaseModel):
             cutoff = val_size + test_size
             temporal_mask[:, -cutoff:] = 0
 
-        # Normalize. self.scaler stores the shift and scale for inverse transform
         temporal_mask = temporal_mask.unsqueeze(
             1
         )  # Add channel dimension for scaler.transform.
-        temporal_data = self.scaler.transform(x=temporal_data, mask=temporal_mask)
+        return temporal_idxs, temporal_data, temporal_mask
+
+    def _normalization(self, batch, val_size=0, test_size=0):
+        temporal = batch["temporal"]
+        temporal_idxs, temporal_data, temporal_mask = self._scaler_inputs(
+            batch, val_size=val_size, test_size=test_size
+        )
+
+        # Normalize. self.scaler stores the shift and scale for inverse transform
+        x_shift, x_scale = None, None
+        if "scaler_stats" in batch:
+            # Per-serie statistics precomputed once per dataset, see `_add_scaler_stats`
+            x_shift = batch["scaler_stats"][:, 0, :, None]
+            x_scale = batch["scaler_stats"][:, 1, :, None]
+        temporal_data = self.scaler.transform(
+            x=temporal_data, mask=temporal_mask, x_shift=x_shift, x_scale=x_scale
+        )
 
         # Replace values in windows dict
         temporal[:, temporal_idxs, :] = temporal_data
@@ -156,6 +179,89 @@ class BaseRecurrent(BaseModel):
 
         return batch
 
+    @torch.no_grad()
+    def _compute_scaler_stats(self, dataset, val_size=0, test_size=0):
+        # Scaler statistics [n_groups, 2, C] of each serie, with the same cutoff as `_normalization`
+        loader = TimeSeriesLoader(
+            dataset, batch_size=self.valid_batch_size, shuffle=False
+        )
+        scaler_stats = []
+        for batch in loader:
+            _, temporal_data, temporal_mask = self._scaler_inputs(
+                batch, val_size=val_size, test_size=test_size
+            )
+            x_shift, x_scale = self.scaler.compute_statistics(
+                x=temporal_data,
+                mask=temporal_mask,
+                dim=self.scaler.dim,
+                eps=self.scaler.eps,
+            )
+            scaler_stats.append(torch.stack([x_shift[..., 0], x_scale[..., 0]], dim=1))
+        return torch.cat(scaler_stats)
+
+    def _add_scaler_stats(self, dataset, val_size=0, test_size=0):
+        # Computes the scaler statistics of each serie once instead of on every step's batch
+        if not self.precompute_scaler_stats or not isinstance(
+            dataset, BaseTimeSeriesDataset
+        ):
+            return dataset
+        scaler_stats = self._compute_scaler_stats(
+            dataset, val_size=val_size, test_size=test_size
+        )
+        return dataset.with_series_tensors(scaler_stats=scaler_stats)
+
+    def _add_encoder_states(self, dataset, state_ids):
+        # Attaches the stored encoder state and scaler statistics of each serie for
+        # stateful inference. The series without one are encoded from their whole history
+        if not self.STATEFUL_INFERENCE:
+            raise Exception(
+                f"{type(self).__name__} does not support stateful inference"
+            )
+        if self.test_size not in (0, self.h):
+            raise Exception(
+                "Stateful inference forecasts the last window of each serie, test_size must be 0 or h"
+            )
+        if not isinstance(dataset, TimeSeriesDataset):
+            raise Exception("Stateful inference requires a TimeSeriesDataset")
+        state_ids = pd.Index(np.asarray(state_ids))
+        series_tensors = dict(
+            scaler_stats=self._compute_scaler_stats(dataset, test_size=self.test_size),
+            series_size=torch.from_numpy(np.diff(dataset.indptr)),
+            has_state=torch.zeros(len(state_ids), dtype=torch.bool),
+        )
+        if self.encoder_states is not None:
+            rows = self.encoder_states["ids"].get_indexer(state_ids)
+            has_state = torch.from_numpy(rows >= 0)
+            rows = torch.from_numpy(rows[rows >= 0])
+            encoder_state = self.encoder_states["encoder_state"]
+            series_tensors["encoder_state"] = encoder_state.new_zeros(
+                len(state_ids), *encoder_state.shape[1:]
+            )
+            series_tensors["encoder_state"][has_state] = encoder_state[rows]
+            series_tensors["scaler_stats"][has_state] = self.encoder_states[
+                "scaler_stats"
+            ][rows]
+            series_tensors["has_state"] = has_state
+        return dataset.with_series_tensors(**series_tensors)
+
+    def _store_encoder_states(self, dataset, state_ids, encoder_state):
+        # Keeps the final encoder state and the scaler statistics of each serie
+        # for the next stateful call, replacing their previous ones
+        state_ids = pd.Index(np.asarray(state_ids))
+        scaler_stats = dataset.series_tensors["scaler_stats"]
+        if self.encoder_states is not None:
+            keep = torch.from_numpy(~self.encoder_states["ids"].isin(state_ids))
+            state_ids = self.encoder_states["ids"][keep.numpy()].append(state_ids)
+            encoder_state = torch.cat(
+                [self.encoder_states["encoder_state"][keep], encoder_state]
+            )
+            scaler_stats = torch.cat(
+                [self.encoder_states["scaler_stats"][keep], scaler_stats]
+            )
+        self.encoder_states = dict(
+            ids=state_ids, encoder_state=encoder_state, scaler_stats=scaler_stats
+        )
+
     def _inv_normalization(self, y_hat, temporal_cols, y_idx):
         # Receives window predictions [B, seq_len, H, output]
         # Broadcasts outputs and inverts normalization
@@ -413,7 +519,7 @@ class BaseRecurrent(BaseModel):
             distr_args = self.loss.scale_decouple(
                 output=output, loc=y_loc, scale=y_scale
             )
-            _, sample_mean, quants = self.loss.sample(distr_args=distr_args)
+            sample_mean, quants = self.loss.get_quantiles(distr_args=distr_args)
 
             if str(type(self.valid_loss)) in [
                 "<class 'neuralforecast.losses.pytorch.sCRPS'>",
@@ -457,6 +563,61 @@ class BaseRecurrent(BaseModel):
         self.validation_step_outputs.append(valid_loss)
         return valid_loss
 
+    def _stateful_forward(self, windows_batch, batch):
+        # Forecasts the last window of each serie. The series with a stored state advance
+        # from it only over the windows of their new observations, the others are encoded
+        # from their whole history. Series advancing over as many windows share a forward
+        seq_len = windows_batch["insample_y"].shape[1]
+        n_future = (
+            0 if (self.test_size == 0 and len(self.futr_exog_list) == 0) else self.h
+        )
+        n_windows = batch["series_size"] - n_future
+        has_state = batch["has_state"]
+        if (n_windows[has_state] < 1).any():
+            raise Exception(
+                "Stateful inference requires new observations for the series with a stored state"
+            )
+        n_windows = torch.where(has_state, n_windows.clamp(max=seq_len), seq_len)
+
+        output, encoder_state = None, None
+        for n, from_state in set(zip(n_windows.tolist(), has_state.tolist())):
+            rows = (n_windows == n) & (has_state == from_state)
+            group = dict(
+                insample_y=windows_batch["insample_y"][rows, -n:],
+                insample_mask=windows_batch["insample_mask"][rows, -n:],
+                futr_exog=(
+                    None
+                    if windows_batch["futr_exog"] is None
+                    else windows_batch["futr_exog"][rows, :, -n:]
+                ),
+                hist_exog=(
+                    None
+                    if windows_batch["hist_exog"] is None
+                    else windows_batch["hist_exog"][rows, :, -n:]
+                ),
+                stat_exog=(
+                    None
+                    if windows_batch["stat_exog"] is None
+                    else windows_batch["stat_exog"][rows]
+                ),
+                encoder_state=batch["encoder_state"][rows] if from_state else None,
+            )
+            group_output = self(group)
+            group_output = (
+                group_output if isinstance(group_output, tuple) else (group_output,)
+            )
+            if output is None:
+                output = [o.new_zeros(len(rows), 1, *o.shape[2:]) for o in group_output]
+                encoder_state = group["encoder_state"].new_zeros(
+                    len(rows), *group["encoder_state"].shape[1:]
+                )
+            for o, group_o in zip(output, group_output):
+                o[rows] = group_o[:, -1:]
+            encoder_state[rows] = group["encoder_state"]
+
+        output = tuple(output) if self.loss.is_distribution_output else output[0]
+        return output, encoder_state
+
     def predict_step(self, batch, batch_idx):
         # Create and normalize windows [Ws, L+H, C]
         batch = self._normalization(batch, val_size=0, test_size=self.test_size)
@@ -477,7 +638,11 @@ class BaseRecurrent(BaseModel):
         )  # [B, S]
 
         # Model Predictions
-        output = self(windows_batch)  # tuple([B, seq_len, H], ...)
+        if "has_state" in batch:
+            output, encoder_state = self._stateful_forward(windows_batch, batch)
+            self._predict_encoder_states.append(encoder_state.cpu())
+        else:
+            output = self(windows_batch)  # tuple([B, seq_len, H], ...)
         if self.loss.is_distribution_output:
             _, y_loc, y_scale = self._inv_normalization(
                 y_hat=output[0], temporal_cols=batch["temporal_cols"], y_idx=y_idx
@@ -491,7 +656,7 @@ class BaseRecurrent(BaseModel):
             distr_args = self.loss.scale_decouple(
                 output=output, loc=y_loc, scale=y_scale
             )
-            _, sample_mean, quants = self.loss.sample(distr_args=distr_args)
+            sample_mean, quants = self.loss.get_quantiles(distr_args=distr_args)
             y_hat = torch.concat((sample_mean, quants), axis=2)
             y_hat = y_hat.view(B, T, H, -1)
 
@@ -534,6 +699,9 @@ class BaseRecurrent(BaseModel):
         `test_size`: int, test size for temporal cross-validation.<br>
         `random_seed`: int=None, random_seed for pytorch initializer and numpy generators, overwrites model.__init__'s.<br>
         """
+        dataset = self._add_scaler_stats(
+            dataset, val_size=val_size, test_size=test_size
+        )
         return self._fit(
             dataset=dataset,
             batch_size=self.batch_size,
@@ -544,7 +712,15 @@ class BaseRecurrent(BaseModel):
             distributed_config=distributed_config,
         )
 
-    def predict(self, dataset, step_size=1, random_seed=None, **data_module_kwargs):
+    def predict(
+        self,
+        dataset,
+        step_size=1,
+        random_seed=None,
+        engine="lightning",
+        state_ids=None,
+        **data_module_kwargs,
+    ):
         """Predict.
 
         Neural network prediction with PL's `Trainer` execution of `predict_step`.
@@ -553,6 +729,8 @@ class BaseRecurrent(BaseModel):
         `dataset`: NeuralForecast's `TimeSeriesDataset`, see [documentation](https://nixtla.github.io/neuralforecast/tsdataset.html).<br>
         `step_size`: int=1, Step size between each window.<br>
         `random_seed`: int=None, random_seed for pytorch initializer and numpy generators, overwrites model.__init__'s.<br>
+        `engine`: str='lightning', 'lightning' runs PL's `Trainer`, 'torch' runs plain forward passes under `torch.inference_mode` on the model's device, without trainer setup.<br>
+        `state_ids`: sequence, optional ids of the series of `dataset` for stateful inference. The encoder of each serie with a stored state in `encoder_states` starts from it and only advances over its observations in `dataset`, with its stored scaler statistics. The final states are stored under these ids for the next call.<br>
         `**data_module_kwargs`: PL's TimeSeriesDataModule args, see [documentation](https://pytorch-lightning.readthedocs.io/en/1.6.1/extensions/datamodules.html#using-a-datamodule).
         """
         self._check_exog(dataset)
@@ -563,22 +741,23 @@ class BaseRecurrent(BaseModel):
             raise Exception("Recurrent models do not support step_size > 1")
 
         # fcsts (window, batch, h)
-        # Protect when case of multiple gpu. PL does not support return preds with multiple gpu.
-        pred_trainer_kwargs = self.trainer_kwargs.copy()
-        if (pred_trainer_kwargs.get("accelerator", None) == "gpu") and (
-            torch.cuda.device_count() > 1
-        ):
-            pred_trainer_kwargs["devices"] = [0]
-
-        trainer = pl.Trainer(**pred_trainer_kwargs)
-
+        if state_ids is not None:
+            dataset = self._add_encoder_states(dataset, state_ids)
+            self._predict_encoder_states = []
+        else:
+            dataset = self._add_scaler_stats(dataset, test_size=self.test_size)
         datamodule = TimeSeriesDataModule(
             dataset=dataset,
             valid_batch_size=self.valid_batch_size,
             num_workers=self.num_workers_loader,
             **data_module_kwargs,
         )
-        fcsts = trainer.predict(self, datamodule=datamodule)
+        fcsts = self._predict_loop(datamodule, engine=engine)
+        if state_ids is not None:
+            self._store_encoder_states(
+                dataset, state_ids, torch.cat(self._predict_encoder_states)
+            )
+            self._predict_encoder_states = None
         if self.test_size > 0:
             # Remove warmup windows (from train and validation)
             # [N,T,H,output], avoid indexing last dim for univariate output compatibility
@@ -124,6 +124,7 @@ class BaseWindows(BaseModel):
         # Fit arguments
         self.val_size = 0
         self.test_size = 0
+        self._train_max_size = 0
 
         # Model state
         self.decompose_forecast = False
@@ -147,58 +148,80 @@ class BaseWindows(BaseModel):
                 cutoff = -self.val_size - self.test_size
                 temporal = temporal[:, :, :cutoff]
 
-            temporal = self.padder_train(temporal)
-            if temporal.shape[-1] < window_size:
+            # Windows are sampled lazily: their availability is computed from the
+            # available_mask alone and only the sampled windows are gathered,
+            # so the [B * Ws, L+H, C] tensor of all windows is never built.
+            left_padding, right_padding = self.padder_train.padding
+            # Ragged batches are only padded to their longest serie, left-pad
+            # the ones made of short series so that each serie has a window
+            min_size = self.input_size + min(self.h, 1) - left_padding
+            if temporal.shape[-1] < min_size <= self._train_max_size:
+                temporal = nn.functional.pad(
+                    temporal, (min_size - temporal.shape[-1], 0)
+                )
+            padded_size = temporal.shape[-1] + left_padding + right_padding
+            if padded_size < window_size:
                 raise Exception(
                     "Time series is too short for training, consider setting a smaller input size or set start_padding_enabled=True"
                 )
-            windows = temporal.unfold(
-                dimension=-1, size=window_size, step=self.step_size
-            )
-
-            # [B, C, Ws, L+H] 0, 1, 2, 3
-            # -> [B * Ws, L+H, C] 0, 2, 3, 1
-            windows_per_serie = windows.shape[2]
-            windows = windows.permute(0, 2, 3, 1).contiguous()
-            windows = windows.reshape(-1, window_size, len(temporal_cols))
+            windows_per_serie = (padded_size - window_size) // self.step_size + 1
 
             # Sample and Available conditions
+            # [B, T + padding] -> [B, Ws] through cumulative sums of the mask
             available_idx = temporal_cols.get_loc("available_mask")
-            available_condition = windows[:, : self.input_size, available_idx]
-            available_condition = torch.sum(available_condition, axis=1)
+            available_mask = self.padder_train(temporal[:, available_idx, :])
+            cumsum_mask = nn.functional.pad(torch.cumsum(available_mask, dim=1), (1, 0))
+            window_starts = (
+                torch.arange(windows_per_serie, device=temporal.device) * self.step_size
+            )
+            insample_end = window_starts + self.input_size
+            available_condition = (
+                cumsum_mask[:, insample_end] - cumsum_mask[:, window_starts]
+            )
             final_condition = available_condition > 0
             if self.h > 0:
-                sample_condition = windows[:, self.input_size :, available_idx]
-                sample_condition = torch.sum(sample_condition, axis=1)
-                final_condition = (sample_condition > 0) & (available_condition > 0)
-            windows = windows[final_condition]
-
-            # Parse Static data to match windows
-            # [B, S_in] -> [B, Ws, S_in] -> [B*Ws, S_in]
-            static = batch.get("static", None)
-            static_cols = batch.get("static_cols", None)
-            if static is not None:
-                static = torch.repeat_interleave(
-                    static, repeats=windows_per_serie, dim=0
+                sample_condition = (
+                    cumsum_mask[:, insample_end + self.h] - cumsum_mask[:, insample_end]
                 )
-                static = static[final_condition]
+                final_condition = (sample_condition > 0) & (available_condition > 0)
+            final_condition = final_condition.flatten()
 
             # Protection of empty windows
             if final_condition.sum() == 0:
                 raise Exception("No windows available for training")
 
             # Sample windows
-            n_windows = len(windows)
+            # w_idxs index the flattened [B * Ws] windows
+            w_idxs = torch.nonzero(final_condition).flatten().cpu().numpy()
+            n_windows = len(w_idxs)
             if self.windows_batch_size is not None:
-                w_idxs = np.random.choice(
+                sample_idxs = np.random.choice(
                     n_windows,
                     size=self.windows_batch_size,
                     replace=(n_windows < self.windows_batch_size),
                 )
-                windows = windows[w_idxs]
+                w_idxs = w_idxs[sample_idxs]
+
+            # Gather sampled windows, positions that fall in the padding are zeros
+            # [B, C, T] -> [windows_batch_size, L+H, C]
+            serie_idxs, window_idxs = np.divmod(w_idxs, windows_per_serie)
+            serie_idxs = torch.as_tensor(serie_idxs, device=temporal.device)
+            window_idxs = torch.as_tensor(window_idxs, device=temporal.device)
+            time_idxs = (window_idxs * self.step_size - left_padding).unsqueeze(
+                1
+            ) + torch.arange(window_size, device=temporal.device)
+            in_series = (time_idxs >= 0) & (time_idxs < temporal.shape[-1])
+            time_idxs = time_idxs.clamp(0, temporal.shape[-1] - 1)
+            windows = temporal[serie_idxs.unsqueeze(1), :, time_idxs]
+            windows = torch.where(
+                in_series.unsqueeze(-1), windows, torch.zeros_like(windows)
+            )
 
-                if static is not None:
-                    static = static[w_idxs]
+            # Parse Static data to match windows
+            static = batch.get("static", None)
+            static_cols = batch.get("static_cols", None)
+            if static is not None:
+                static = static[serie_idxs.to(static.device)]
 
             # think about interaction available * sample mask
             # [B, C, Ws, L+H]
@@ -211,74 +234,87 @@ class BaseWindows(BaseModel):
             return windows_batch
 
         elif step in ["predict", "val"]:
+            windows = self._create_inference_windows(batch, step=step)
+            return self._gather_windows(batch, windows, w_idxs=w_idxs)
+        else:
+            raise ValueError(f"Unknown step {step}")
 
-            if step == "predict":
-                initial_input = temporal.shape[-1] - self.test_size
-                if (
-                    initial_input <= self.input_size
-                ):  # There is not enough data to predict first timestamp
-                    padder_left = nn.ConstantPad1d(
-                        padding=(self.input_size - initial_input, 0), value=0.0
-                    )
-                    temporal = padder_left(temporal)
-                predict_step_size = self.predict_step_size
-                cutoff = -self.input_size - self.test_size
-                temporal = temporal[:, :, cutoff:]
-
-            elif step == "val":
-                predict_step_size = self.step_size
-                cutoff = -self.input_size - self.val_size - self.test_size
-                if self.test_size > 0:
-                    temporal = batch["temporal"][:, :, cutoff : -self.test_size]
-                else:
-                    temporal = batch["temporal"][:, :, cutoff:]
-                if temporal.shape[-1] < window_size:
-                    initial_input = temporal.shape[-1] - self.val_size
-                    padder_left = nn.ConstantPad1d(
-                        padding=(self.input_size - initial_input, 0), value=0.0
-                    )
-                    temporal = padder_left(temporal)
+    def _create_inference_windows(self, batch, step):
+        # Pads the batch once and returns a strided view over all of its windows.
+        # unfold does not copy, windows are only materialized by `_gather_windows`.
+        window_size = self.input_size + self.h
+        temporal = batch["temporal"]
 
+        if step == "predict":
+            initial_input = temporal.shape[-1] - self.test_size
             if (
-                (step == "predict")
-                and (self.test_size == 0)
-                and (len(self.futr_exog_list) == 0)
-            ):
-                padder_right = nn.ConstantPad1d(padding=(0, self.h), value=0.0)
-                temporal = padder_right(temporal)
-
-            windows = temporal.unfold(
-                dimension=-1, size=window_size, step=predict_step_size
-            )
+                initial_input <= self.input_size
+            ):  # There is not enough data to predict first timestamp
+                padder_left = nn.ConstantPad1d(
+                    padding=(self.input_size - initial_input, 0), value=0.0
+                )
+                temporal = padder_left(temporal)
+            predict_step_size = self.predict_step_size
+            cutoff = -self.input_size - self.test_size
+            temporal = temporal[:, :, cutoff:]
+
+        elif step == "val":
+            predict_step_size = self.step_size
+            cutoff = -self.input_size - self.val_size - self.test_size
+            if self.test_size > 0:
+                temporal = batch["temporal"][:, :, cutoff : -self.test_size]
+            else:
+                temporal = batch["temporal"][:, :, cutoff:]
+            if temporal.shape[-1] < window_size:
+                initial_input = temporal.shape[-1] - self.val_size
+                padder_left = nn.ConstantPad1d(
+                    padding=(self.input_size - initial_input, 0), value=0.0
+                )
+                temporal = padder_left(temporal)
+        else:
+            raise ValueError(f"Unknown step {step}")
 
-            # [batch, channels, windows, window_size] 0, 1, 2, 3
-            # -> [batch * windows, window_size, channels] 0, 2, 3, 1
-            windows_per_serie = windows.shape[2]
-            windows = windows.permute(0, 2, 3, 1).contiguous()
-            windows = windows.reshape(-1, window_size, len(temporal_cols))
+        if (
+            (step == "predict")
+            and (self.test_size == 0)
+            and (len(self.futr_exog_list) == 0)
+        ):
+            padder_right = nn.ConstantPad1d(padding=(0, self.h), value=0.0)
+            temporal = padder_right(temporal)
 
-            static = batch.get("static", None)
-            static_cols = batch.get("static_cols", None)
-            if static is not None:
-                static = torch.repeat_interleave(
-                    static, repeats=windows_per_serie, dim=0
-                )
+        # [batch, channels, windows, window_size]
+        windows = temporal.unfold(
+            dimension=-1, size=window_size, step=predict_step_size
+        )
+        return windows
 
-            # Sample windows for batched prediction
-            if w_idxs is not None:
-                windows = windows[w_idxs]
-                if static is not None:
-                    static = static[w_idxs]
+    def _gather_windows(self, batch, windows, w_idxs=None):
+        # Materializes only the requested windows from the strided view.
+        # w_idxs index the flattened [batch * windows] dimension.
+        n_series, _, windows_per_serie, _ = windows.shape
+        if w_idxs is None:
+            w_idxs = np.arange(n_series * windows_per_serie)
+        serie_idxs, window_idxs = np.divmod(w_idxs, windows_per_serie)
+        serie_idxs = torch.as_tensor(serie_idxs, device=windows.device)
+        window_idxs = torch.as_tensor(window_idxs, device=windows.device)
+
+        # [batch, channels, windows, window_size] -> [w_idxs, channels, window_size]
+        # -> [w_idxs, window_size, channels]
+        temporal = windows[serie_idxs, :, window_idxs]
+        temporal = temporal.permute(0, 2, 1).contiguous()
+
+        static = batch.get("static", None)
+        static_cols = batch.get("static_cols", None)
+        if static is not None:
+            static = static[serie_idxs.to(static.device)]
 
-            windows_batch = dict(
-                temporal=windows,
-                temporal_cols=temporal_cols,
-                static=static,
-                static_cols=static_cols,
-            )
-            return windows_batch
-        else:
-            raise ValueError(f"Unknown step {step}")
+        windows_batch = dict(
+            temporal=temporal,
+            temporal_cols=batch["temporal_cols"],
+            static=static,
+            static_cols=static_cols,
+        )
+        return windows_batch
 
     def _normalization(self, windows, y_idx):
         # windows are already filtered by train/validation/test
@@ -393,13 +429,16 @@ class BaseWindows(BaseModel):
             stat_exog,
         )
 
-    def training_step(self, batch, batch_idx):
-        # Create and normalize windows [Ws, L+H, C]
+    def _train_windows(self, batch):
+        # Create and normalize windows [Ws, L+H, C], keeps the original outsample_y
+        # for the distribution losses
         windows = self._create_windows(batch, step="train")
         y_idx = batch["y_idx"]
         original_outsample_y = torch.clone(windows["temporal"][:, -self.h :, y_idx])
         windows = self._normalization(windows=windows, y_idx=y_idx)
+        return windows, original_outsample_y
 
+    def _train_loss(self, batch, windows, original_outsample_y):
         # Parse windows
         (
             insample_y,
@@ -423,7 +462,9 @@ class BaseWindows(BaseModel):
         output = self(windows_batch)
         if self.loss.is_distribution_output:
             _, y_loc, y_scale = self._inv_normalization(
-                y_hat=outsample_y, temporal_cols=batch["temporal_cols"], y_idx=y_idx
+                y_hat=outsample_y,
+                temporal_cols=batch["temporal_cols"],
+                y_idx=batch["y_idx"],
             )
             outsample_y = original_outsample_y
             distr_args = self.loss.scale_decouple(
@@ -439,11 +480,15 @@ class BaseWindows(BaseModel):
             print("outsample_y", torch.isnan(outsample_y).sum())
             print("output", torch.isnan(output).sum())
             raise Exception("Loss is NaN, training stopped.")
+        return loss
 
+    def training_step(self, batch, batch_idx):
+        windows, original_outsample_y = self._train_windows(batch)
+        loss = self._train_loss(batch, windows, original_outsample_y)
         self.log(
             "train_loss",
             loss.detach().item(),
-            batch_size=outsample_y.size(0),
+            batch_size=original_outsample_y.size(0),
             prog_bar=True,
             on_epoch=True,
         )
@@ -460,7 +505,7 @@ class BaseWindows(BaseModel):
             distr_args = self.loss.scale_decouple(
                 output=output, loc=y_loc, scale=y_scale
             )
-            _, sample_mean, quants = self.loss.sample(distr_args=distr_args)
+            sample_mean, quants = self.loss.get_quantiles(distr_args=distr_args)
 
             if str(type(self.valid_loss)) in [
                 "<class 'neuralforecast.losses.pytorch.sCRPS'>",
@@ -486,13 +531,11 @@ class BaseWindows(BaseModel):
             )
         return valid_loss
 
-    def validation_step(self, batch, batch_idx):
-        if self.val_size == 0:
-            return np.nan
-
-        # TODO: Hack to compute number of windows
-        windows = self._create_windows(batch, step="val")
-        n_windows = len(windows["temporal"])
+    def _valid_windows(self, batch):
+        # Yields the normalized windows [Ws, L+H, C] in chunks of inference_windows_batch_size
+        # Strided view over all windows, built once per batch [B, C, Ws, L+H]
+        all_windows = self._create_inference_windows(batch, step="val")
+        n_windows = all_windows.shape[0] * all_windows.shape[2]
         y_idx = batch["y_idx"]
 
         # Number of windows in batch
@@ -501,48 +544,48 @@ class BaseWindows(BaseModel):
             windows_batch_size = n_windows
         n_batches = int(np.ceil(n_windows / windows_batch_size))
 
-        valid_losses = []
-        batch_sizes = []
         for i in range(n_batches):
             # Create and normalize windows [Ws, L+H, C]
             w_idxs = np.arange(
                 i * windows_batch_size, min((i + 1) * windows_batch_size, n_windows)
             )
-            windows = self._create_windows(batch, step="val", w_idxs=w_idxs)
+            windows = self._gather_windows(batch, all_windows, w_idxs=w_idxs)
             original_outsample_y = torch.clone(windows["temporal"][:, -self.h :, y_idx])
             windows = self._normalization(windows=windows, y_idx=y_idx)
+            yield windows, original_outsample_y
 
-            # Parse windows
-            (
-                insample_y,
-                insample_mask,
-                _,
-                outsample_mask,
-                hist_exog,
-                futr_exog,
-                stat_exog,
-            ) = self._parse_windows(batch, windows)
+    def _valid_loss(self, batch, windows, original_outsample_y):
+        # Parse windows
+        (
+            insample_y,
+            insample_mask,
+            _,
+            outsample_mask,
+            hist_exog,
+            futr_exog,
+            stat_exog,
+        ) = self._parse_windows(batch, windows)
 
-            windows_batch = dict(
-                insample_y=insample_y,  # [Ws, L]
-                insample_mask=insample_mask,  # [Ws, L]
-                futr_exog=futr_exog,  # [Ws, L + h, F]
-                hist_exog=hist_exog,  # [Ws, L, X]
-                stat_exog=stat_exog,
-            )  # [Ws, S]
+        windows_batch = dict(
+            insample_y=insample_y,  # [Ws, L]
+            insample_mask=insample_mask,  # [Ws, L]
+            futr_exog=futr_exog,  # [Ws, L + h, F]
+            hist_exog=hist_exog,  # [Ws, L, X]
+            stat_exog=stat_exog,
+        )  # [Ws, S]
 
-            # Model Predictions
-            output_batch = self(windows_batch)
-            valid_loss_batch = self._compute_valid_loss(
-                outsample_y=original_outsample_y,
-                output=output_batch,
-                outsample_mask=outsample_mask,
-                temporal_cols=batch["temporal_cols"],
-                y_idx=batch["y_idx"],
-            )
-            valid_losses.append(valid_loss_batch)
-            batch_sizes.append(len(output_batch))
+        # Model Predictions
+        output_batch = self(windows_batch)
+        return self._compute_valid_loss(
+            outsample_y=original_outsample_y,
+            output=output_batch,
+            outsample_mask=outsample_mask,
+            temporal_cols=batch["temporal_cols"],
+            y_idx=batch["y_idx"],
+        )
 
+    @staticmethod
+    def _average_valid_loss(valid_losses, batch_sizes):
         valid_loss = torch.stack(valid_losses)
         batch_sizes = torch.tensor(batch_sizes, device=valid_loss.device)
         batch_size = torch.sum(batch_sizes)
@@ -550,6 +593,18 @@ class BaseWindows(BaseModel):
 
         if torch.isnan(valid_loss):
             raise Exception("Loss is NaN, training stopped.")
+        return valid_loss, batch_size
+
+    def validation_step(self, batch, batch_idx):
+        if self.val_size == 0:
+            return np.nan
+
+        valid_losses = []
+        batch_sizes = []
+        for windows, original_outsample_y in self._valid_windows(batch):
+            valid_losses.append(self._valid_loss(batch, windows, original_outsample_y))
+            batch_sizes.append(len(original_outsample_y))
+        valid_loss, batch_size = self._average_valid_loss(valid_losses, batch_sizes)
 
         self.log(
             "valid_loss",
@@ -563,9 +618,9 @@ class BaseWindows(BaseModel):
 
     def predict_step(self, batch, batch_idx):
 
-        # TODO: Hack to compute number of windows
-        windows = self._create_windows(batch, step="predict")
-        n_windows = len(windows["temporal"])
+        # Strided view over all windows, built once per batch [B, C, Ws, L+H]
+        all_windows = self._create_inference_windows(batch, step="predict")
+        n_windows = all_windows.shape[0] * all_windows.shape[2]
         y_idx = batch["y_idx"]
 
         # Number of windows in batch
@@ -580,7 +635,7 @@ class BaseWindows(BaseModel):
             w_idxs = np.arange(
                 i * windows_batch_size, min((i + 1) * windows_batch_size, n_windows)
             )
-            windows = self._create_windows(batch, step="predict", w_idxs=w_idxs)
+            windows = self._gather_windows(batch, all_windows, w_idxs=w_idxs)
             windows = self._normalization(windows=windows, y_idx=y_idx)
 
             # Parse windows
@@ -612,7 +667,7 @@ class BaseWindows(BaseModel):
                 distr_args = self.loss.scale_decouple(
                     output=output_batch, loc=y_loc, scale=y_scale
                 )
-                _, sample_mean, quants = self.loss.sample(distr_args=distr_args)
+                sample_mean, quants = self.loss.get_quantiles(distr_args=distr_args)
                 y_hat = torch.concat((sample_mean, quants), axis=2)
 
                 if self.loss.return_params:
@@ -676,6 +731,7 @@ class BaseWindows(BaseModel):
         test_size=None,
         step_size=1,
         random_seed=None,
+        engine="lightning",
         **data_module_kwargs,
     ):
         """Predict.
@@ -687,6 +743,7 @@ class BaseWindows(BaseModel):
         `test_size`: int=None, test size for temporal cross-validation.<br>
         `step_size`: int=1, Step size between each window.<br>
         `random_seed`: int=None, random_seed for pytorch initializer and numpy generators, overwrites model.__init__'s.<br>
+        `engine`: str='lightning', 'lightning' runs PL's `Trainer`, 'torch' runs plain forward passes under `torch.inference_mode` on the model's device, without trainer setup.<br>
         `**data_module_kwargs`: PL's TimeSeriesDataModule args, see [documentation](https://pytorch-lightning.readthedocs.io/en/1.6.1/extensions/datamodules.html#using-a-datamodule).
         """
         self._check_exog(dataset)
@@ -701,15 +758,7 @@ class BaseWindows(BaseModel):
             **data_module_kwargs,
         )
 
-        # Protect when case of multiple gpu. PL does not support return preds with multiple gpu.
-        pred_trainer_kwargs = self.trainer_kwargs.copy()
-        if (pred_trainer_kwargs.get("accelerator", None) == "gpu") and (
-            torch.cuda.device_count() > 1
-        ):
-            pred_trainer_kwargs["devices"] = [0]
-
-        trainer = pl.Trainer(**pred_trainer_kwargs)
-        fcsts = trainer.predict(self, datamodule=datamodule)
+        fcsts = self._predict_loop(datamodule, engine=engine)
         fcsts = torch.vstack(fcsts).numpy().flatten()
         fcsts = fcsts.reshape(-1, len(self.loss.output_names))
         return fcsts
@@ -742,3 +791,185 @@ class BaseWindows(BaseModel):
         fcsts = trainer.predict(self, datamodule=datamodule)
         self.decompose_forecast = False  # Default decomposition back to false
         return torch.vstack(fcsts).numpy()
+
+# %% ../../nbs/common.base_windows.ipynb 7
+def _shared_windows_config(model):
+    """Settings that must match for models to train on the same windows,
+    `None` if the model can't share them."""
+    if not isinstance(model, BaseWindows) or model._warm_start_steps is not None:
+        return None
+    # Models with their own steps, like DeepAR, don't train through the shared losses
+    for method in ["training_step", "validation_step", "_train_loss", "_valid_loss"]:
+        if getattr(type(model), method) is not getattr(BaseWindows, method):
+            return None
+    # Learnable scalers, early stopping and gradient clipping are specific to each model
+    if model.scaler.scaler_type == "revin" or model.early_stop_patience_steps > 0:
+        return None
+    if "gradient_clip_val" in model.trainer_kwargs:
+        return None
+    attrs = [
+        "h",
+        "input_size",
+        "step_size",
+        "start_padding_enabled",
+        "batch_size",
+        "valid_batch_size",
+        "windows_batch_size",
+        "inference_windows_batch_size",
+        "drop_last_loader",
+        "num_workers_loader",
+        "dataloader_kwargs",
+        "hist_exog_list",
+        "futr_exog_list",
+        "stat_exog_list",
+        "random_seed",
+        "max_steps",
+        "val_check_steps",
+        "trainer_kwargs",
+        "optimizer",
+        "optimizer_kwargs",
+        "learning_rate",
+        "lr_scheduler",
+        "lr_scheduler_kwargs",
+        "lr_decay_steps",
+    ]
+    config = {attr: getattr(model, attr) for attr in attrs}
+    config["scaler_type"] = model.scaler.scaler_type
+    return config
+
+
+def _shared_windows_groups(models):
+    """Indices of the models grouped by the windows they can share."""
+    groups, configs = [], []
+    for i, model in enumerate(models):
+        config = _shared_windows_config(model)
+        for group, group_config in zip(groups, configs):
+            if config is not None and config == group_config:
+                group.append(i)
+                break
+        else:
+            groups.append([i])
+            configs.append(config)
+    return groups
+
+
+class _SharedWindows(pl.LightningModule):
+    """Trains several `BaseWindows` models over one pass of the data.
+
+    Each batch is windowed and normalized once, by the first model, and every model
+    computes its loss on the same windows. The models must have matching
+    `_shared_windows_config`, in particular the same seed, so they draw the windows
+    they would have drawn being trained separately. The models also share the torch
+    random stream, so the ones with dropout don't draw the masks they would draw alone.
+    """
+
+    def __init__(self, models):
+        super().__init__()
+        self.models = nn.ModuleList(models)
+        # The optimizers update each parameter independently, so a single one over the
+        # parameters of all the models takes the same steps as one per model
+        ref = models[0]
+        self.optimizer = ref.optimizer
+        self.optimizer_kwargs = ref.optimizer_kwargs
+        self.learning_rate = ref.learning_rate
+        self.lr_scheduler = ref.lr_scheduler
+        self.lr_scheduler_kwargs = ref.lr_scheduler_kwargs
+        self.lr_decay_steps = ref.lr_decay_steps
+        self._optimizer_state = None
+
+    def configure_optimizers(self):
+        return BaseModel.configure_optimizers(self)
+
+    def on_fit_start(self):
+        self.models[0].on_fit_start()
+
+    def _share_scaler(self):
+        # The models invert the normalization with the statistics of the shared windows
+        scaler = self.models[0].scaler
+        for model in self.models[1:]:
+            model.scaler.x_shift = scaler.x_shift
+            model.scaler.x_scale = scaler.x_scale
+
+    def training_step(self, batch, batch_idx):
+        windows, original_outsample_y = self.models[0]._train_windows(batch)
+        self._share_scaler()
+        batch_size = original_outsample_y.size(0)
+        losses = []
+        for i, model in enumerate(self.models):
+            loss = model._train_loss(batch, windows, original_outsample_y)
+            self.log(
+                f"{i}/train_loss",
+                loss.detach().item(),
+                batch_size=batch_size,
+                on_epoch=True,
+            )
+            model.train_trajectories.append((self.global_step, loss.detach().item()))
+            losses.append(loss)
+        loss = torch.stack(losses).sum()
+        self.log(
+            "train_loss",
+            loss.detach().item(),
+            batch_size=batch_size,
+            prog_bar=True,
+            on_epoch=True,
+        )
+        return loss
+
+    def validation_step(self, batch, batch_idx):
+        if self.models[0].val_size == 0:
+            return np.nan
+
+        valid_losses = [[] for _ in self.models]
+        batch_sizes = []
+        for windows, original_outsample_y in self.models[0]._valid_windows(batch):
+            self._share_scaler()
+            for model, losses in zip(self.models, valid_losses):
+                losses.append(model._valid_loss(batch, windows, original_outsample_y))
+            batch_sizes.append(len(original_outsample_y))
+
+        for i, (model, losses) in enumerate(zip(self.models, valid_losses)):
+            valid_loss, batch_size = model._average_valid_loss(losses, batch_sizes)
+            self.log(
+                f"{i}/valid_loss",
+                valid_loss.detach().item(),
+                batch_size=batch_size,
+                on_epoch=True,
+            )
+            model.validation_step_outputs.append(valid_loss)
+
+    def on_validation_epoch_end(self):
+        if self.models[0].val_size == 0:
+            return
+        for i, model in enumerate(self.models):
+            losses = torch.stack(model.validation_step_outputs)
+            avg_loss = losses.mean().detach().item()
+            self.log(
+                f"{i}/ptl/val_loss", avg_loss, batch_size=losses.size(0), sync_dist=True
+            )
+            model.valid_trajectories.append((self.global_step, avg_loss))
+            model.validation_step_outputs.clear()
+
+    def fit(self, dataset, val_size=0):
+        """Fits the models on `dataset` and returns them."""
+        models = list(self.models)
+        datamodules = [
+            model._setup_fit(
+                dataset=dataset,
+                batch_size=model.batch_size,
+                valid_batch_size=model.valid_batch_size,
+                val_size=val_size,
+            )
+            for model in models
+        ]
+        trainer = pl.Trainer(**models[0].trainer_kwargs)
+        trainer.fit(self, datamodule=datamodules[0])
+        for i, model in enumerate(models):
+            prefix = f"{i}/"
+            model.metrics = {
+                name[len(prefix) :]: value
+                for name, value in trainer.callback_metrics.items()
+                if name.startswith(prefix)
+            }
+            model.__dict__.pop("_trainer", None)
+        self.__dict__.pop("_trainer", None)
+        return models
@@ -1,8 +1,8 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/common.scalers.ipynb.
 
 # %% auto 0
-__all__ = ['masked_median', 'masked_mean', 'minmax_statistics', 'minmax1_statistics', 'std_statistics', 'robust_statistics',
-           'invariant_statistics', 'identity_statistics', 'TemporalNorm']
+__all__ = ['masked_median', 'masked_mean', 'masked_median_mad', 'masked_mean_std', 'minmax_statistics', 'minmax1_statistics',
+           'std_statistics', 'robust_statistics', 'invariant_statistics', 'identity_statistics', 'TemporalNorm']
 
 # %% ../../nbs/common.scalers.ipynb 6
 import torch
@@ -54,7 +54,69 @@ def masked_mean(x, mask, dim=-1, keepdim=True):
     x_mean = torch.nan_to_num(x_mean, nan=0.0)
     return x_mean
 
-# %% ../../nbs/common.scalers.ipynb 14
+
+def masked_median_mad(x, mask, dim=-1, keepdim=True):
+    """Masked Median and Median Absolute Deviation
+
+    Compute the median of tensor `x` along dim, and the median of the absolute
+    deviations from it, masking `x` once for both selections.
+    `x` and `mask` need to be broadcastable.
+
+    **Parameters:**<br>
+    `x`: torch.Tensor to compute median and mad of along `dim` dimension.<br>
+    `mask`: torch Tensor bool with same shape as `x`, where `x` is valid and False
+            where `x` should be masked. Mask should not be all False in any column of
+            dimension dim to avoid NaNs from zero division.<br>
+    `dim` (int, optional): Dimension to take median and mad of. Defaults to -1.<br>
+    `keepdim` (bool, optional): Keep dimension of `x` or not. Defaults to True.<br>
+
+    **Returns:**<br>
+    `x_median`: torch.Tensor with the medians.<br>
+    `x_mad`: torch.Tensor with the median absolute deviations.
+    """
+    x_nan = x.masked_fill(mask < 1, float("nan"))
+    x_median, _ = x_nan.nanmedian(dim=dim, keepdim=True)
+    x_mad, _ = torch.abs(x_nan - x_median).nanmedian(dim=dim, keepdim=keepdim)
+    if not keepdim:
+        x_median = x_median.squeeze(dim)
+    x_median = torch.nan_to_num(x_median, nan=0.0)
+    x_mad = torch.nan_to_num(x_mad, nan=0.0)
+    return x_median, x_mad
+
+
+def masked_mean_std(x, mask, dim=-1, keepdim=True):
+    """Masked Mean and Standard Deviation
+
+    Compute the mean of tensor `x` along dimension, and its standard deviation,
+    ignoring values where `mask` is False with the same zero filled `x`
+    for both reductions. `x` and `mask` need to be broadcastable.
+
+    **Parameters:**<br>
+    `x`: torch.Tensor to compute mean and std of along `dim` dimension.<br>
+    `mask`: torch Tensor bool with same shape as `x`, where `x` is valid and False
+            where `x` should be masked. Mask should not be all False in any column of
+            dimension dim to avoid NaNs from zero division.<br>
+    `dim` (int, optional): Dimension to take mean and std of. Defaults to -1.<br>
+    `keepdim` (bool, optional): Keep dimension of `x` or not. Defaults to True.<br>
+
+    **Returns:**<br>
+    `x_mean`: torch.Tensor with the means.<br>
+    `x_std`: torch.Tensor with the standard deviations.
+    """
+    valid = (mask >= 1) & ~torch.isnan(x)
+    count = valid.sum(dim=dim, keepdim=keepdim).clamp(min=1)
+    x_valid = torch.where(valid, x, 0.0)
+    x_mean = x_valid.sum(dim=dim, keepdim=keepdim) / count
+    x_mean_dim = x_mean if keepdim else x_mean.unsqueeze(dim)
+    x_var = (
+        torch.where(valid, x_valid - x_mean_dim, 0.0)
+        .square()
+        .sum(dim=dim, keepdim=keepdim)
+        / count
+    )
+    return x_mean, torch.sqrt(x_var)
+
+# %% ../../nbs/common.scalers.ipynb 16
 def minmax_statistics(x, mask, eps=1e-6, dim=-1):
     """MinMax Scaler
 
@@ -96,7 +158,7 @@ def minmax_statistics(x, mask, eps=1e-6, dim=-1):
     x_range = x_range + eps
     return x_min, x_range
 
-# %% ../../nbs/common.scalers.ipynb 15
+# %% ../../nbs/common.scalers.ipynb 17
 def minmax_scaler(x, x_min, x_range):
     return (x - x_min) / x_range
 
@@ -104,7 +166,7 @@ def minmax_scaler(x, x_min, x_range):
 def inv_minmax_scaler(z, x_min, x_range):
     return z * x_range + x_min
 
-# %% ../../nbs/common.scalers.ipynb 17
+# %% ../../nbs/common.scalers.ipynb 19
 def minmax1_statistics(x, mask, eps=1e-6, dim=-1):
     """MinMax1 Scaler
 
@@ -145,7 +207,7 @@ def minmax1_statistics(x, mask, eps=1e-6, dim=-1):
     x_range = x_range + eps
     return x_min, x_range
 
-# %% ../../nbs/common.scalers.ipynb 18
+# %% ../../nbs/common.scalers.ipynb 20
 def minmax1_scaler(x, x_min, x_range):
     x = (x - x_min) / x_range
     z = x * (2) - 1
@@ -156,7 +218,7 @@ def inv_minmax1_scaler(z, x_min, x_range):
     z = (z + 1) / 2
     return z * x_range + x_min
 
-# %% ../../nbs/common.scalers.ipynb 20
+# %% ../../nbs/common.scalers.ipynb 22
 def std_statistics(x, mask, dim=-1, eps=1e-6):
     """Standard Scaler
 
@@ -178,15 +240,14 @@ def std_statistics(x, mask, dim=-1, eps=1e-6):
     **Returns:**<br>
     `z`: torch.Tensor same shape as `x`, except scaled.
     """
-    x_means = masked_mean(x=x, mask=mask, dim=dim)
-    x_stds = torch.sqrt(masked_mean(x=(x - x_means) ** 2, mask=mask, dim=dim))
+    x_means, x_stds = masked_mean_std(x=x, mask=mask, dim=dim)
 
     # Protect against division by zero
     x_stds[x_stds == 0] = 1.0
     x_stds = x_stds + eps
     return x_means, x_stds
 
-# %% ../../nbs/common.scalers.ipynb 21
+# %% ../../nbs/common.scalers.ipynb 23
 def std_scaler(x, x_means, x_stds):
     return (x - x_means) / x_stds
 
@@ -194,7 +255,7 @@ def std_scaler(x, x_means, x_stds):
 def inv_std_scaler(z, x_mean, x_std):
     return (z * x_std) + x_mean
 
-# %% ../../nbs/common.scalers.ipynb 23
+# %% ../../nbs/common.scalers.ipynb 25
 def robust_statistics(x, mask, dim=-1, eps=1e-6):
     """Robust Median Scaler
 
@@ -221,13 +282,11 @@ def robust_statistics(x, mask, dim=-1, eps=1e-6):
     **Returns:**<br>
     `z`: torch.Tensor same shape as `x`, except scaled.
     """
-    x_median = masked_median(x=x, mask=mask, dim=dim)
-    x_mad = masked_median(x=torch.abs(x - x_median), mask=mask, dim=dim)
+    x_median, x_mad = masked_median_mad(x=x, mask=mask, dim=dim)
 
     # Protect x_mad=0 values
     # Assuming normality and relationship between mad and std
-    x_means = masked_mean(x=x, mask=mask, dim=dim)
-    x_stds = torch.sqrt(masked_mean(x=(x - x_means) ** 2, mask=mask, dim=dim))
+    _, x_stds = masked_mean_std(x=x, mask=mask, dim=dim)
     x_mad_aux = x_stds * 0.6744897501960817
     x_mad = x_mad * (x_mad > 0) + x_mad_aux * (x_mad == 0)
 
@@ -236,7 +295,7 @@ def robust_statistics(x, mask, dim=-1, eps=1e-6):
     x_mad = x_mad + eps
     return x_median, x_mad
 
-# %% ../../nbs/common.scalers.ipynb 24
+# %% ../../nbs/common.scalers.ipynb 26
 def robust_scaler(x, x_median, x_mad):
     return (x - x_median) / x_mad
 
@@ -244,7 +303,7 @@ def robust_scaler(x, x_median, x_mad):
 def inv_robust_scaler(z, x_median, x_mad):
     return z * x_mad + x_median
 
-# %% ../../nbs/common.scalers.ipynb 26
+# %% ../../nbs/common.scalers.ipynb 28
 def invariant_statistics(x, mask, dim=-1, eps=1e-6):
     """Invariant Median Scaler
 
@@ -269,13 +328,11 @@ def invariant_statistics(x, mask, dim=-1, eps=1e-6):
     **Returns:**<br>
     `z`: torch.Tensor same shape as `x`, except scaled.
     """
-    x_median = masked_median(x=x, mask=mask, dim=dim)
-    x_mad = masked_median(x=torch.abs(x - x_median), mask=mask, dim=dim)
+    x_median, x_mad = masked_median_mad(x=x, mask=mask, dim=dim)
 
     # Protect x_mad=0 values
     # Assuming normality and relationship between mad and std
-    x_means = masked_mean(x=x, mask=mask, dim=dim)
-    x_stds = torch.sqrt(masked_mean(x=(x - x_means) ** 2, mask=mask, dim=dim))
+    _, x_stds = masked_mean_std(x=x, mask=mask, dim=dim)
     x_mad_aux = x_stds * 0.6744897501960817
     x_mad = x_mad * (x_mad > 0) + x_mad_aux * (x_mad == 0)
 
@@ -284,7 +341,7 @@ def invariant_statistics(x, mask, dim=-1, eps=1e-6):
     x_mad = x_mad + eps
     return x_median, x_mad
 
-# %% ../../nbs/common.scalers.ipynb 27
+# %% ../../nbs/common.scalers.ipynb 29
 def invariant_scaler(x, x_median, x_mad):
     return torch.arcsinh((x - x_median) / x_mad)
 
@@ -292,7 +349,7 @@ def invariant_scaler(x, x_median, x_mad):
 def inv_invariant_scaler(z, x_median, x_mad):
     return torch.sinh(z) * x_mad + x_median
 
-# %% ../../nbs/common.scalers.ipynb 29
+# %% ../../nbs/common.scalers.ipynb 31
 def identity_statistics(x, mask, dim=-1, eps=1e-6):
     """Identity Scaler
 
@@ -318,7 +375,7 @@ def identity_statistics(x, mask, dim=-1, eps=1e-6):
 
     return x_shift, x_scale
 
-# %% ../../nbs/common.scalers.ipynb 30
+# %% ../../nbs/common.scalers.ipynb 32
 def identity_scaler(x, x_shift, x_scale):
     return x
 
@@ -326,7 +383,7 @@ def identity_scaler(x, x_shift, x_scale):
 def inv_identity_scaler(z, x_shift, x_scale):
     return z
 
-# %% ../../nbs/common.scalers.ipynb 33
+# %% ../../nbs/common.scalers.ipynb 35
 class TemporalNorm(nn.Module):
     """Temporal Normalization
 
@@ -409,7 +466,7 @@ class TemporalNorm(nn.Module):
             self.revin_weight = nn.Parameter(torch.ones(1, num_features, 1))
 
     # @torch.no_grad()
-    def transform(self, x, mask):
+    def transform(self, x, mask, x_shift=None, x_scale=None):
         """Center and scale the data.
 
         **Parameters:**<br>
@@ -417,13 +474,16 @@ class TemporalNorm(nn.Module):
         `mask`: torch Tensor bool, shape  [batch, time] where `x` is valid and False
                 where `x` should be masked. Mask should not be all False in any column of
                 dimension dim to avoid NaNs from zero division.<br>
+        `x_shift`: torch.Tensor, optional precomputed shift statistics, used along `x_scale` instead of computing them from `x`.<br>
+        `x_scale`: torch.Tensor, optional precomputed scale statistics.<br>
 
         **Returns:**<br>
         `z`: torch.Tensor same shape as `x`, except scaled.
         """
-        x_shift, x_scale = self.compute_statistics(
-            x=x, mask=mask, dim=self.dim, eps=self.eps
-        )
+        if x_shift is None or x_scale is None:
+            x_shift, x_scale = self.compute_statistics(
+                x=x, mask=mask, dim=self.dim, eps=self.eps
+            )
         self.x_shift = x_shift
         self.x_scale = x_scale
 
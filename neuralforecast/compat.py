@@ -1,11 +1,18 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/compat.ipynb.
 
 # %% auto 0
-__all__ = []
+__all__ = ['SparkDataFrame']
 
 # %% ../nbs/compat.ipynb 1
-try:
-    from pyspark.sql import DataFrame as SparkDataFrame
-except ImportError:
+import sys
 
-    class SparkDataFrame: ...
+
+class _SparkDataFrameMeta(type):
+    def __instancecheck__(cls, instance):
+        # a spark DataFrame can only exist once pyspark has been imported by the user
+        pyspark_sql = sys.modules.get("pyspark.sql")
+        return pyspark_sql is not None and isinstance(instance, pyspark_sql.DataFrame)
+
+
+class SparkDataFrame(metaclass=_SparkDataFrameMeta):
+    """Stands for `pyspark.sql.DataFrame` in annotations and `isinstance` checks without importing pyspark."""
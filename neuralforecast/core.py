@@ -4,12 +4,31 @@
 __all__ = ['NeuralForecast']
 
 # %% ../nbs/core.ipynb 4
+import hashlib
+import importlib
+import json
+import multiprocessing as mp
 import os
 import pickle
+import sys
 import warnings
-from copy import deepcopy
-from itertools import chain
-from typing import Any, Dict, List, Optional, Sequence, Union
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from copy import copy, deepcopy
+from itertools import chain, islice
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import fsspec
 import numpy as np
@@ -24,52 +43,19 @@ from coreforecast.scalers import (
     LocalRobustScaler,
     LocalStandardScaler,
 )
-from utilsforecast.compat import DataFrame, DFType, Series, pl_DataFrame, pl_Series
+from utilsforecast.compat import DataFrame, Series, pl_DataFrame, pl_Series
 from utilsforecast.validation import validate_freq
 
 from .common._base_model import DistributedConfig
+from .common._base_windows import _SharedWindows, _shared_windows_groups
 from .compat import SparkDataFrame
 from neuralforecast.tsdataset import (
     _FilesDataset,
     TimeSeriesDataset,
     LocalFilesTimeSeriesDataset,
 )
-from neuralforecast.models import (
-    GRU,
-    LSTM,
-    RNN,
-    TCN,
-    DeepAR,
-    DilatedRNN,
-    MLP,
-    NHITS,
-    NBEATS,
-    NBEATSx,
-    DLinear,
-    NLinear,
-    TFT,
-    VanillaTransformer,
-    Informer,
-    Autoformer,
-    FEDformer,
-    StemGNN,
-    PatchTST,
-    TimesNet,
-    TimeLLM,
-    TSMixer,
-    TSMixerx,
-    MLPMultivariate,
-    iTransformer,
-    BiTCN,
-    TiDE,
-    DeepNPTS,
-    SOFTS,
-    TimeMixer,
-    KAN,
-    RMoK,
-)
-from .common._base_auto import BaseAuto, MockTrial
-from .utils import PredictionIntervals, get_prediction_interval_method
+from .utils import PredictionIntervals
+from .utils import _add_conformal_intervals, _scores_from_df
 
 # %% ../nbs/core.ipynb 5
 # this disables warnings about the number of workers in the dataloaders
@@ -130,71 +116,97 @@ def _insample_times(
     return out
 
 # %% ../nbs/core.ipynb 7
-MODEL_FILENAME_DICT = {
-    "autoformer": Autoformer,
-    "autoautoformer": Autoformer,
-    "deepar": DeepAR,
-    "autodeepar": DeepAR,
-    "dlinear": DLinear,
-    "autodlinear": DLinear,
-    "nlinear": NLinear,
-    "autonlinear": NLinear,
-    "dilatedrnn": DilatedRNN,
-    "autodilatedrnn": DilatedRNN,
-    "fedformer": FEDformer,
-    "autofedformer": FEDformer,
-    "gru": GRU,
-    "autogru": GRU,
-    "informer": Informer,
-    "autoinformer": Informer,
-    "lstm": LSTM,
-    "autolstm": LSTM,
-    "mlp": MLP,
-    "automlp": MLP,
-    "nbeats": NBEATS,
-    "autonbeats": NBEATS,
-    "nbeatsx": NBEATSx,
-    "autonbeatsx": NBEATSx,
-    "nhits": NHITS,
-    "autonhits": NHITS,
-    "patchtst": PatchTST,
-    "autopatchtst": PatchTST,
-    "rnn": RNN,
-    "autornn": RNN,
-    "stemgnn": StemGNN,
-    "autostemgnn": StemGNN,
-    "tcn": TCN,
-    "autotcn": TCN,
-    "tft": TFT,
-    "autotft": TFT,
-    "timesnet": TimesNet,
-    "autotimesnet": TimesNet,
-    "vanillatransformer": VanillaTransformer,
-    "autovanillatransformer": VanillaTransformer,
-    "timellm": TimeLLM,
-    "tsmixer": TSMixer,
-    "autotsmixer": TSMixer,
-    "tsmixerx": TSMixerx,
-    "autotsmixerx": TSMixerx,
-    "mlpmultivariate": MLPMultivariate,
-    "automlpmultivariate": MLPMultivariate,
-    "itransformer": iTransformer,
-    "autoitransformer": iTransformer,
-    "bitcn": BiTCN,
-    "autobitcn": BiTCN,
-    "tide": TiDE,
-    "autotide": TiDE,
-    "deepnpts": DeepNPTS,
-    "autodeepnpts": DeepNPTS,
-    "softs": SOFTS,
-    "autosofts": SOFTS,
-    "timemixer": TimeMixer,
-    "autotimemixer": TimeMixer,
-    "kan": KAN,
-    "autokan": KAN,
-    "rmok": RMoK,
-    "autormok": RMoK,
-}
+class _ModelRegistry(Mapping):
+    """Maps the lowercase name of a model to its class, which is only imported when it's looked up."""
+
+    def __init__(self, class_names: Dict[str, str]):
+        self._class_names = class_names
+
+    def __getitem__(self, name: str):
+        return getattr(
+            importlib.import_module("neuralforecast.models"), self._class_names[name]
+        )
+
+    def __iter__(self):
+        return iter(self._class_names)
+
+    def __len__(self) -> int:
+        return len(self._class_names)
+
+
+MODEL_FILENAME_DICT = _ModelRegistry(
+    {
+        "autoformer": "Autoformer",
+        "autoautoformer": "Autoformer",
+        "deepar": "DeepAR",
+        "autodeepar": "DeepAR",
+        "dlinear": "DLinear",
+        "autodlinear": "DLinear",
+        "nlinear": "NLinear",
+        "autonlinear": "NLinear",
+        "dilatedrnn": "DilatedRNN",
+        "autodilatedrnn": "DilatedRNN",
+        "fedformer": "FEDformer",
+        "autofedformer": "FEDformer",
+        "gru": "GRU",
+        "autogru": "GRU",
+        "informer": "Informer",
+        "autoinformer": "Informer",
+        "lstm": "LSTM",
+        "autolstm": "LSTM",
+        "mlp": "MLP",
+        "automlp": "MLP",
+        "nbeats": "NBEATS",
+        "autonbeats": "NBEATS",
+        "nbeatsx": "NBEATSx",
+        "autonbeatsx": "NBEATSx",
+        "nhits": "NHITS",
+        "autonhits": "NHITS",
+        "patchtst": "PatchTST",
+        "autopatchtst": "PatchTST",
+        "rnn": "RNN",
+        "autornn": "RNN",
+        "stemgnn": "StemGNN",
+        "autostemgnn": "StemGNN",
+        "tcn": "TCN",
+        "autotcn": "TCN",
+        "tft": "TFT",
+        "autotft": "TFT",
+        "timesnet": "TimesNet",
+        "autotimesnet": "TimesNet",
+        "vanillatransformer": "VanillaTransformer",
+        "autovanillatransformer": "VanillaTransformer",
+        "timellm": "TimeLLM",
+        "tsmixer": "TSMixer",
+        "autotsmixer": "TSMixer",
+        "tsmixerx": "TSMixerx",
+        "autotsmixerx": "TSMixerx",
+        "mlpmultivariate": "MLPMultivariate",
+        "automlpmultivariate": "MLPMultivariate",
+        "itransformer": "iTransformer",
+        "autoitransformer": "iTransformer",
+        "bitcn": "BiTCN",
+        "autobitcn": "BiTCN",
+        "tide": "TiDE",
+        "autotide": "TiDE",
+        "deepnpts": "DeepNPTS",
+        "autodeepnpts": "DeepNPTS",
+        "softs": "SOFTS",
+        "autosofts": "SOFTS",
+        "timemixer": "TimeMixer",
+        "autotimemixer": "TimeMixer",
+        "kan": "KAN",
+        "autokan": "KAN",
+        "rmok": "RMoK",
+        "autormok": "RMoK",
+    }
+)
+
+
+def _is_auto(model) -> bool:
+    # auto models can only exist once their module, which imports ray, has been imported
+    base_auto = sys.modules.get("neuralforecast.common._base_auto")
+    return base_auto is not None and isinstance(model, base_auto.BaseAuto)
 
 # %% ../nbs/core.ipynb 8
 _type2scaler = {
@@ -204,6 +216,46 @@ _type2scaler = {
     "minmax": LocalMinMaxScaler,
     "boxcox": lambda: LocalBoxCoxScaler(method="loglik", lower=0.0),
 }
+_INDPTR_MAX = np.iinfo(np.int32).max
+
+
+def _stack_columns(data: np.ndarray, indptr: np.ndarray, cols: Sequence[int]):
+    """Stack the `cols` of `data` [N, C] one after another as a GroupedArray with a group per column and serie,
+    so that a scaler fits or transforms all of them in one call, parallelized across the groups.
+    The columns are split in chunks that fit in the int32 indptr of the GroupedArray."""
+    n_rows = data.shape[0]
+    chunk_size = max(1, _INDPTR_MAX // max(n_rows, 1))
+    num_threads = torch.get_num_threads()
+    for start in range(0, len(cols), chunk_size):
+        chunk = list(cols[start : start + chunk_size])
+        block = data.T[chunk]  # contiguous copy [chunk, N]
+        offsets = n_rows * np.arange(len(chunk))
+        stacked_indptr = np.append(
+            (offsets[:, None] + indptr[:-1]).ravel(), block.size
+        ).astype(np.int32)
+        yield chunk, GroupedArray(
+            block.ravel(), stacked_indptr, num_threads=num_threads
+        )
+
+
+def _assign_columns(data: np.ndarray, cols: Sequence[int], block: np.ndarray) -> None:
+    """`data[:, cols] = block.T`, assigning the runs of consecutive columns through slices,
+    which is several times faster than through fancy indexing."""
+    start = 0
+    for end in range(1, len(cols) + 1):
+        if end == len(cols) or cols[end] != cols[end - 1] + 1:
+            data[:, cols[start] : cols[end - 1] + 1] = block[start:end].T
+            start = end
+
+
+def _stack_scalers(scalers: Sequence[Any]) -> Any:
+    """Scaler with the statistics of `scalers` one after another, for a GroupedArray from `_stack_columns`."""
+    if hasattr(scalers[0], "stack"):
+        return scalers[0].stack(scalers)
+    # scalers that don't implement `stack`, whose statistics are an array with a row per serie
+    stacked = copy(scalers[0])
+    stacked.stats_ = np.vstack([scaler.stats_ for scaler in scalers])
+    return stacked
 
 # %% ../nbs/core.ipynb 9
 def _id_as_idx() -> bool:
@@ -218,7 +270,94 @@ def _warn_id_as_idx():
         category=FutureWarning,
     )
 
+
+def _unique_model_names(models) -> List[str]:
+    """Name of each model, with a counter appended to the repeated ones, e.g. MLP and MLP1."""
+    names: List[str] = []
+    count_names = {"model": 0}
+    for model in models:
+        model_name = repr(model)
+        count_names[model_name] = count_names.get(model_name, -1) + 1
+        if count_names[model_name] > 0:
+            model_name += str(count_names[model_name])
+        names.append(model_name)
+    return names
+
 # %% ../nbs/core.ipynb 10
+class _PredictCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    max_size: int
+    size: int
+
+
+def _fingerprint(*objs) -> bytes:
+    """Content hash of arrays, tensors, series and dataframes."""
+    hasher = hashlib.blake2b(digest_size=16)
+    for obj in objs:
+        if obj is None:
+            hasher.update(b"None")
+            continue
+        if isinstance(obj, torch.Tensor):
+            obj = obj.detach().cpu().numpy()
+        elif isinstance(obj, (pd.DataFrame, pd.Series, pd.Index)):
+            hasher.update(
+                repr(
+                    obj.dtypes if isinstance(obj, pd.DataFrame) else obj.dtype
+                ).encode()
+            )
+            if isinstance(obj, pd.Index):
+                obj = obj.to_series()
+            obj = pd.util.hash_pandas_object(obj, index=False).to_numpy()
+        elif isinstance(obj, (pl_DataFrame, pl_Series)):
+            if isinstance(obj, pl_DataFrame):
+                hasher.update(repr(obj.schema).encode())
+                obj = obj.hash_rows()
+            else:
+                hasher.update(repr(obj.dtype).encode())
+                obj = obj.hash()
+            obj = obj.to_numpy()
+        obj = np.ascontiguousarray(obj)
+        hasher.update(repr((obj.dtype, obj.shape)).encode())
+        if obj.dtype == object:
+            obj = pd.util.hash_array(obj.ravel())
+        hasher.update(obj.view(np.uint8).ravel())
+    return hasher.digest()
+
+
+class _PredictCache:
+    """Least recently used cache of the forecasts of `NeuralForecast.predict`."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._fcsts: OrderedDict = OrderedDict()
+
+    def get(self, key: Any) -> Optional[DataFrame]:
+        fcsts_df = self._fcsts.get(key)
+        if fcsts_df is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._fcsts.move_to_end(key)
+        return ufp.copy_if_pandas(fcsts_df, deep=True)
+
+    def put(self, key: Any, fcsts_df: DataFrame) -> None:
+        self._fcsts[key] = ufp.copy_if_pandas(fcsts_df, deep=True)
+        self._fcsts.move_to_end(key)
+        while len(self._fcsts) > self.max_size:
+            self._fcsts.popitem(last=False)
+
+    def clear(self) -> None:
+        self._fcsts.clear()
+
+    def info(self) -> _PredictCacheInfo:
+        return _PredictCacheInfo(
+            self.hits, self.misses, self.max_size, len(self._fcsts)
+        )
+
+# %% ../nbs/core.ipynb 11
 class NeuralForecast:
 
     def __init__(
@@ -263,39 +402,72 @@ class NeuralForecast:
 
         # Flags and attributes
         self._fitted = False
+        self._predict_cache: Optional[_PredictCache] = None
+        self._weights_version = 0
         self._reset_models()
 
     def _scalers_fit_transform(self, dataset: TimeSeriesDataset) -> None:
         self.scalers_ = {}
         if self.local_scaler_type is None:
             return None
-        for i, col in enumerate(dataset.temporal_cols):
-            if col == "available_mask":
-                continue
-            ga = GroupedArray(dataset.temporal[:, i].numpy(), dataset.indptr)
-            self.scalers_[col] = _type2scaler[self.local_scaler_type]().fit(ga)
-            dataset.temporal[:, i] = torch.from_numpy(self.scalers_[col].transform(ga))
-
-    def _scalers_transform(self, dataset: TimeSeriesDataset) -> None:
-        if not self.scalers_:
+        temporal = dataset.temporal.numpy()
+        n_groups = dataset.n_groups
+        cols = [
+            i for i, col in enumerate(dataset.temporal_cols) if col != "available_mask"
+        ]
+        for chunk, ga in _stack_columns(temporal, dataset.indptr, cols):
+            scaler = _type2scaler[self.local_scaler_type]().fit(ga)
+            _assign_columns(
+                temporal, chunk, scaler.transform(ga).reshape(len(chunk), -1)
+            )
+            # keep a scaler per column, whose statistics are views of the stacked ones
+            for j, i in enumerate(chunk):
+                col_scaler = copy(scaler)
+                col_scaler.stats_ = scaler.stats_[j * n_groups : (j + 1) * n_groups]
+                self.scalers_[dataset.temporal_cols[i]] = col_scaler
+
+    def _scalers_transform(
+        self, dataset: TimeSeriesDataset, scalers: Optional[Dict[str, Any]] = None
+    ) -> None:
+        if scalers is None:
+            scalers = self.scalers_
+        if not scalers:
             return None
-        for i, col in enumerate(dataset.temporal_cols):
-            scaler = self.scalers_.get(col, None)
-            if scaler is None:
-                continue
-            ga = GroupedArray(dataset.temporal[:, i].numpy(), dataset.indptr)
-            dataset.temporal[:, i] = torch.from_numpy(scaler.transform(ga))
+        temporal = dataset.temporal.numpy()
+        cols = [i for i, col in enumerate(dataset.temporal_cols) if col in scalers]
+        for chunk, ga in _stack_columns(temporal, dataset.indptr, cols):
+            chunk_scalers = [scalers[dataset.temporal_cols[i]] for i in chunk]
+            scaler = _stack_scalers(chunk_scalers)
+            _assign_columns(
+                temporal, chunk, scaler.transform(ga).reshape(len(chunk), -1)
+            )
 
     def _scalers_target_inverse_transform(
-        self, data: np.ndarray, indptr: np.ndarray
+        self,
+        data: np.ndarray,
+        indptr: np.ndarray,
+        scalers: Optional[Dict[str, Any]] = None,
     ) -> np.ndarray:
-        if not self.scalers_:
+        if scalers is None:
+            scalers = self.scalers_
+        if not scalers:
             return data
-        for i in range(data.shape[1]):
-            ga = GroupedArray(data[:, i], indptr)
-            data[:, i] = self.scalers_[self.target_col].inverse_transform(ga)
+        target_scaler = scalers[self.target_col]
+        for chunk, ga in _stack_columns(data, indptr, range(data.shape[1])):
+            scaler = _stack_scalers([target_scaler] * len(chunk))
+            _assign_columns(
+                data, chunk, scaler.inverse_transform(ga).reshape(len(chunk), -1)
+            )
         return data
 
+    def _slice_scalers(self, start: int, end: int) -> Dict[str, Any]:
+        """Local scalers with the statistics of the series from `start` to `end`."""
+        sliced = {}
+        for col, scaler in self.scalers_.items():
+            sliced[col] = copy(scaler)
+            sliced[col].stats_ = scaler.stats_[start:end]
+        return sliced
+
     def _prepare_fit(
         self, df, static_df, sort_df, predict_only, id_col, time_col, target_col
     ):
@@ -440,6 +612,8 @@ class NeuralForecast:
         target_col: str = "y",
         distributed_config: Optional[DistributedConfig] = None,
         prediction_intervals: Optional[PredictionIntervals] = None,
+        n_jobs: int = 1,
+        shared_windows: bool = False,
     ) -> None:
         """Fit the core.NeuralForecast.
 
@@ -471,6 +645,15 @@ class NeuralForecast:
             Configuration to use for DDP training. Currently only spark is supported.
         prediction_intervals : PredictionIntervals, optional (default=None)
             Configuration to calibrate prediction intervals (Conformal Prediction).
+        n_jobs : int (default=1)
+            Number of processes used to fit the models in parallel, with the torch threads
+            split between them. The dataset is shared with the processes through shared memory.
+        shared_windows : bool (default=False)
+            Train the windows-based models that sample the same windows (same input size, horizon,
+            batch sizes, exogenous, scaler, seed, optimizer and trainer settings) together,
+            building and normalizing each batch of windows once for all of them. The forecasts
+            match the ones of separate training except for models with dropout, whose masks come
+            from the torch random stream shared by the models of a group.
 
         Returns
         -------
@@ -487,7 +670,7 @@ class NeuralForecast:
         ):
             raise Exception("Set val_size>0 if early stopping is enabled.")
 
-        self._cs_df: Optional[DFType] = None
+        self._cs_scores: Optional[np.ndarray] = None
         self.prediction_intervals: Optional[PredictionIntervals] = None
 
         # Process and save new dataset (in self)
@@ -505,7 +688,7 @@ class NeuralForecast:
             self.sort_df = sort_df
             if prediction_intervals is not None:
                 self.prediction_intervals = prediction_intervals
-                self._cs_df = self._conformity_scores(
+                self._cs_scores = self._conformity_scores(
                     df=df,
                     id_col=id_col,
                     time_col=time_col,
@@ -572,13 +755,57 @@ class NeuralForecast:
         if use_init_models:
             self._reset_models()
 
-        for i, model in enumerate(self.models):
-            self.models[i] = model.fit(
-                self.dataset, val_size=val_size, distributed_config=distributed_config
-            )
+        if n_jobs > 1:
+            if isinstance(self.dataset, _FilesDataset):
+                raise NotImplementedError(
+                    "Parallel fitting is not supported for distributed training."
+                )
+            if shared_windows:
+                raise Exception(
+                    "Shared windows training runs in a single process, set n_jobs=1."
+                )
+            self.models = self._parallel_fit(n_jobs=n_jobs, val_size=val_size)
+        elif shared_windows:
+            if isinstance(self.dataset, _FilesDataset):
+                raise NotImplementedError(
+                    "Shared windows training is not supported for distributed training."
+                )
+            self._shared_windows_fit(val_size=val_size)
+        else:
+            for i, model in enumerate(self.models):
+                self.models[i] = model.fit(
+                    self.dataset,
+                    val_size=val_size,
+                    distributed_config=distributed_config,
+                )
 
+        self._invalidate_predict_cache()
         self._fitted = True
 
+    def _shared_windows_fit(self, val_size: Optional[int]) -> None:
+        """Fits the groups of models that can share their training windows together
+        and the rest of the models on their own."""
+        for group in _shared_windows_groups(self.models):
+            if len(group) == 1:
+                i = group[0]
+                self.models[i] = self.models[i].fit(self.dataset, val_size=val_size)
+                continue
+            models = [self.models[i] for i in group]
+            fitted = _SharedWindows(models).fit(self.dataset, val_size=val_size)
+            for i, model in zip(group, fitted):
+                self.models[i] = model
+
+    def _parallel_fit(self, n_jobs: int, val_size: Optional[int]) -> List[Any]:
+        """Fits each model in a pool of `n_jobs` processes and returns the fitted models."""
+        if isinstance(self.dataset, TimeSeriesDataset):
+            # The workers map the tensors instead of receiving copies of them
+            self.dataset.temporal.share_memory_()
+            if self.dataset.static is not None:
+                self.dataset.static.share_memory_()
+        worker_state = dict(dataset=self.dataset, val_size=val_size)
+        with _process_pool(n_jobs, worker_state) as executor:
+            return list(executor.map(_fit_worker, self.models))
+
     def make_future_dataframe(self, df: Optional[DataFrame] = None) -> DataFrame:
         """Create a dataframe with all ids and future times in the forecasting horizon.
 
@@ -632,7 +859,7 @@ class NeuralForecast:
     def _get_needed_futr_exog(self):
         futr_exogs = []
         for m in self.models:
-            if isinstance(m, BaseAuto):
+            if _is_auto(m):
                 if isinstance(m.config, dict):  # ray
                     exogs = m.config.get("futr_exog_list", [])
                     if hasattr(
@@ -640,6 +867,8 @@ class NeuralForecast:
                     ):  # features are being tuned, get possible values
                         exogs = exogs.categories
                 else:  # optuna
+                    from neuralforecast.common._base_auto import MockTrial
+
                     exogs = m.config(MockTrial()).get("futr_exog_list", [])
             else:  # regular model, extract them directly
                 exogs = getattr(m, "futr_exog_list", [])
@@ -657,7 +886,7 @@ class NeuralForecast:
 
         hist_exog = []
         for m in self.models:
-            if isinstance(m, BaseAuto):
+            if _is_auto(m):
                 if isinstance(m.config, dict):  # ray
                     exogs = m.config.get("hist_exog_list", [])
                     if hasattr(
@@ -665,6 +894,8 @@ class NeuralForecast:
                     ):  # features are being tuned, get possible values
                         exogs = exogs.categories
                 else:  # optuna
+                    from neuralforecast.common._base_auto import MockTrial
+
                     exogs = m.config(MockTrial()).get("hist_exog_list", [])
             else:  # regular model, extract them directly
                 exogs = getattr(m, "hist_exog_list", [])
@@ -678,16 +909,13 @@ class NeuralForecast:
         return futr_exog | set(hist_exog)
 
     def _get_model_names(self, add_level=False) -> List[str]:
+        models = [
+            model
+            for model in self.models
+            if not (add_level and model.loss.outputsize_multiplier > 1)
+        ]
         names: List[str] = []
-        count_names = {"model": 0}
-        for model in self.models:
-            if add_level and model.loss.outputsize_multiplier > 1:
-                continue
-
-            model_name = repr(model)
-            count_names[model_name] = count_names.get(model_name, -1) + 1
-            if count_names[model_name] > 0:
-                model_name += str(count_names[model_name])
+        for model, model_name in zip(models, _unique_model_names(models)):
             names.extend(model_name + n for n in model.loss.output_names)
         return names
 
@@ -815,6 +1043,7 @@ class NeuralForecast:
         verbose: bool = False,
         engine=None,
         level: Optional[List[Union[int, float]]] = None,
+        stateful: bool = False,
         **data_kwargs,
     ):
         """Predict with core.NeuralForecast.
@@ -834,10 +1063,16 @@ class NeuralForecast:
             Sort `df` before fitting.
         verbose : bool (default=False)
             Print processing steps.
-        engine : spark session
+        engine : spark session or str
             Distributed engine for inference. Only used if df is a spark dataframe or if fit was called on a spark dataframe.
+            For local data, 'torch' runs the models' forward passes without building a `pl.Trainer`.
         level : list of ints or floats, optional (default=None)
             Confidence levels between 0 and 100.
+        stateful : bool (default=False)
+            Forecast from the encoder states of the recurrent models, stored by `unique_id` in the previous stateful calls.
+            The series with a stored state only advance over their observations in `df`, which must hold just
+            the observations after the previous call. The other series are encoded from their whole history in `df`.
+            The final states are stored for the next call, and are cleared when the models or the stored dataset change.
         data_kwargs : kwargs
             Extra arguments to be passed to the dataset within each model.
 
@@ -853,19 +1088,22 @@ class NeuralForecast:
         if not self._fitted:
             raise Exception("You must fit the model before predicting.")
 
-        needed_futr_exog = self._get_needed_futr_exog()
-        if needed_futr_exog:
-            if futr_df is None:
+        self._check_futr_exog(futr_df)
+        if stateful:
+            unsupported = [
+                repr(model) for model in self.models if not model.STATEFUL_INFERENCE
+            ]
+            if unsupported:
                 raise ValueError(
-                    f"Models require the following future exogenous features: {needed_futr_exog}. "
-                    "Please provide them through the `futr_df` argument."
+                    f"The following models do not support stateful inference: {unsupported}"
+                )
+            if df is None and any(
+                model.encoder_states is not None for model in self.models
+            ):
+                raise ValueError(
+                    "Stateful inference requires `df` with the new observations once the encoder "
+                    "states are stored, the stored dataset would advance them over its whole history."
                 )
-            else:
-                missing = needed_futr_exog - set(futr_df.columns)
-                if missing:
-                    raise ValueError(
-                        f"The following features are missing from `futr_df`: {missing}"
-                    )
 
         # distributed df or NeuralForecast instance was trained with a distributed input and no df is provided
         # we assume the user wants to perform distributed inference as well
@@ -874,6 +1112,10 @@ class NeuralForecast:
             getattr(self, "dataset", None), LocalFilesTimeSeriesDataset
         )
         if isinstance(df, SparkDataFrame) or (df is None and is_files_dataset):
+            if stateful:
+                raise ValueError(
+                    "Stateful inference is not supported for distributed inference."
+                )
             return self._predict_distributed(
                 df=df,
                 static_df=static_df,
@@ -881,11 +1123,23 @@ class NeuralForecast:
                 engine=engine,
             )
 
+        if engine == "torch":
+            data_kwargs = {**data_kwargs, "engine": engine}
+
         if is_dataset_local_files and df is None:
             raise ValueError(
                 "When the model has been trained on a dataset that is split between multiple files, you must pass in a specific dataframe for prediciton."
             )
 
+        cache_key = None
+        if self._predict_cache is not None and not stateful:
+            cache_key = self._predict_cache_key(
+                df, static_df, futr_df, sort_df, level, data_kwargs
+            )
+            fcsts_df = self._predict_cache.get(cache_key)
+            if fcsts_df is not None:
+                return fcsts_df
+
         # Process new dataset but does not store it.
         if df is not None:
             validate_freq(df[self.time_col], self.freq)
@@ -905,6 +1159,66 @@ class NeuralForecast:
             if verbose:
                 print("Using stored dataset.")
 
+        if stateful:
+            data_kwargs = {**data_kwargs, "state_ids": uids}
+        fcsts_df = self._predict_series(
+            dataset=dataset,
+            uids=uids,
+            last_dates=last_dates,
+            futr_df=futr_df,
+            stored=df is None,
+            level=level,
+            data_kwargs=data_kwargs,
+        )
+        if cache_key is not None:
+            self._predict_cache.put(cache_key, fcsts_df)
+        return fcsts_df
+
+    def _check_futr_exog(self, futr_df: Optional[DataFrame]) -> None:
+        needed_futr_exog = self._get_needed_futr_exog()
+        if needed_futr_exog:
+            if futr_df is None:
+                raise ValueError(
+                    f"Models require the following future exogenous features: {needed_futr_exog}. "
+                    "Please provide them through the `futr_df` argument."
+                )
+            else:
+                missing = needed_futr_exog - set(futr_df.columns)
+                if missing:
+                    raise ValueError(
+                        f"The following features are missing from `futr_df`: {missing}"
+                    )
+
+    def _check_level(self, n_series: int) -> None:
+        if self._cs_scores is None or self.prediction_intervals is None:
+            raise Exception(
+                "You must fit the model with prediction_intervals to use level."
+            )
+        if n_series != self._cs_scores.shape[1]:
+            raise ValueError(
+                "Prediction intervals require the same series used to compute the conformity scores in fit."
+            )
+
+    def _predict_series(
+        self,
+        dataset: TimeSeriesDataset,
+        uids: Series,
+        last_dates: Series,
+        futr_df: Optional[DataFrame],
+        stored: bool,
+        level: Optional[List[Union[int, float]]],
+        data_kwargs: Dict[str, Any],
+        scalers: Optional[Dict[str, Any]] = None,
+        cs_scores: Optional[np.ndarray] = None,
+    ) -> DataFrame:
+        """Forecasts of the series of `dataset`. `scalers` and `cs_scores` default to the
+        local scalers and conformity scores of all the series."""
+        if scalers is None:
+            scalers = self.scalers_
+        if level is not None and cs_scores is None:
+            self._check_level(len(uids))
+            cs_scores = self._cs_scores
+        needed_futr_exog = self._get_needed_futr_exog()
         cols = self._get_model_names()
 
         # Placeholder dataframe for predictions with unique_id and ds
@@ -924,7 +1238,7 @@ class NeuralForecast:
             futr_orig_rows = futr_df.shape[0]
             futr_df = ufp.join(futr_df, fcsts_df, on=[self.id_col, self.time_col])
             if futr_df.shape[0] < fcsts_df.shape[0]:
-                if df is None:
+                if stored:
                     expected_cmd = "make_future_dataframe()"
                     missing_cmd = "get_missing_future(futr_df)"
                 else:
@@ -946,7 +1260,7 @@ class NeuralForecast:
             time_col=self.time_col,
             target_col=self.target_col,
         )
-        self._scalers_transform(futr_dataset)
+        self._scalers_transform(futr_dataset, scalers)
         dataset = dataset.append(futr_dataset)
 
         col_idx = 0
@@ -962,9 +1276,9 @@ class NeuralForecast:
             fcsts[:, col_idx : col_idx + output_length] = model_fcsts
             col_idx += output_length
             model.set_test_size(old_test_size)  # Set back to original value
-        if self.scalers_:
+        if scalers:
             indptr = np.append(0, np.full(len(uids), self.h).cumsum())
-            fcsts = self._scalers_target_inverse_transform(fcsts, indptr)
+            fcsts = self._scalers_target_inverse_transform(fcsts, indptr, scalers)
 
         # Declare predictions pd.DataFrame
         cols = (
@@ -981,31 +1295,286 @@ class NeuralForecast:
 
         # add prediction intervals
         if level is not None:
-            if self._cs_df is None or self.prediction_intervals is None:
-                raise Exception(
-                    "You must fit the model with prediction_intervals to use level."
-                )
-            else:
-                level_ = sorted(level)
-                model_names = self._get_model_names(add_level=True)
-                prediction_interval_method = get_prediction_interval_method(
-                    self.prediction_intervals.method
-                )
+            fcsts_df = _add_conformal_intervals(
+                fcsts_df,
+                cs_scores,
+                model_names=self._get_model_names(add_level=True),
+                level=sorted(level),
+                method=self.prediction_intervals.method,
+            )
+        return fcsts_df
+
+    def predict_iter(
+        self,
+        df: Optional[DataFrame] = None,
+        static_df: Optional[DataFrame] = None,
+        futr_df: Optional[DataFrame] = None,
+        sort_df: bool = True,
+        verbose: bool = False,
+        engine=None,
+        level: Optional[List[Union[int, float]]] = None,
+        chunk_size: int = 100_000,
+        **data_kwargs,
+    ) -> Iterator[DataFrame]:
+        """Predict with core.NeuralForecast a chunk of series at a time.
+
+        Yields the forecasts of `predict` for `chunk_size` series at a time. Each chunk is
+        aligned with its rows of `futr_df`, forecasted by all the models, unscaled and given its
+        prediction intervals on its own, so the memory used by the forecasts is bounded by `chunk_size`
+        instead of the number of series. The chunks can be written as they are produced,
+        e.g. to the files of a parquet dataset.
+
+        Parameters
+        ----------
+        df : pandas or polars DataFrame, optional (default=None)
+            DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous variables.
+            If a DataFrame is passed, it is used to generate forecasts.
+        static_df : pandas or polars DataFrame, optional (default=None)
+            DataFrame with columns [`unique_id`] and static exogenous.
+        futr_df : pandas or polars DataFrame, optional (default=None)
+            DataFrame with [`unique_id`, `ds`] columns and `df`'s future exogenous.
+        sort_df : bool (default=True)
+            Sort `df` before fitting.
+        verbose : bool (default=False)
+            Print processing steps.
+        engine : str, optional (default=None)
+            'torch' runs the models' forward passes without building a `pl.Trainer`.
+        level : list of ints or floats, optional (default=None)
+            Confidence levels between 0 and 100.
+        chunk_size : int (default=100_000)
+            Number of series forecasted in each chunk.
+        data_kwargs : kwargs
+            Extra arguments to be passed to the dataset within each model.
+
+        Returns
+        -------
+        fcsts_dfs : iterator of pandas or polars DataFrame
+            DataFrames with the forecasts of all the `models` for a chunk of series.
+        """
+        if df is None and not hasattr(self, "dataset"):
+            raise Exception("You must pass a DataFrame or have one stored.")
+        if not self._fitted:
+            raise Exception("You must fit the model before predicting.")
+        if isinstance(df, SparkDataFrame) or (
+            df is None and isinstance(self.dataset, _FilesDataset)
+        ):
+            raise NotImplementedError(
+                "Predicting by chunks is not supported for distributed data."
+            )
+        if df is None and isinstance(self.dataset, LocalFilesTimeSeriesDataset):
+            raise ValueError(
+                "When the model has been trained on a dataset that is split between multiple files, you must pass in a specific dataframe for prediciton."
+            )
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+        self._check_futr_exog(futr_df)
+        if engine == "torch":
+            data_kwargs = {**data_kwargs, "engine": engine}
+
+        if df is not None:
+            validate_freq(df[self.time_col], self.freq)
+            dataset, uids, last_dates, _ = self._prepare_fit(
+                df=df,
+                static_df=static_df,
+                sort_df=sort_df,
+                predict_only=True,
+                id_col=self.id_col,
+                time_col=self.time_col,
+                target_col=self.target_col,
+            )
+        else:
+            dataset = self.dataset
+            uids = self.uids
+            last_dates = self.last_dates
+            if verbose:
+                print("Using stored dataset.")
+        if level is not None:
+            self._check_level(len(uids))
+        if chunk_size < dataset.n_groups and any(
+            model.SAMPLING_TYPE == "multivariate" for model in self.models
+        ):
+            raise ValueError(
+                "Multivariate models forecast all the series together, chunk_size must be at least the number of series."
+            )
 
-                fcsts_df = prediction_interval_method(
-                    fcsts_df,
-                    self._cs_df,
-                    model_names=list(model_names),
-                    level=level_,
-                    cs_n_windows=self.prediction_intervals.n_windows,
-                    n_series=len(uids),
-                    horizon=self.h,
+        # Rows of each serie in the sorted futr_df, to take the ones of every chunk
+        if futr_df is not None:
+            futr_df = ufp.sort(futr_df, by=[self.id_col, self.time_col])
+            futr_counts = ufp.counts_by_id(futr_df, self.id_col)
+            futr_ids = pd.Index(np.asarray(futr_counts[self.id_col]))
+            futr_sizes = np.asarray(futr_counts["counts"], dtype=np.int64)
+            futr_starts = np.append(0, futr_sizes.cumsum())[:-1]
+
+        for start in range(0, dataset.n_groups, chunk_size):
+            end = min(start + chunk_size, dataset.n_groups)
+            chunk_uids = uids[start:end]
+            chunk_futr_df = None
+            if futr_df is not None:
+                pos = futr_ids.get_indexer(np.asarray(chunk_uids))
+                pos = pos[pos >= 0]
+                sizes = futr_sizes[pos]
+                offsets = np.repeat(
+                    futr_starts[pos] - np.append(0, sizes.cumsum())[:-1], sizes
                 )
+                chunk_futr_df = ufp.take_rows(futr_df, np.arange(sizes.sum()) + offsets)
+            yield self._predict_series(
+                dataset=dataset._slice(start, end),
+                uids=chunk_uids,
+                last_dates=last_dates[start:end],
+                futr_df=chunk_futr_df,
+                stored=df is None,
+                level=level,
+                data_kwargs=data_kwargs,
+                scalers=self._slice_scalers(start, end),
+                cs_scores=None if level is None else self._cs_scores[:, start:end],
+            )
 
-        return fcsts_df
+    def _predict_cache_key(
+        self, df, static_df, futr_df, sort_df, level, data_kwargs
+    ) -> tuple:
+        if df is None:
+            data_key = _fingerprint(
+                self.dataset.temporal,
+                self.dataset.indptr,
+                self.dataset.static,
+                self.uids,
+                self.last_dates,
+            )
+        else:
+            data_key = _fingerprint(df, static_df)
+        return (
+            self._weights_version,
+            data_key,
+            _fingerprint(futr_df),
+            sort_df,
+            None if level is None else tuple(sorted(level)),
+            repr(sorted(data_kwargs.items())),
+        )
+
+    def cache_predictions(self, max_size: int = 8) -> None:
+        """Cache the forecasts of `predict`.
+
+        The calls to `predict` with the same data, `futr_df` and `level` as a cached one return a copy
+        of its forecasts instead of running the models. The cache is keyed on a hash of the contents of
+        the data, keeps the `max_size` most recently used forecasts and is emptied when the models
+        are fitted or the stored dataset is updated.
+
+        Parameters
+        ----------
+        max_size : int (default=8)
+            Maximum number of cached forecasts, 0 disables the cache.
+        """
+        self._predict_cache = _PredictCache(max_size) if max_size > 0 else None
+
+    def predict_cache_info(self) -> _PredictCacheInfo:
+        """Hits, misses, maximum size and current size of the `predict` cache."""
+        if self._predict_cache is None:
+            return _PredictCacheInfo(hits=0, misses=0, max_size=0, size=0)
+        return self._predict_cache.info()
+
+    def _invalidate_predict_cache(self) -> None:
+        # The cached forecasts and the encoder states depend on the weights of the models
+        # and on the stored dataset
+        self._weights_version += 1
+        if self._predict_cache is not None:
+            self._predict_cache.clear()
+        for model in self.models:
+            if model.STATEFUL_INFERENCE:
+                model.encoder_states = None
+
+    def update(self, df: DataFrame) -> None:
+        """Update the stored dataset with new observations.
+
+        Appends the rows of `df` right after the last stored date of their series, so that
+        `predict` without `df` forecasts from them. Only the new rows are processed and scaled
+        with the fitted local scalers, the stored history is copied once in a single scatter.
+
+        Parameters
+        ----------
+        df : pandas or polars DataFrame
+            DataFrame with columns [`unique_id`, `ds`, `y`] and the stored historic exogenous variables.
+            Every serie must be in the stored dataset, series without new observations can be omitted.
+            The observations of each serie must continue its stored dates at `freq`, without gaps.
+        """
+        if not isinstance(getattr(self, "dataset", None), TimeSeriesDataset):
+            raise ValueError(
+                "You must fit the model with a DataFrame or load a stored dataset before updating it."
+            )
+        validate_freq(df[self.time_col], self.freq)
+
+        # Match the stored temporal columns
+        temporal_cols = self.dataset.temporal_cols.tolist()
+        missing_cols = set(temporal_cols) - set(df.columns) - {"available_mask"}
+        if missing_cols:
+            raise ValueError(
+                f"The following columns are missing from `df`: {missing_cols}"
+            )
+        if "available_mask" not in df.columns:
+            df = ufp.assign_columns(df, "available_mask", 1.0)
+        df = df[[self.id_col, self.time_col] + temporal_cols]
+        self._check_nan(df, None, self.id_col, self.time_col, self.target_col)
+        new_dataset, new_uids, new_last_dates, new_ds = TimeSeriesDataset.from_df(
+            df=df,
+            sort_df=self.sort_df,
+            id_col=self.id_col,
+            time_col=self.time_col,
+            target_col=self.target_col,
+        )
+
+        # Position of the new series in the stored ones, both are sorted by id
+        uids_idxs = pd.Index(np.asarray(self.uids)).get_indexer(np.asarray(new_uids))
+        if (uids_idxs == -1).any():
+            raise ValueError(
+                "Found series that are not in the stored dataset, you must fit the model with them."
+            )
+        last_dates = np.asarray(self.last_dates).copy()
+        # Each date must be one step of freq after the previous one of its serie
+        prev_ds = np.roll(new_ds, 1)
+        prev_ds[new_dataset.indptr[:-1]] = last_dates[uids_idxs]
+        if isinstance(self.last_dates, pl_Series):
+            prev_ds = pl_Series(prev_ds)
+        else:
+            prev_ds = pd.Index(prev_ds)
+        if (np.asarray(ufp.offset_times(prev_ds, self.freq, 1)) != new_ds).any():
+            raise ValueError(
+                "The new observations must continue the stored dates of their serie at `freq`, "
+                "found gaps or dates that are already stored."
+            )
+        sizes = np.zeros(self.dataset.n_groups, dtype=np.int64)
+        sizes[uids_idxs] = np.diff(new_dataset.indptr)
+        futr_indptr = np.append(0, np.cumsum(sizes)).astype(self.dataset.indptr.dtype)
+
+        # Scale the new rows with the fitted statistics and append them
+        futr_dataset = TimeSeriesDataset(
+            temporal=new_dataset.temporal,
+            temporal_cols=self.dataset.temporal_cols.copy(),
+            indptr=futr_indptr,
+            max_size=sizes.max(),
+            min_size=sizes.min(),
+            y_idx=self.dataset.y_idx,
+        )
+        self._scalers_transform(futr_dataset)
+        curr_idxs, futr_idxs = TimeSeriesDataset._append_idxs(
+            self.dataset.indptr, futr_indptr
+        )
+        ds = np.empty(
+            len(curr_idxs) + len(futr_idxs), dtype=np.result_type(self.ds, new_ds)
+        )
+        ds[curr_idxs] = self.ds
+        ds[futr_idxs] = new_ds
+        last_dates[uids_idxs] = np.asarray(new_last_dates)
+
+        self.dataset = self.dataset.append(futr_dataset)
+        self.ds = ds
+        if isinstance(self.last_dates, pl_Series):
+            self.last_dates = pl_Series(self.time_col, last_dates)
+        else:
+            self.last_dates = pd.Index(last_dates, name=self.time_col)
+        self._invalidate_predict_cache()
 
     def _reset_models(self):
         self.models = [deepcopy(model) for model in self.models_init]
+        self._invalidate_predict_cache()
         if self._fitted:
             print("WARNING: Deleting previously fitted models.")
 
@@ -1134,6 +1703,151 @@ class NeuralForecast:
             fcsts_df = fcsts_df.set_index(id_col)
         return fcsts_df
 
+    def _refit_cross_validation(
+        self,
+        df: DataFrame,
+        static_df: Optional[DataFrame],
+        n_windows: int,
+        windows: range,
+        step_size: int,
+        val_size: Optional[int],
+        sort_df: bool,
+        verbose: bool,
+        refit: Union[bool, int],
+        id_col: str,
+        time_col: str,
+        target_col: str,
+        prediction_intervals: Optional[PredictionIntervals],
+        level: Optional[List[Union[int, float]]],
+        **data_kwargs,
+    ) -> List[DataFrame]:
+        """Fits and predicts the cross validation `windows`, which must start with a refit."""
+        splits = ufp.backtest_splits(
+            df,
+            n_windows=n_windows,
+            h=self.h,
+            id_col=id_col,
+            time_col=time_col,
+            freq=self.freq,
+            step_size=step_size,
+            input_size=None,
+        )
+        results = []
+        for i_window, (cutoffs, train, test) in islice(
+            enumerate(splits), windows.start, windows.stop
+        ):
+            should_fit = i_window == 0 or (refit > 0 and i_window % refit == 0)
+            if should_fit:
+                self.fit(
+                    df=train,
+                    static_df=static_df,
+                    val_size=val_size,
+                    sort_df=sort_df,
+                    use_init_models=False,
+                    verbose=verbose,
+                    id_col=id_col,
+                    time_col=time_col,
+                    target_col=target_col,
+                    prediction_intervals=prediction_intervals,
+                )
+                predict_df: Optional[DataFrame] = None
+            else:
+                predict_df = train
+            needed_futr_exog = self._get_needed_futr_exog()
+            if needed_futr_exog:
+                futr_df: Optional[DataFrame] = test
+            else:
+                futr_df = None
+            preds = self.predict(
+                df=predict_df,
+                static_df=static_df,
+                futr_df=futr_df,
+                sort_df=sort_df,
+                verbose=verbose,
+                level=level,
+                **data_kwargs,
+            )
+            preds = ufp.join(preds, cutoffs, on=id_col, how="left")
+            fold_result = ufp.join(
+                preds, test[[id_col, time_col, target_col]], on=[id_col, time_col]
+            )
+            results.append(fold_result)
+        return results
+
+    def _parallel_refit_cross_validation(
+        self,
+        n_jobs: int,
+        n_windows: int,
+        id_col: str,
+        time_col: str,
+        target_col: str,
+        **cv_kwargs,
+    ) -> List[DataFrame]:
+        """Runs the refits of the models in a pool of processes, one model per process."""
+        # Each worker sees a single model, so it gets the name the model has here
+        model_names = _unique_model_names(self.models)
+        worker_state = dict(
+            models=self.models,
+            freq=self.freq,
+            local_scaler_type=self.local_scaler_type,
+            cv_kwargs=dict(
+                n_windows=n_windows,
+                windows=range(n_windows),
+                id_col=id_col,
+                time_col=time_col,
+                target_col=target_col,
+                **cv_kwargs,
+            ),
+        )
+        # The data is sent once per worker instead of with every task
+        n_workers = min(n_jobs, len(self.models))
+        with _process_pool(n_workers, worker_state) as executor:
+            model_results, nfs = zip(
+                *executor.map(
+                    _cross_validation_worker, range(len(self.models)), model_names
+                )
+            )
+
+        # Leave the models and the stored dataset as the serial path does
+        self.models = [nf.models[0] for nf in nfs]
+        for attr in [
+            "dataset",
+            "uids",
+            "last_dates",
+            "ds",
+            "scalers_",
+            "sort_df",
+            "id_col",
+            "time_col",
+            "target_col",
+        ]:
+            setattr(self, attr, getattr(nfs[0], attr))
+        self.prediction_intervals = nfs[0].prediction_intervals
+        if self.prediction_intervals is not None:
+            self._cs_scores = np.concatenate(
+                [nf._cs_scores for nf in nfs if nf._cs_scores is not None]
+            )
+        self._fitted = True
+        self._invalidate_predict_cache()
+
+        # Put the forecasts of every model of a window side by side, in the serial order,
+        # where the intervals of all the models follow their forecasts
+        shared_cols = [id_col, time_col, "cutoff", target_col]
+        fcst_cols = shared_cols + self._get_model_names()
+        results = []
+        for window_results in zip(*model_results):
+            model_fcsts = [
+                ufp.drop_columns(res, shared_cols) for res in window_results[1:]
+            ]
+            fcsts = ufp.horizontal_concat([window_results[0], *model_fcsts])
+            interval_cols = [col for col in fcsts.columns if col not in fcst_cols]
+            results.append(
+                fcsts[
+                    [col for col in fcsts.columns if col in fcst_cols] + interval_cols
+                ]
+            )
+        return results
+
     def cross_validation(
         self,
         df: Optional[DataFrame] = None,
@@ -1151,6 +1865,8 @@ class NeuralForecast:
         target_col: str = "y",
         prediction_intervals: Optional[PredictionIntervals] = None,
         level: Optional[List[Union[int, float]]] = None,
+        refit_steps: Optional[int] = None,
+        n_jobs: int = 1,
         **data_kwargs,
     ) -> DataFrame:
         """Temporal Cross-Validation with core.NeuralForecast.
@@ -1193,6 +1909,15 @@ class NeuralForecast:
             Configuration to calibrate prediction intervals (Conformal Prediction).
         level : list of ints or floats, optional (default=None)
             Confidence levels between 0 and 100. Use with prediction_intervals.
+        refit_steps : int, optional (default=None)
+            Number of training steps of each refit after the first one. If passed, the refits
+            warm-start from the weights and optimizer state of the previous one instead of
+            training for `max_steps`. Requires `refit!=False`.
+        n_jobs : int (default=1)
+            Number of processes used to run the refits of the models in parallel, with the
+            torch threads split between them. Requires `refit!=False`. Each process refits one
+            model over all the windows, continuing from its previous refit as with `n_jobs=1`,
+            so at most one process per model is used and the results match the serial ones.
         data_kwargs : kwargs
             Extra arguments to be passed to the dataset within each model.
 
@@ -1214,6 +1939,9 @@ class NeuralForecast:
         else:
             raise Exception("you must define `n_windows` or `test_size` but not both")
 
+        # The stored dataset and the models are replaced
+        self._invalidate_predict_cache()
+
         # Recover initial model if use_init_models.
         if use_init_models:
             self._reset_models()
@@ -1236,6 +1964,16 @@ class NeuralForecast:
                     "Passing prediction_intervals and/or level is only supported with refit=True."
                 )
 
+        if refit_steps is not None and not refit:
+            raise Exception("Passing refit_steps is only supported with refit!=False.")
+        if n_jobs > 1:
+            if not refit:
+                raise Exception("Passing n_jobs>1 is only supported with refit!=False.")
+            if refit_steps is not None:
+                raise Exception(
+                    "Warm-started refits with refit_steps run sequentially, set n_jobs=1."
+                )
+
         if not refit:
 
             return self._no_refit_cross_validation(
@@ -1255,54 +1993,32 @@ class NeuralForecast:
         if df is None:
             raise ValueError("Must specify `df` with `refit!=False`.")
         validate_freq(df[time_col], self.freq)
-        splits = ufp.backtest_splits(
-            df,
+        cv_kwargs = dict(
+            df=df,
+            static_df=static_df,
             n_windows=n_windows,
-            h=self.h,
+            step_size=step_size,
+            val_size=val_size,
+            sort_df=sort_df,
+            verbose=verbose,
+            refit=refit,
             id_col=id_col,
             time_col=time_col,
-            freq=self.freq,
-            step_size=step_size,
-            input_size=None,
+            target_col=target_col,
+            prediction_intervals=prediction_intervals,
+            level=level,
+            **data_kwargs,
         )
-        results = []
-        for i_window, (cutoffs, train, test) in enumerate(splits):
-            should_fit = i_window == 0 or (refit > 0 and i_window % refit == 0)
-            if should_fit:
-                self.fit(
-                    df=train,
-                    static_df=static_df,
-                    val_size=val_size,
-                    sort_df=sort_df,
-                    use_init_models=False,
-                    verbose=verbose,
-                    id_col=id_col,
-                    time_col=time_col,
-                    target_col=target_col,
-                    prediction_intervals=prediction_intervals,
+        if n_jobs > 1:
+            results = self._parallel_refit_cross_validation(n_jobs=n_jobs, **cv_kwargs)
+        else:
+            with ExitStack() as stack:
+                if refit_steps is not None:
+                    for model in self.models:
+                        stack.enter_context(model._warm_start(refit_steps))
+                results = self._refit_cross_validation(
+                    windows=range(n_windows), **cv_kwargs
                 )
-                predict_df: Optional[DataFrame] = None
-            else:
-                predict_df = train
-            needed_futr_exog = self._get_needed_futr_exog()
-            if needed_futr_exog:
-                futr_df: Optional[DataFrame] = test
-            else:
-                futr_df = None
-            preds = self.predict(
-                df=predict_df,
-                static_df=static_df,
-                futr_df=futr_df,
-                sort_df=sort_df,
-                verbose=verbose,
-                level=level,
-                **data_kwargs,
-            )
-            preds = ufp.join(preds, cutoffs, on=id_col, how="left")
-            fold_result = ufp.join(
-                preds, test[[id_col, time_col, target_col]], on=[id_col, time_col]
-            )
-            results.append(fold_result)
         out = ufp.vertical_concat(results, match_categories=False)
         out = ufp.drop_index_if_pandas(out)
         # match order of cv with no refit
@@ -1370,16 +2086,10 @@ class NeuralForecast:
             trimmed_dataset = TimeSeriesDataset.trim_dataset(
                 dataset=self.dataset, right_trim=test_size, left_trim=forefront_offset
             )
-            new_idxs = np.hstack(
-                [
-                    np.arange(
-                        self.dataset.indptr[i] + forefront_offset,
-                        self.dataset.indptr[i + 1] - test_size,
-                    )
-                    for i in range(self.dataset.n_groups)
-                ]
+            keep = TimeSeriesDataset._trim_mask(
+                self.dataset.indptr, left_trim=forefront_offset, right_trim=test_size
             )
-            times = self.ds[new_idxs]
+            times = self.ds[keep]
         else:
             trimmed_dataset = self.dataset
             times = self.ds
@@ -1441,7 +2151,6 @@ class NeuralForecast:
             fcsts_df = fcsts_df.set_index(self.id_col)
         return fcsts_df
 
-    # Save list of models with pytorch lightning save_checkpoint function
     def save(
         self,
         path: str,
@@ -1455,6 +2164,12 @@ class NeuralForecast:
         Note that by default the `models` are not saving training checkpoints to save disk memory,
         to get them change the individual model `**trainer_kwargs` to include `enable_checkpointing=True`.
 
+        The directory is written in a versioned format: `config.json` with the configuration,
+        one `.safetensors` file with the weights and JSON-serializable hyperparameters of each model,
+        along with a `.pkl` file with the rest of them, and `.npy` files with the conformity scores and
+        the ids and dates of the series, so that `NeuralForecast.load` can memory-map the weights
+        and read only the models it needs.
+
         Parameters
         ----------
         path : str
@@ -1462,7 +2177,8 @@ class NeuralForecast:
         model_index : list, optional (default=None)
             List to specify which models from list of self.models to save.
         save_dataset : bool (default=True)
-            Whether to save dataset or not.
+            Whether to save dataset or not. It is written as `.npy` files in `path/dataset`,
+            which `NeuralForecast.load` memory-maps.
         overwrite : bool (default=False)
             Whether to overwrite files or not.
         """
@@ -1493,19 +2209,23 @@ class NeuralForecast:
 
         # Save models
         count_names = {"model": 0}
-        alias_to_model = {}
+        models_config = []
         for i, model in enumerate(self.models):
             # Skip model if not in list
             if i not in model_index:
                 continue
 
             model_name = repr(model)
-            model_class_name = model.__class__.__name__.lower()
-            alias_to_model[model_name] = model_class_name
             count_names[model_name] = count_names.get(model_name, -1) + 1
-            model.save(f"{path}/{model_name}_{count_names[model_name]}.ckpt")
-        with fsspec.open(f"{path}/alias_to_model.pkl", "wb") as f:
-            pickle.dump(alias_to_model, f)
+            model_file = f"{model_name}_{count_names[model_name]}.safetensors"
+            model.save(f"{path}/{model_file}")
+            models_config.append(
+                {
+                    "alias": model_name,
+                    "class": model.__class__.__name__.lower(),
+                    "file": model_file,
+                }
+            )
 
         # Save dataset
         if save_dataset and hasattr(self, "dataset"):
@@ -1515,50 +2235,77 @@ class NeuralForecast:
                     "You can set `save_dataset=False` and use the `df` argument in the predict method after loading "
                     "this model to use it for inference."
                 )
-            with fsspec.open(f"{path}/dataset.pkl", "wb") as f:
-                pickle.dump(self.dataset, f)
+            self.dataset.save(f"{path}/dataset")
+            for attr in ["uids", "last_dates", "ds"]:
+                with fsspec.open(f"{path}/{attr}.npy", "wb") as f:
+                    np.save(f, _index_to_numpy(getattr(self, attr)))
         elif save_dataset:
             raise Exception(
                 "You need to have a stored dataset to save it, \
                              set `save_dataset=False` to skip saving dataset."
             )
 
-        # Save configuration and parameters
+        # Save conformity scores [model, series, window, h] and local scalers
+        cs_model_names = None
+        if self._cs_scores is not None:
+            cs_model_names = self._get_model_names(add_level=True)
+            with fsspec.open(f"{path}/conformity_scores.npy", "wb") as f:
+                np.save(f, self._cs_scores)
+        if self.scalers_:
+            with fsspec.open(f"{path}/scalers.pkl", "wb") as f:
+                pickle.dump(self.scalers_, f)
+
+        # Save configuration
+        prediction_intervals = None
+        if self.prediction_intervals is not None:
+            prediction_intervals = {
+                "n_windows": self.prediction_intervals.n_windows,
+                "method": self.prediction_intervals.method,
+            }
         config_dict = {
+            "format_version": _SAVE_FORMAT_VERSION,
             "h": self.h,
-            "freq": self.freq,
+            "freq": getattr(self.freq, "freqstr", self.freq),
             "sort_df": self.sort_df,
             "_fitted": self._fitted,
             "local_scaler_type": self.local_scaler_type,
-            "scalers_": self.scalers_,
             "id_col": self.id_col,
             "time_col": self.time_col,
             "target_col": self.target_col,
-            "prediction_intervals": self.prediction_intervals,
-            "_cs_df": self._cs_df,  # conformity score
+            "prediction_intervals": prediction_intervals,
+            "conformity_scores": cs_model_names,
+            "models": models_config,
         }
         if save_dataset:
-            config_dict.update(
-                {
-                    "uids": self.uids,
-                    "last_dates": self.last_dates,
-                    "ds": self.ds,
-                }
-            )
-
-        with fsspec.open(f"{path}/configuration.pkl", "wb") as f:
-            pickle.dump(config_dict, f)
+            config_dict["polars"] = isinstance(self.uids, pl_Series)
+        with fsspec.open(f"{path}/config.json", "w") as f:
+            json.dump(config_dict, f, indent=2)
 
     @staticmethod
-    def load(path, verbose=False, **kwargs):
+    def load(
+        path, verbose=False, mmap_dataset=True, models=None, mmap_weights=True, **kwargs
+    ):
         """Load NeuralForecast
 
         `core.NeuralForecast`'s method to load checkpoint from path.
 
+        The directory contains pickles, such as the hyperparameters of the models that are not
+        JSON-serializable and the local scalers, so only load directories from trusted sources.
+
         Parameters
         -----------
         path : str
             Directory with stored artifacts.
+        verbose : bool (default=False)
+            Whether to print the loading progress.
+        mmap_dataset : bool (default=True)
+            Whether to memory-map the stored dataset instead of reading it into memory.
+            Only applies to local paths.
+        models : list of str, optional (default=None)
+            Aliases of the models to load. If None, all the stored models are loaded.
+        mmap_weights : bool (default=True)
+            Whether to memory-map the weights of the models instead of reading them into memory.
+            Only applies to local paths written by the current version of `NeuralForecast.save`.
         kwargs
             Additional keyword arguments to be passed to the function
             `load_from_checkpoint`.
@@ -1573,59 +2320,67 @@ class NeuralForecast:
             path = path[:-1]
 
         fs, _, _ = fsspec.get_fs_token_paths(path)
-        files = [f.split("/")[-1] for f in fs.ls(path) if fs.isfile(f)]
+
+        if verbose:
+            print(10 * "-" + " Loading configuration " + 10 * "-")
+        if fs.exists(f"{path}/config.json"):
+            config_dict = _read_config(path, fs)
+        else:
+            # Directories saved by previous versions
+            config_dict = _read_legacy_config(path, fs)
+        if verbose:
+            print("Configuration loaded.")
 
         # Load models
-        models_ckpt = [f for f in files if f.endswith(".ckpt")]
-        if len(models_ckpt) == 0:
+        models_config = config_dict["models"]
+        if len(models_config) == 0:
             raise Exception("No model found in directory.")
+        if models is not None:
+            missing = set(models) - {model["alias"] for model in models_config}
+            if missing:
+                raise ValueError(
+                    f"The following models were not found in the directory: {sorted(missing)}"
+                )
+            models_config = [
+                model for model in models_config if model["alias"] in models
+            ]
 
         if verbose:
             print(10 * "-" + " Loading models " + 10 * "-")
-        models = []
-        try:
-            with fsspec.open(f"{path}/alias_to_model.pkl", "rb") as f:
-                alias_to_model = pickle.load(f)
-        except FileNotFoundError:
-            alias_to_model = {}
-        for model in models_ckpt:
-            model_name = "_".join(model.split("_")[:-1])
-            model_class_name = alias_to_model.get(model_name, model_name)
-            loaded_model = MODEL_FILENAME_DICT[model_class_name].load(
-                f"{path}/{model}", **kwargs
+        loaded_models = []
+        for model_config in models_config:
+            loaded_model = MODEL_FILENAME_DICT[model_config["class"]].load(
+                f"{path}/{model_config['file']}",
+                mmap=mmap_weights,
+                allow_pickle=True,
+                **kwargs,
             )
-            loaded_model.alias = model_name
-            models.append(loaded_model)
+            loaded_model.alias = model_config["alias"]
+            loaded_models.append(loaded_model)
             if verbose:
-                print(f"Model {model_name} loaded.")
+                print(f"Model {model_config['alias']} loaded.")
 
         if verbose:
             print(10 * "-" + " Loading dataset " + 10 * "-")
         # Load dataset
-        try:
+        if fs.exists(f"{path}/dataset/metadata.pkl"):
+            dataset = TimeSeriesDataset.load(f"{path}/dataset", mmap=mmap_dataset)
+            if verbose:
+                print("Dataset loaded.")
+        elif fs.exists(f"{path}/dataset.pkl"):
+            # Directories saved by previous versions
             with fsspec.open(f"{path}/dataset.pkl", "rb") as f:
                 dataset = pickle.load(f)
             if verbose:
                 print("Dataset loaded.")
-        except FileNotFoundError:
+        else:
             dataset = None
             if verbose:
                 print("No dataset found in directory.")
 
-        if verbose:
-            print(10 * "-" + " Loading configuration " + 10 * "-")
-        # Load configuration
-        try:
-            with fsspec.open(f"{path}/configuration.pkl", "rb") as f:
-                config_dict = pickle.load(f)
-            if verbose:
-                print("Configuration loaded.")
-        except FileNotFoundError:
-            raise Exception("No configuration found in directory.")
-
         # Create NeuralForecast object
         neuralforecast = NeuralForecast(
-            models=models,
+            models=loaded_models,
             freq=config_dict["freq"],
             local_scaler_type=config_dict["local_scaler_type"],
         )
@@ -1633,9 +2388,24 @@ class NeuralForecast:
         for attr in ["id_col", "time_col", "target_col"]:
             setattr(neuralforecast, attr, config_dict[attr])
         # only restore attribute if available
-        for attr in ["prediction_intervals", "_cs_df"]:
-            if attr in config_dict.keys():
-                setattr(neuralforecast, attr, config_dict[attr])
+        if "prediction_intervals" in config_dict.keys():
+            neuralforecast.prediction_intervals = config_dict["prediction_intervals"]
+        # the models may be loaded in a different order or only partially
+        model_names = neuralforecast._get_model_names(add_level=True)
+        if config_dict.get("_cs_scores", None) is not None:
+            neuralforecast._cs_scores = np.stack(
+                [config_dict["_cs_scores"][model] for model in model_names]
+            )
+        # conformity scores saved as a DataFrame by previous versions
+        elif config_dict.get("_cs_df", None) is not None:
+            n_windows = config_dict["prediction_intervals"].n_windows
+            neuralforecast._cs_scores = _scores_from_df(
+                config_dict["_cs_df"],
+                model_names=model_names,
+                cs_n_windows=n_windows,
+                n_series=config_dict["_cs_df"].shape[0]
+                // (n_windows * neuralforecast.h),
+            )
 
         # Dataset
         if dataset is not None:
@@ -1663,8 +2433,8 @@ class NeuralForecast:
         time_col: str,
         target_col: str,
         static_df: Optional[DataFrame],
-    ) -> DataFrame:
-        """Compute conformity scores.
+    ) -> np.ndarray:
+        """Compute conformity scores as an array [model, series, window, h].
 
         We need at least two cross validation errors to compute
         quantiles for prediction intervals (`n_windows=2`, specified by self.prediction_intervals).
@@ -1700,13 +2470,126 @@ class NeuralForecast:
             target_col=target_col,
         )
 
-        kept = [time_col, id_col, "cutoff"]
-        # conformity score for each model
-        for model in self._get_model_names(add_level=True):
-            kept.append(model)
+        # absolute errors of each model, the cross validation is sorted by serie, window and time
+        model_names = self._get_model_names(add_level=True)
+        fcsts = np.stack([cv_results[model].to_numpy() for model in model_names])
+        scores = np.abs(fcsts - cv_results[target_col].to_numpy()).astype(np.float32)
+        return scores.reshape(
+            len(model_names), -1, self.prediction_intervals.n_windows, self.h
+        )
+
+# %% ../nbs/core.ipynb 12
+_worker_state: Dict[str, Any] = {}
+
+
+def _worker_init(state: Dict[str, Any], num_threads: int) -> None:
+    torch.set_num_threads(num_threads)
+    _worker_state.update(state)
+
+
+def _process_pool(n_jobs: int, state: Dict[str, Any]) -> ProcessPoolExecutor:
+    """Spawned processes that receive `state` once and split the torch threads between them."""
+    return ProcessPoolExecutor(
+        max_workers=n_jobs,
+        mp_context=mp.get_context("spawn"),
+        initializer=_worker_init,
+        initargs=(state, max(1, torch.get_num_threads() // n_jobs)),
+    )
+
+
+def _fit_worker(model: Any) -> Any:
+    return model.fit(_worker_state["dataset"], val_size=_worker_state["val_size"])
+
 
-            # compute absolute error for each model
-            abs_err = abs(cv_results[model] - cv_results[target_col])
-            cv_results = ufp.assign_columns(cv_results, model, abs_err)
-        dropped = list(set(cv_results.columns) - set(kept))
-        return ufp.drop_columns(cv_results, dropped)
+def _cross_validation_worker(
+    model_idx: int, model_name: str
+) -> Tuple[List[DataFrame], "NeuralForecast"]:
+    state = _worker_state
+    model = state["models"][model_idx]
+    alias = model.alias
+    model.alias = model_name
+    nf = NeuralForecast(
+        models=[model],
+        freq=state["freq"],
+        local_scaler_type=state["local_scaler_type"],
+    )
+    results = nf._refit_cross_validation(**state["cv_kwargs"])
+    nf.models[0].alias = alias
+    return results, nf
+
+# %% ../nbs/core.ipynb 13
+_SAVE_FORMAT_VERSION = 1
+
+
+def _index_to_numpy(values) -> np.ndarray:
+    """Ids and dates as an array that can be read without unpickling whenever possible."""
+    values = np.asarray(values)
+    if values.dtype == object and all(isinstance(v, str) for v in values):
+        values = values.astype(str)
+    return values
+
+
+def _read_config(path: str, fs) -> Dict[str, Any]:
+    with fsspec.open(f"{path}/config.json", "r") as f:
+        config_dict = json.load(f)
+    if config_dict["format_version"] > _SAVE_FORMAT_VERSION:
+        raise ValueError(
+            f"The directory was saved with format version {config_dict['format_version']}, "
+            f"this version of neuralforecast can only load up to version {_SAVE_FORMAT_VERSION}."
+        )
+    if config_dict["prediction_intervals"] is not None:
+        config_dict["prediction_intervals"] = PredictionIntervals(
+            **config_dict["prediction_intervals"]
+        )
+    config_dict["_cs_scores"] = None
+    if config_dict["conformity_scores"] is not None:
+        with fsspec.open(f"{path}/conformity_scores.npy", "rb") as f:
+            cs_scores = np.load(f)
+        config_dict["_cs_scores"] = dict(
+            zip(config_dict["conformity_scores"], cs_scores)
+        )
+    config_dict["scalers_"] = {}
+    if fs.exists(f"{path}/scalers.pkl"):
+        with fsspec.open(f"{path}/scalers.pkl", "rb") as f:
+            config_dict["scalers_"] = pickle.load(f)
+    if fs.exists(f"{path}/uids.npy"):
+        arrays = {}
+        for attr in ["uids", "last_dates", "ds"]:
+            with fsspec.open(f"{path}/{attr}.npy", "rb") as f:
+                arrays[attr] = np.load(f, allow_pickle=True)
+        if config_dict["polars"]:
+            uids = pl_Series(config_dict["id_col"], arrays["uids"])
+            last_dates = pl_Series(config_dict["time_col"], arrays["last_dates"])
+        else:
+            uids = pd.Series(arrays["uids"], name=config_dict["id_col"])
+            last_dates = pd.Index(arrays["last_dates"], name=config_dict["time_col"])
+        config_dict.update(uids=uids, last_dates=last_dates, ds=arrays["ds"])
+    return config_dict
+
+
+def _read_legacy_config(path: str, fs) -> Dict[str, Any]:
+    """Configuration of a directory saved by previous versions, with one torch checkpoint per model."""
+    try:
+        with fsspec.open(f"{path}/configuration.pkl", "rb") as f:
+            config_dict = pickle.load(f)
+    except FileNotFoundError:
+        raise Exception("No configuration found in directory.")
+    try:
+        with fsspec.open(f"{path}/alias_to_model.pkl", "rb") as f:
+            alias_to_model = pickle.load(f)
+    except FileNotFoundError:
+        alias_to_model = {}
+    files = [f.split("/")[-1] for f in fs.ls(path) if fs.isfile(f)]
+    config_dict["models"] = []
+    for model_file in files:
+        if not model_file.endswith(".ckpt"):
+            continue
+        model_name = "_".join(model_file.split("_")[:-1])
+        config_dict["models"].append(
+            {
+                "alias": model_name,
+                "class": alias_to_model.get(model_name, model_name),
+                "file": model_file,
+            }
+        )
+    return config_dict
@@ -1097,6 +1097,11 @@ class ISQF(TransformedDistribution):
         p = self.base_dist.crps(z)
         return p * scale
 
+    @property
+    def mean(self) -> torch.Tensor:
+        t = self.transforms[0]
+        return t.loc + t.scale * self.base_dist.mean
+
 
 class BaseISQF(Distribution):
     """
@@ -1302,6 +1307,23 @@ class BaseISQF(Distribution):
 
         return tail_a, tail_b
 
+    @property
+    def mean(self) -> torch.Tensor:
+        # Integral of the quantile function over [0, 1], the spline pieces are
+        # linear in alpha and the exponential tails integrate in closed form
+        def tail_integral(tail_a, tail_b, width):
+            return tail_a * (width * torch.log(width) - width) + tail_b * width
+
+        left = tail_integral(self.tail_al, self.tail_bl, self.qk_x_l)
+        right = tail_integral(self.tail_ar, self.tail_br, 1 - self.qk_x_r)
+        sk_y = (
+            self.qk_y.unsqueeze(dim=-1)
+            + torch.cumsum(self.delta_sk_y, dim=-1)
+            - self.delta_sk_y
+        )
+        spline = torch.sum(self.delta_sk_x * (sk_y + self.delta_sk_y / 2), dim=(-2, -1))
+        return left + spline + right
+
     def quantile(self, alpha: torch.Tensor) -> torch.Tensor:
         return self.quantile_internal(alpha, dim=0)
 
@@ -1830,6 +1852,86 @@ def isqf_scale_decouple(output, loc=None, scale=None):
     return (spline_knots, spline_heights, beta_l, beta_r, qk_y, qk_x_repeat, loc, scale)
 
 # %% ../../nbs/losses.pytorch.ipynb 68
+def student_t_icdf(q: torch.Tensor, df: torch.Tensor):
+    """Student T Inverse CDF
+    Hill's (1970) approximation to the quantiles of the standard StudentT,
+    accurate to float32 precision for the `df > 3` of `student_scale_decouple`.
+
+    **References:**<br>
+    - [Hill, G. W. (1970). Algorithm 396: Student's t-quantiles. Communications of the ACM, 13(10), 619-620.](https://dl.acm.org/doi/10.1145/355598.355600)<br>
+    """
+    p = 2 * torch.minimum(q, 1 - q)
+    a = 1 / (df - 0.5)
+    b = 48 / (a * a)
+    c = ((20700 * a / b - 98) * a - 16) * a + 96.36
+    d = ((94.5 / (b + c) - 3) / b + 1) * torch.sqrt(a * math.pi / 2) * df
+    y = (d * p) ** (2 / df)
+
+    # Tails, asymptotic expansion around the Normal quantile
+    x = torch.special.ndtri(0.5 * p)
+    x2 = x * x
+    c = torch.where(df < 5, c + 0.3 * (df - 4.5) * (x + 0.6), c)
+    c = (((0.05 * d * x - 5) * x - 7) * x - 2) * x + b + c
+    y_tail = (((((0.4 * x2 + 6.3) * x2 + 36) * x2 + 94.5) / c - x2 - 3) / b + 1) * x
+    y_tail = torch.expm1(a * y_tail * y_tail)
+
+    # Center
+    y_center = (
+        (
+            1 / (((df + 6) / (df * y) - 0.089 * d - 0.822) * (df + 2) * 3)
+            + 0.5 / (df + 4)
+        )
+        * y
+        - 1
+    ) * (df + 1) / (df + 2) + 1 / y
+
+    t = torch.sqrt(df * torch.where(y > 0.05 + a, y_tail, y_center))
+    return torch.where(q < 0.5, -t, t)
+
+
+def bisect_quantiles(
+    cdf,
+    q: torch.Tensor,
+    low: torch.Tensor,
+    high: torch.Tensor,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+):
+    """Vectorized bisection of a continuous `cdf` for the quantiles `q`,
+    `low` and `high` bracket the solutions, `cdf(low) <= q <= cdf(high)`."""
+    for _ in range(max_iter):
+        mid = (low + high) / 2
+        below = cdf(mid) < q
+        low = torch.where(below, mid, low)
+        high = torch.where(below, high, mid)
+        if not torch.any(high - low > tol * (1 + torch.abs(mid))):
+            break
+    return (low + high) / 2
+
+
+def bisect_count_quantiles(
+    cdf, q: torch.Tensor, high: torch.Tensor, max_iter: int = 64
+):
+    """Vectorized bisection of the `cdf` of a counts distribution, returns
+    the smallest integer `k >= 0` with `cdf(k) >= q`. `high` is a first guess of
+    the upper end of the bracket, doubled until it contains the quantiles."""
+    high = torch.ceil(high)
+    for _ in range(max_iter):
+        below = cdf(high) < q
+        if not torch.any(below):
+            break
+        high = torch.where(below, 2 * high + 1, high)
+    low = torch.full_like(high, -1)
+    active = high - low > 1
+    while torch.any(active):
+        mid = torch.floor((low + high) / 2)
+        below = cdf(mid.clamp(min=0)) < q
+        low = torch.where(active & below, mid, low)
+        high = torch.where(active & ~below, mid, high)
+        active = high - low > 1
+    return high
+
+# %% ../../nbs/losses.pytorch.ipynb 69
 class DistributionLoss(torch.nn.Module):
     """DistributionLoss
 
@@ -1856,7 +1958,8 @@ class DistributionLoss(torch.nn.Module):
     `level`: float list [0,100], confidence levels for prediction intervals.<br>
     `quantiles`: float list [0,1], alternative to level list, target quantiles.<br>
     `num_samples`: int=500, number of samples for the empirical quantiles.<br>
-    `return_params`: bool=False, wether or not return the Distribution parameters.<br><br>
+    `return_params`: bool=False, wether or not return the Distribution parameters.<br>
+    `quantile_method`: str='sample', 'sample' for empirical quantiles or 'analytic' to compute them from the inverse CDF, see `get_quantiles`.<br><br>
 
     **References:**<br>
     - [PyTorch Probability Distributions Package: StudentT.](https://pytorch.org/docs/stable/distributions.html#studentt)<br>
@@ -1873,6 +1976,7 @@ class DistributionLoss(torch.nn.Module):
         quantiles=None,
         num_samples=1000,
         return_params=False,
+        quantile_method="sample",
         **distribution_kwargs,
     ):
         super(DistributionLoss, self).__init__()
@@ -1935,12 +2039,17 @@ class DistributionLoss(torch.nn.Module):
         assert (
             distribution in available_distributions.keys()
         ), f"{distribution} not available"
+        assert quantile_method in [
+            "sample",
+            "analytic",
+        ], f"quantile_method {quantile_method} not available"
         self.distribution = distribution
         self._base_distribution = available_distributions[distribution]
         self.domain_map = domain_maps[distribution]
         self.scale_decouple = scale_decouples[distribution]
         self.distribution_kwargs = distribution_kwargs
         self.num_samples = num_samples
+        self.quantile_method = quantile_method
         self.param_names = param_names[distribution]
 
         # If True, predict_step will return Distribution's parameters
@@ -2011,6 +2120,59 @@ class DistributionLoss(torch.nn.Module):
 
         return samples, sample_mean, quants
 
+    def get_quantiles(self, distr_args: torch.Tensor):
+        """
+        Construct the mean and the quantiles defined by `levels` of the estimated
+        Distribution. With `quantile_method='analytic'` Normal, StudentT and ISQF
+        evaluate their inverse CDF, Poisson bisects its CDF and Bernoulli compares
+        against its probability, the remaining distributions use `sample`.
+
+        **Parameters**<br>
+        `distr_args`: Constructor arguments for the underlying Distribution type.<br>
+
+        **Returns**<br>
+        `mean`: tensor, shape [B,H,1].<br>
+        `quantiles`: tensor, quantiles defined by `levels`, shape [B,H,Q].<br>
+        """
+        # Losses pickled before quantile_method existed sample
+        if getattr(
+            self, "quantile_method", "sample"
+        ) == "sample" or self.distribution in ["NegativeBinomial", "Tweedie"]:
+            _, sample_mean, quants = self.sample(distr_args=distr_args)
+            return sample_mean, quants
+
+        # Quantile levels in the first dimension broadcast against [B,H]
+        batch = distr_args[0].shape[:2]
+        q = self.quantiles.to(distr_args[0]).view(-1, 1, 1).expand(-1, *batch)
+        if self.distribution == "Normal":
+            loc, scale = distr_args
+            mean = loc
+            quants = loc + scale * torch.special.ndtri(q)
+        elif self.distribution == "StudentT":
+            df, loc, scale = distr_args
+            mean = loc
+            quants = loc + scale * student_t_icdf(q, df)
+        elif self.distribution == "Poisson":
+            rate = distr_args[0]
+            mean = rate
+            quants = bisect_count_quantiles(
+                cdf=lambda k: torch.special.gammaincc(k + 1, rate),
+                q=q,
+                high=rate.expand_as(q),
+            )
+        elif self.distribution == "Bernoulli":
+            probs = distr_args[0]
+            mean = probs
+            quants = (q > 1 - probs).to(probs)
+        elif self.distribution == "ISQF":
+            distr = self.get_distribution(
+                distr_args=distr_args, **self.distribution_kwargs
+            )
+            mean = distr.mean
+            quants = distr.transforms[0](distr.base_dist.quantile(q))
+
+        return mean.unsqueeze(-1), quants.permute(1, 2, 0)
+
     def __call__(
         self,
         y: torch.Tensor,
@@ -2044,7 +2206,85 @@ class DistributionLoss(torch.nn.Module):
         loss_weights = mask
         return weighted_average(loss_values, weights=loss_weights)
 
-# %% ../../nbs/losses.pytorch.ipynb 74
+# %% ../../nbs/losses.pytorch.ipynb 77
+def weighted_quantiles(values: torch.Tensor, weights: torch.Tensor, q: torch.Tensor):
+    """Linearly interpolated quantiles `q` of sorted `values`, shape [N,M], where each
+    value stands for `weights` consecutive samples. Matches `torch.quantile` for unit weights.
+    """
+    # Rank of each value at the middle of the samples it stands for
+    cum_weights = torch.cumsum(weights, dim=-1)
+    ranks = cum_weights - (weights + 1) / 2
+    targets = q * (cum_weights[..., -1:] - 1)
+    upper = torch.searchsorted(ranks, targets).clamp(1, values.shape[-1] - 1)
+    lower = upper - 1
+    rank_lower, rank_upper = ranks.gather(-1, lower), ranks.gather(-1, upper)
+    frac = ((targets - rank_lower) / (rank_upper - rank_lower)).clamp(0, 1)
+    value_lower, value_upper = values.gather(-1, lower), values.gather(-1, upper)
+    return value_lower + frac * (value_upper - value_lower)
+
+
+def chunked_sample_quantiles(
+    sample_fn, q: torch.Tensor, num_samples: int, chunk_size: int
+):
+    """Running mean and streaming quantiles `q` of `num_samples` draws of
+    `sample_fn(n)`, shape [N,n], drawn `chunk_size` at a time.
+
+    After every chunk the draws seen so far are compacted into `chunk_size`
+    equally weighted order statistics, so the peak memory is set by `chunk_size`."""
+    mean = None
+    summary = summary_weights = None
+    count = 0
+    for start in range(0, num_samples, chunk_size):
+        n = min(chunk_size, num_samples - start)
+        samples = sample_fn(n)
+        chunk_mean = samples.mean(dim=-1, keepdim=True)
+        mean = (
+            chunk_mean if mean is None else mean + (chunk_mean - mean) * n / (count + n)
+        )
+        count += n
+
+        weights = torch.ones_like(samples)
+        if summary is not None:
+            samples = torch.cat([summary, samples], dim=-1)
+            weights = torch.cat([summary_weights, weights], dim=-1)
+        samples, order = torch.sort(samples, dim=-1)
+        weights = weights.gather(-1, order)
+        if count >= num_samples:
+            break
+
+        # Order statistics at the middle of chunk_size equally sized groups
+        groups = (torch.arange(chunk_size, device=samples.device) + 0.5) / chunk_size
+        groups = groups.to(samples).expand(samples.shape[0], -1)
+        summary = weighted_quantiles(values=samples, weights=weights, q=groups)
+        summary_weights = torch.full_like(summary, count / chunk_size)
+
+    quants = weighted_quantiles(
+        values=samples, weights=weights, q=q.to(samples).expand(samples.shape[0], -1)
+    )
+    return mean, quants
+
+
+def mixture_sample_quantiles(mixture, distr_args):
+    """Mean and empirical quantiles of a mixture loss, its samples are
+    drawn `sample_chunk_size` at a time when it is set."""
+    # Losses pickled before sample_chunk_size existed draw all the samples
+    chunk_size = getattr(mixture, "sample_chunk_size", None)
+    if chunk_size is None:
+        _, sample_mean, quants = mixture.sample(distr_args=distr_args)
+        return sample_mean, quants
+
+    B, H = distr_args[0].shape[:2]
+    sample_mean, quants = chunked_sample_quantiles(
+        sample_fn=lambda n: mixture._sample_mixture(
+            distr_args=distr_args, num_samples=n
+        ),
+        q=mixture.quantiles,
+        num_samples=mixture.num_samples,
+        chunk_size=chunk_size,
+    )
+    return sample_mean.view(B, H, 1), quants.view(B, H, -1)
+
+# %% ../../nbs/losses.pytorch.ipynb 79
 class PMM(torch.nn.Module):
     """Poisson Mixture Mesh
 
@@ -2063,6 +2303,8 @@ class PMM(torch.nn.Module):
     `return_params`: bool=False, wether or not return the Distribution parameters.<br>
     `batch_correlation`: bool=False, wether or not model batch correlations.<br>
     `horizon_correlation`: bool=False, wether or not model horizon correlations.<br>
+    `quantile_method`: str='sample', 'sample' for empirical quantiles or 'analytic' to bisect the mixture's CDF, see `get_quantiles`.<br>
+    `sample_chunk_size`: int, optional, samples drawn at a time by `get_quantiles` to bound its memory, streaming the quantiles to about 1/`sample_chunk_size` in rank.<br>
 
     **References:**<br>
     [Kin G. Olivares, O. Nganba Meetei, Ruijun Ma, Rohan Reddy, Mengfei Cao, Lee Dicker.
@@ -2079,8 +2321,14 @@ class PMM(torch.nn.Module):
         return_params=False,
         batch_correlation=False,
         horizon_correlation=False,
+        quantile_method="sample",
+        sample_chunk_size=None,
     ):
         super(PMM, self).__init__()
+        assert quantile_method in [
+            "sample",
+            "analytic",
+        ], f"quantile_method {quantile_method} not available"
         # Transform level to MQLoss parameters
         qs, self.output_names = level_to_outputs(level)
         qs = torch.Tensor(qs)
@@ -2091,6 +2339,8 @@ class PMM(torch.nn.Module):
             qs = torch.Tensor(quantiles)
         self.quantiles = torch.nn.Parameter(qs, requires_grad=False)
         self.num_samples = num_samples
+        self.sample_chunk_size = sample_chunk_size
+        self.quantile_method = quantile_method
         self.batch_correlation = batch_correlation
         self.horizon_correlation = horizon_correlation
 
@@ -2129,29 +2379,10 @@ class PMM(torch.nn.Module):
         lambdas = F.softplus(lambdas)
         return (lambdas,)
 
-    def sample(self, distr_args, num_samples=None):
-        """
-        Construct the empirical quantiles from the estimated Distribution,
-        sampling from it `num_samples` independently.
-
-        **Parameters**<br>
-        `distr_args`: Constructor arguments for the underlying Distribution type.<br>
-        `loc`: Optional tensor, of the same shape as the batch_shape + event_shape
-               of the resulting distribution.<br>
-        `scale`: Optional tensor, of the same shape as the batch_shape+event_shape
-               of the resulting distribution.<br>
-        `num_samples`: int=500, overwrites number of samples for the empirical quantiles.<br>
-
-        **Returns**<br>
-        `samples`: tensor, shape [B,H,`num_samples`].<br>
-        `quantiles`: tensor, empirical quantiles defined by `levels`.<br>
-        """
-        if num_samples is None:
-            num_samples = self.num_samples
-
+    def _sample_mixture(self, distr_args, num_samples):
+        # Draws num_samples from every mixture, shape [B*H, num_samples]
         lambdas = distr_args[0]
         B, H, K = lambdas.size()
-        Q = len(self.quantiles)
 
         # Sample K ~ Mult(weights)
         # shared across B, H
@@ -2181,6 +2412,33 @@ class PMM(torch.nn.Module):
         # Sample y ~ Poisson(lambda) independently
         samples = torch.poisson(sample_lambdas).to(lambdas.device)
         samples = samples.view(B * H, num_samples)
+        return samples
+
+    def sample(self, distr_args, num_samples=None):
+        """
+        Construct the empirical quantiles from the estimated Distribution,
+        sampling from it `num_samples` independently.
+
+        **Parameters**<br>
+        `distr_args`: Constructor arguments for the underlying Distribution type.<br>
+        `loc`: Optional tensor, of the same shape as the batch_shape + event_shape
+               of the resulting distribution.<br>
+        `scale`: Optional tensor, of the same shape as the batch_shape+event_shape
+               of the resulting distribution.<br>
+        `num_samples`: int=500, overwrites number of samples for the empirical quantiles.<br>
+
+        **Returns**<br>
+        `samples`: tensor, shape [B,H,`num_samples`].<br>
+        `quantiles`: tensor, empirical quantiles defined by `levels`.<br>
+        """
+        if num_samples is None:
+            num_samples = self.num_samples
+
+        lambdas = distr_args[0]
+        B, H, K = lambdas.size()
+        Q = len(self.quantiles)
+
+        samples = self._sample_mixture(distr_args=distr_args, num_samples=num_samples)
         sample_mean = torch.mean(samples, dim=-1)
 
         # Compute quantiles
@@ -2195,6 +2453,38 @@ class PMM(torch.nn.Module):
 
         return samples, sample_mean, quants
 
+    def get_quantiles(self, distr_args):
+        """
+        Construct the mean and the quantiles defined by `levels` of the estimated
+        Distribution. With `quantile_method='analytic'` the quantiles bisect the
+        mixture's CDF over the counts, otherwise they use `sample`,
+        drawing `sample_chunk_size` samples at a time when it is set.
+
+        **Parameters**<br>
+        `distr_args`: Constructor arguments for the underlying Distribution type.<br>
+
+        **Returns**<br>
+        `mean`: tensor, shape [B,H,1].<br>
+        `quantiles`: tensor, quantiles defined by `levels`, shape [B,H,Q].<br>
+        """
+        if getattr(self, "quantile_method", "sample") == "sample":
+            return mixture_sample_quantiles(mixture=self, distr_args=distr_args)
+
+        lambdas = distr_args[0]
+        B, H, K = lambdas.size()
+        q = self.quantiles.to(lambdas).expand(B, H, -1)
+
+        # Mixture CDF with equal weights, evaluated at [B,H,Q] counts
+        lambdas_q = lambdas.unsqueeze(2)
+        cdf = lambda k: torch.special.gammaincc(k.unsqueeze(-1) + 1, lambdas_q).mean(
+            dim=-1
+        )
+
+        mean = lambdas.mean(dim=-1, keepdim=True)
+        high = lambdas.amax(dim=-1, keepdim=True).expand_as(q)
+        quants = bisect_count_quantiles(cdf=cdf, q=q, high=high)
+        return mean, quants
+
     def neglog_likelihood(
         self,
         y: torch.Tensor,
@@ -2244,7 +2534,7 @@ class PMM(torch.nn.Module):
 
         return self.neglog_likelihood(y=y, distr_args=distr_args, mask=mask)
 
-# %% ../../nbs/losses.pytorch.ipynb 82
+# %% ../../nbs/losses.pytorch.ipynb 89
 class GMM(torch.nn.Module):
     """Gaussian Mixture Mesh
 
@@ -2263,7 +2553,9 @@ class GMM(torch.nn.Module):
     `quantiles`: float list [0,1], alternative to level list, target quantiles.<br>
     `return_params`: bool=False, wether or not return the Distribution parameters.<br>
     `batch_correlation`: bool=False, wether or not model batch correlations.<br>
-    `horizon_correlation`: bool=False, wether or not model horizon correlations.<br><br>
+    `horizon_correlation`: bool=False, wether or not model horizon correlations.<br>
+    `quantile_method`: str='sample', 'sample' for empirical quantiles or 'analytic' to bisect the mixture's CDF, see `get_quantiles`.<br>
+    `sample_chunk_size`: int, optional, samples drawn at a time by `get_quantiles` to bound its memory, streaming the quantiles to about 1/`sample_chunk_size` in rank.<br><br>
 
     **References:**<br>
     [Kin G. Olivares, O. Nganba Meetei, Ruijun Ma, Rohan Reddy, Mengfei Cao, Lee Dicker.
@@ -2280,8 +2572,14 @@ class GMM(torch.nn.Module):
         return_params=False,
         batch_correlation=False,
         horizon_correlation=False,
+        quantile_method="sample",
+        sample_chunk_size=None,
     ):
         super(GMM, self).__init__()
+        assert quantile_method in [
+            "sample",
+            "analytic",
+        ], f"quantile_method {quantile_method} not available"
         # Transform level to MQLoss parameters
         qs, self.output_names = level_to_outputs(level)
         qs = torch.Tensor(qs)
@@ -2292,6 +2590,8 @@ class GMM(torch.nn.Module):
             qs = torch.Tensor(quantiles)
         self.quantiles = torch.nn.Parameter(qs, requires_grad=False)
         self.num_samples = num_samples
+        self.sample_chunk_size = sample_chunk_size
+        self.quantile_method = quantile_method
         self.batch_correlation = batch_correlation
         self.horizon_correlation = horizon_correlation
 
@@ -2335,30 +2635,10 @@ class GMM(torch.nn.Module):
             stds = (stds + eps) * scale
         return (means, stds)
 
-    def sample(self, distr_args, num_samples=None):
-        """
-        Construct the empirical quantiles from the estimated Distribution,
-        sampling from it `num_samples` independently.
-
-        **Parameters**<br>
-        `distr_args`: Constructor arguments for the underlying Distribution type.<br>
-        `loc`: Optional tensor, of the same shape as the batch_shape + event_shape
-               of the resulting distribution.<br>
-        `scale`: Optional tensor, of the same shape as the batch_shape+event_shape
-               of the resulting distribution.<br>
-        `num_samples`: int=500, number of samples for the empirical quantiles.<br>
-
-        **Returns**<br>
-        `samples`: tensor, shape [B,H,`num_samples`].<br>
-        `quantiles`: tensor, empirical quantiles defined by `levels`.<br>
-        """
-        if num_samples is None:
-            num_samples = self.num_samples
-
+    def _sample_mixture(self, distr_args, num_samples):
+        # Draws num_samples from every mixture, shape [B*H, num_samples]
         means, stds = distr_args
         B, H, K = means.size()
-        Q = len(self.quantiles)
-        assert means.shape == stds.shape
 
         # Sample K ~ Mult(weights)
         # shared across B, H
@@ -2389,6 +2669,34 @@ class GMM(torch.nn.Module):
         # Sample y ~ Normal(mu, std) independently
         samples = torch.normal(sample_means, sample_stds).to(means.device)
         samples = samples.view(B * H, num_samples)
+        return samples
+
+    def sample(self, distr_args, num_samples=None):
+        """
+        Construct the empirical quantiles from the estimated Distribution,
+        sampling from it `num_samples` independently.
+
+        **Parameters**<br>
+        `distr_args`: Constructor arguments for the underlying Distribution type.<br>
+        `loc`: Optional tensor, of the same shape as the batch_shape + event_shape
+               of the resulting distribution.<br>
+        `scale`: Optional tensor, of the same shape as the batch_shape+event_shape
+               of the resulting distribution.<br>
+        `num_samples`: int=500, number of samples for the empirical quantiles.<br>
+
+        **Returns**<br>
+        `samples`: tensor, shape [B,H,`num_samples`].<br>
+        `quantiles`: tensor, empirical quantiles defined by `levels`.<br>
+        """
+        if num_samples is None:
+            num_samples = self.num_samples
+
+        means, stds = distr_args
+        B, H, K = means.size()
+        Q = len(self.quantiles)
+        assert means.shape == stds.shape
+
+        samples = self._sample_mixture(distr_args=distr_args, num_samples=num_samples)
         sample_mean = torch.mean(samples, dim=-1)
 
         # Compute quantiles
@@ -2403,6 +2711,44 @@ class GMM(torch.nn.Module):
 
         return samples, sample_mean, quants
 
+    def get_quantiles(self, distr_args):
+        """
+        Construct the mean and the quantiles defined by `levels` of the estimated
+        Distribution. With `quantile_method='analytic'` the quantiles bisect the
+        mixture's CDF, bracketed by the quantiles of its components, otherwise
+        they use `sample`, drawing `sample_chunk_size` samples at a time when it is set.
+
+        **Parameters**<br>
+        `distr_args`: Constructor arguments for the underlying Distribution type.<br>
+
+        **Returns**<br>
+        `mean`: tensor, shape [B,H,1].<br>
+        `quantiles`: tensor, quantiles defined by `levels`, shape [B,H,Q].<br>
+        """
+        if getattr(self, "quantile_method", "sample") == "sample":
+            return mixture_sample_quantiles(mixture=self, distr_args=distr_args)
+
+        means, stds = distr_args
+        B, H, K = means.size()
+        q = self.quantiles.to(means).expand(B, H, -1)
+
+        # Mixture CDF with equal weights, evaluated at [B,H,Q] values
+        means_q, stds_q = means.unsqueeze(2), stds.unsqueeze(2)
+        cdf = lambda x: torch.special.ndtr((x.unsqueeze(-1) - means_q) / stds_q).mean(
+            dim=-1
+        )
+
+        # The mixture's quantiles lie between the quantiles of its components
+        components_quants = means_q + stds_q * torch.special.ndtri(q).unsqueeze(-1)
+        mean = means.mean(dim=-1, keepdim=True)
+        quants = bisect_quantiles(
+            cdf=cdf,
+            q=q,
+            low=components_quants.amin(dim=-1),
+            high=components_quants.amax(dim=-1),
+        )
+        return mean, quants
+
     def neglog_likelihood(
         self,
         y: torch.Tensor,
@@ -2451,7 +2797,7 @@ class GMM(torch.nn.Module):
 
         return self.neglog_likelihood(y=y, distr_args=distr_args, mask=mask)
 
-# %% ../../nbs/losses.pytorch.ipynb 90
+# %% ../../nbs/losses.pytorch.ipynb 99
 class NBMM(torch.nn.Module):
     """Negative Binomial Mixture Mesh
 
@@ -2468,7 +2814,8 @@ class NBMM(torch.nn.Module):
     `n_components`: int=10, the number of mixture components.<br>
     `level`: float list [0,100], confidence levels for prediction intervals.<br>
     `quantiles`: float list [0,1], alternative to level list, target quantiles.<br>
-    `return_params`: bool=False, wether or not return the Distribution parameters.<br><br>
+    `return_params`: bool=False, wether or not return the Distribution parameters.<br>
+    `sample_chunk_size`: int, optional, samples drawn at a time by `get_quantiles` to bound its memory, streaming the quantiles to about 1/`sample_chunk_size` in rank.<br><br>
 
     **References:**<br>
     [Kin G. Olivares, O. Nganba Meetei, Ruijun Ma, Rohan Reddy, Mengfei Cao, Lee Dicker.
@@ -2483,6 +2830,7 @@ class NBMM(torch.nn.Module):
         quantiles=None,
         num_samples=1000,
         return_params=False,
+        sample_chunk_size=None,
     ):
         super(NBMM, self).__init__()
         # Transform level to MQLoss parameters
@@ -2495,6 +2843,7 @@ class NBMM(torch.nn.Module):
             qs = torch.Tensor(quantiles)
         self.quantiles = torch.nn.Parameter(qs, requires_grad=False)
         self.num_samples = num_samples
+        self.sample_chunk_size = sample_chunk_size
 
         # If True, predict_step will return Distribution's parameters
         self.return_params = return_params
@@ -2545,30 +2894,10 @@ class NBMM(torch.nn.Module):
         probs = (mu * alpha / (1.0 + mu * alpha)) + 1e-8
         return (total_count, probs)
 
-    def sample(self, distr_args, num_samples=None):
-        """
-        Construct the empirical quantiles from the estimated Distribution,
-        sampling from it `num_samples` independently.
-
-        **Parameters**<br>
-        `distr_args`: Constructor arguments for the underlying Distribution type.<br>
-        `loc`: Optional tensor, of the same shape as the batch_shape + event_shape
-               of the resulting distribution.<br>
-        `scale`: Optional tensor, of the same shape as the batch_shape+event_shape
-               of the resulting distribution.<br>
-        `num_samples`: int=500, number of samples for the empirical quantiles.<br>
-
-        **Returns**<br>
-        `samples`: tensor, shape [B,H,`num_samples`].<br>
-        `quantiles`: tensor, empirical quantiles defined by `levels`.<br>
-        """
-        if num_samples is None:
-            num_samples = self.num_samples
-
+    def _sample_mixture(self, distr_args, num_samples):
+        # Draws num_samples from every mixture, shape [B*H, num_samples]
         total_count, probs = distr_args
         B, H, K = total_count.size()
-        Q = len(self.quantiles)
-        assert total_count.shape == probs.shape
 
         # Sample K ~ Mult(weights)
         # shared across B, H
@@ -2600,6 +2929,34 @@ class NBMM(torch.nn.Module):
         dist = NegativeBinomial(total_count=sample_total_count, probs=sample_probs)
         samples = dist.sample(sample_shape=(1,)).to(probs.device)[0]
         samples = samples.view(B * H, num_samples)
+        return samples
+
+    def sample(self, distr_args, num_samples=None):
+        """
+        Construct the empirical quantiles from the estimated Distribution,
+        sampling from it `num_samples` independently.
+
+        **Parameters**<br>
+        `distr_args`: Constructor arguments for the underlying Distribution type.<br>
+        `loc`: Optional tensor, of the same shape as the batch_shape + event_shape
+               of the resulting distribution.<br>
+        `scale`: Optional tensor, of the same shape as the batch_shape+event_shape
+               of the resulting distribution.<br>
+        `num_samples`: int=500, number of samples for the empirical quantiles.<br>
+
+        **Returns**<br>
+        `samples`: tensor, shape [B,H,`num_samples`].<br>
+        `quantiles`: tensor, empirical quantiles defined by `levels`.<br>
+        """
+        if num_samples is None:
+            num_samples = self.num_samples
+
+        total_count, probs = distr_args
+        B, H, K = total_count.size()
+        Q = len(self.quantiles)
+        assert total_count.shape == probs.shape
+
+        samples = self._sample_mixture(distr_args=distr_args, num_samples=num_samples)
         sample_mean = torch.mean(samples, dim=-1)
 
         # Compute quantiles
@@ -2614,6 +2971,22 @@ class NBMM(torch.nn.Module):
 
         return samples, sample_mean, quants
 
+    def get_quantiles(self, distr_args):
+        """
+        Construct the mean and the quantiles defined by `levels` of the estimated
+        Distribution from `sample`, torch has no incomplete beta function
+        for the NegativeBinomial's CDF. The samples are drawn `sample_chunk_size`
+        at a time when it is set.
+
+        **Parameters**<br>
+        `distr_args`: Constructor arguments for the underlying Distribution type.<br>
+
+        **Returns**<br>
+        `mean`: tensor, shape [B,H,1].<br>
+        `quantiles`: tensor, quantiles defined by `levels`, shape [B,H,Q].<br>
+        """
+        return mixture_sample_quantiles(mixture=self, distr_args=distr_args)
+
     def neglog_likelihood(
         self,
         y: torch.Tensor,
@@ -2665,7 +3038,7 @@ class NBMM(torch.nn.Module):
 
         return self.neglog_likelihood(y=y, distr_args=distr_args, mask=mask)
 
-# %% ../../nbs/losses.pytorch.ipynb 97
+# %% ../../nbs/losses.pytorch.ipynb 108
 class HuberLoss(BasePointLoss):
     """ Huber Loss
 
@@ -2717,7 +3090,7 @@ class HuberLoss(BasePointLoss):
         weights = self._compute_weights(y=y, mask=mask)
         return _weighted_mean(losses=losses, weights=weights)
 
-# %% ../../nbs/losses.pytorch.ipynb 102
+# %% ../../nbs/losses.pytorch.ipynb 113
 class TukeyLoss(torch.nn.Module):
     """ Tukey Loss
 
@@ -2805,7 +3178,7 @@ class TukeyLoss(torch.nn.Module):
         tukey_loss = (self.c**2 / 6) * torch.mean(tukey_loss)
         return tukey_loss
 
-# %% ../../nbs/losses.pytorch.ipynb 107
+# %% ../../nbs/losses.pytorch.ipynb 118
 class HuberQLoss(BasePointLoss):
     """Huberized Quantile Loss
 
@@ -2868,7 +3241,7 @@ class HuberQLoss(BasePointLoss):
         weights = self._compute_weights(y=y, mask=mask)
         return _weighted_mean(losses=losses, weights=weights)
 
-# %% ../../nbs/losses.pytorch.ipynb 112
+# %% ../../nbs/losses.pytorch.ipynb 123
 class HuberMQLoss(BasePointLoss):
     """Huberized Multi-Quantile loss
 
@@ -2982,7 +3355,7 @@ class HuberMQLoss(BasePointLoss):
 
         return _weighted_mean(losses=losses, weights=weights)
 
-# %% ../../nbs/losses.pytorch.ipynb 118
+# %% ../../nbs/losses.pytorch.ipynb 129
 class Accuracy(torch.nn.Module):
     """Accuracy
 
@@ -3029,7 +3402,7 @@ class Accuracy(torch.nn.Module):
         accuracy = torch.mean(measure)
         return accuracy
 
-# %% ../../nbs/losses.pytorch.ipynb 122
+# %% ../../nbs/losses.pytorch.ipynb 133
 class sCRPS(torch.nn.Module):
     """Scaled Continues Ranked Probability Score
 
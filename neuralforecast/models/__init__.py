@@ -5,36 +5,54 @@ __all__ = ['RNN', 'GRU', 'LSTM', 'TCN', 'DeepAR', 'DilatedRNN',
            'iTransformer', 'BiTCN', 'TiDE', 'DeepNPTS', 'SOFTS', 'TimeMixer', 'KAN', 'RMoK',
            ]
 
-from .rnn import RNN
-from .gru import GRU
-from .lstm import LSTM
-from .tcn import TCN
-from .deepar import DeepAR
-from .dilated_rnn import DilatedRNN
-from .mlp import MLP
-from .nhits import NHITS
-from .nbeats import NBEATS
-from .nbeatsx import NBEATSx
-from .dlinear import DLinear
-from .nlinear import NLinear
-from .tft import TFT
-from .stemgnn import StemGNN
-from .vanillatransformer import VanillaTransformer
-from .informer import Informer
-from .autoformer import Autoformer
-from .fedformer import FEDformer
-from .patchtst import PatchTST
-from .hint import HINT
-from .timesnet import TimesNet
-from .timellm import TimeLLM
-from .tsmixer import TSMixer
-from .tsmixerx import TSMixerx
-from .mlpmultivariate import MLPMultivariate
-from .itransformer import iTransformer
-from .bitcn import BiTCN
-from .tide import TiDE
-from .deepnpts import DeepNPTS
-from .softs import SOFTS
-from .timemixer import TimeMixer
-from .kan import KAN
-from .rmok import RMoK
+import importlib
+
+# the models are imported on first access, so that importing a single model
+# or the package doesn't import every architecture
+_MODEL_MODULES = {
+    'RNN': 'rnn',
+    'GRU': 'gru',
+    'LSTM': 'lstm',
+    'TCN': 'tcn',
+    'DeepAR': 'deepar',
+    'DilatedRNN': 'dilated_rnn',
+    'MLP': 'mlp',
+    'NHITS': 'nhits',
+    'NBEATS': 'nbeats',
+    'NBEATSx': 'nbeatsx',
+    'DLinear': 'dlinear',
+    'NLinear': 'nlinear',
+    'TFT': 'tft',
+    'StemGNN': 'stemgnn',
+    'VanillaTransformer': 'vanillatransformer',
+    'Informer': 'informer',
+    'Autoformer': 'autoformer',
+    'FEDformer': 'fedformer',
+    'PatchTST': 'patchtst',
+    'HINT': 'hint',
+    'TimesNet': 'timesnet',
+    'TimeLLM': 'timellm',
+    'TSMixer': 'tsmixer',
+    'TSMixerx': 'tsmixerx',
+    'MLPMultivariate': 'mlpmultivariate',
+    'iTransformer': 'itransformer',
+    'BiTCN': 'bitcn',
+    'TiDE': 'tide',
+    'DeepNPTS': 'deepnpts',
+    'SOFTS': 'softs',
+    'TimeMixer': 'timemixer',
+    'KAN': 'kan',
+    'RMoK': 'rmok',
+}
+
+
+def __getattr__(name):
+    if name not in _MODEL_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    model = getattr(importlib.import_module(f'.{_MODEL_MODULES[name]}', __name__), name)
+    globals()[name] = model
+    return model
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
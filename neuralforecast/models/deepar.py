@@ -301,9 +301,9 @@ class DeepAR(BaseWindows):
         if self.val_size == 0:
             return np.nan
 
-        # TODO: Hack to compute number of windows
-        windows = self._create_windows(batch, step="val")
-        n_windows = len(windows["temporal"])
+        # Strided view over all windows, built once per batch [B, C, Ws, L+H]
+        all_windows = self._create_inference_windows(batch, step="val")
+        n_windows = all_windows.shape[0] * all_windows.shape[2]
         y_idx = batch["y_idx"]
 
         # Number of windows in batch
@@ -319,7 +319,7 @@ class DeepAR(BaseWindows):
             w_idxs = np.arange(
                 i * windows_batch_size, min((i + 1) * windows_batch_size, n_windows)
             )
-            windows = self._create_windows(batch, step="val", w_idxs=w_idxs)
+            windows = self._gather_windows(batch, all_windows, w_idxs=w_idxs)
             original_outsample_y = torch.clone(windows["temporal"][:, -self.h :, 0])
             windows = self._normalization(windows=windows, y_idx=y_idx)
 
@@ -369,9 +369,9 @@ class DeepAR(BaseWindows):
 
         self.h == self.horizon_backup
 
-        # TODO: Hack to compute number of windows
-        windows = self._create_windows(batch, step="predict")
-        n_windows = len(windows["temporal"])
+        # Strided view over all windows, built once per batch [B, C, Ws, L+H]
+        all_windows = self._create_inference_windows(batch, step="predict")
+        n_windows = all_windows.shape[0] * all_windows.shape[2]
         y_idx = batch["y_idx"]
 
         # Number of windows in batch
@@ -386,7 +386,7 @@ class DeepAR(BaseWindows):
             w_idxs = np.arange(
                 i * windows_batch_size, min((i + 1) * windows_batch_size, n_windows)
             )
-            windows = self._create_windows(batch, step="predict", w_idxs=w_idxs)
+            windows = self._gather_windows(batch, all_windows, w_idxs=w_idxs)
             windows = self._normalization(windows=windows, y_idx=y_idx)
 
             # Parse windows
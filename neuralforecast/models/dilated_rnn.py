@@ -187,6 +187,10 @@ class DRNN(nn.Module):
             layers.append(c)
         self.cells = nn.Sequential(*layers)
 
+        # Size of the state of stateful inference, see `forward_stateful`
+        self.n_states = 2 if self.cell_type in ["LSTM", "ResLSTM"] else 1
+        self.state_size = self.n_states * sum(dilations) * n_hidden
+
     def forward(self, inputs, hidden=None):
         if self.batch_first:
             inputs = inputs.transpose(0, 1)
@@ -203,6 +207,84 @@ class DRNN(nn.Module):
             inputs = inputs.transpose(0, 1)
         return inputs, outputs
 
+    def forward_stateful(self, inputs, state=None):
+        # Advances the layers over `inputs` from the `state` [B, state_size] of stateful
+        # inference, which holds the last `dilation` hidden states of each layer ordered by
+        # the next step of their sub-sequence. Unlike `forward`, the inputs are not padded
+        # to a multiple of the dilations, so the final states are exact
+        if self.cell_type == "AttentiveLSTM":
+            raise NotImplementedError(
+                "AttentiveLSTM cells attend over the whole sequence and do not support stateful inference"
+            )
+        if self.batch_first:
+            inputs = inputs.transpose(0, 1)
+        batch_size = inputs.size(1)
+
+        new_state = []
+        start = 0
+        for cell, dilation in zip(self.cells, self.dilations):
+            size = self.n_states * dilation * cell.hidden_size
+            if state is None:
+                hidden = inputs.new_zeros(
+                    self.n_states, dilation, batch_size, cell.hidden_size
+                )
+            else:
+                hidden = state[:, start : start + size].reshape(
+                    batch_size, self.n_states, dilation, cell.hidden_size
+                )
+                hidden = hidden.permute(1, 2, 0, 3)
+            start += size
+            inputs, hidden = self._stateful_layer(cell, inputs, dilation, hidden)
+            new_state.append(hidden.permute(2, 0, 1, 3).reshape(batch_size, size))
+
+        if self.batch_first:
+            inputs = inputs.transpose(0, 1)
+        return inputs, torch.cat(new_state, dim=1)
+
+    def _stateful_layer(self, cell, inputs, rate, hidden):
+        # hidden [n_states, rate, B, hidden_size]
+        n_steps, batch_size = inputs.shape[:2]
+        n_rest = n_steps % rate
+        n_full = n_steps - n_rest
+        outputs = []
+        if n_full > 0:
+            # Every sub-sequence advances n_full // rate steps
+            dilated_inputs = self._prepare_inputs(inputs[:n_full], rate)
+            dilated_outputs, hidden = self._apply_stateful_cell(
+                cell, dilated_inputs, hidden.flatten(1, 2)
+            )
+            outputs.append(self._split_outputs(dilated_outputs, rate))
+            hidden = hidden.view(-1, rate, batch_size, cell.hidden_size)
+        if n_rest > 0:
+            # The first n_rest sub-sequences advance one more step
+            rest_inputs = inputs[n_full:].reshape(1, n_rest * batch_size, -1)
+            rest_outputs, rest_hidden = self._apply_stateful_cell(
+                cell, rest_inputs, hidden[:, :n_rest].flatten(1, 2)
+            )
+            outputs.append(rest_outputs.view(n_rest, batch_size, -1))
+            hidden = torch.cat(
+                [
+                    rest_hidden.view(-1, n_rest, batch_size, cell.hidden_size),
+                    hidden[:, n_rest:],
+                ],
+                dim=1,
+            )
+        # Reorder the sub-sequences by their next step
+        hidden = hidden.roll(-n_rest, dims=1)
+        return torch.cat(outputs), hidden
+
+    def _apply_stateful_cell(self, cell, dilated_inputs, hidden):
+        # hidden [n_states, rate * B, hidden_size]
+        if self.cell_type in ["LSTM", "ResLSTM"]:
+            dilated_outputs, hidden = cell(
+                dilated_inputs, (hidden[:1].contiguous(), hidden[1:].contiguous())
+            )
+        else:
+            dilated_outputs, hidden = cell(dilated_inputs, hidden.contiguous())
+            hidden = (hidden,)
+        hidden = torch.stack([h.reshape(hidden[0].shape[-2:]) for h in hidden])
+        return dilated_outputs, hidden
+
     def drnn_layer(self, cell, inputs, rate, hidden=None):
         n_steps = len(inputs)
         batch_size = inputs[0].size(0)
@@ -313,6 +395,7 @@ class DilatedRNN(BaseRecurrent):
     `valid_batch_size`: int=None, number of different series in each validation and test batch.<br>
     `step_size`: int=1, step size between each window of temporal data.<br>
     `scaler_type`: str='robust', type of scaler for temporal inputs normalization see [temporal scalers](https://nixtla.github.io/neuralforecast/common.scalers.html).<br>
+    `precompute_scaler_stats`: bool=False, compute the scaler statistics of each serie once per dataset instead of on every batch.<br>
     `random_seed`: int=1, random_seed for pytorch initializer and numpy generators.<br>
     `num_workers_loader`: int=os.cpu_count(), workers to be used by `TimeSeriesDataLoader`.<br>
     `drop_last_loader`: bool=False, if True `TimeSeriesDataLoader` drops last non-full batch.<br>
@@ -330,6 +413,7 @@ class DilatedRNN(BaseRecurrent):
     EXOGENOUS_FUTR = True
     EXOGENOUS_HIST = True
     EXOGENOUS_STAT = True
+    STATEFUL_INFERENCE = True
 
     def __init__(
         self,
@@ -356,6 +440,7 @@ class DilatedRNN(BaseRecurrent):
         valid_batch_size: Optional[int] = None,
         step_size: int = 1,
         scaler_type: str = "robust",
+        precompute_scaler_stats: bool = False,
         random_seed: int = 1,
         num_workers_loader: int = 0,
         drop_last_loader: bool = False,
@@ -380,6 +465,7 @@ class DilatedRNN(BaseRecurrent):
             batch_size=batch_size,
             valid_batch_size=valid_batch_size,
             scaler_type=scaler_type,
+            precompute_scaler_stats=precompute_scaler_stats,
             futr_exog_list=futr_exog_list,
             hist_exog_list=hist_exog_list,
             stat_exog_list=stat_exog_list,
@@ -396,6 +482,8 @@ class DilatedRNN(BaseRecurrent):
 
         # Dilated RNN
         self.cell_type = cell_type
+        # The attentive cells have no stateful forward
+        self.STATEFUL_INFERENCE = cell_type != "AttentiveLSTM"
         self.dilations = dilations
         self.encoder_hidden_size = encoder_hidden_size
 
@@ -467,13 +555,29 @@ class DilatedRNN(BaseRecurrent):
             )  # [B, S] -> [B, seq_len, S]
             encoder_input = torch.cat((encoder_input, stat_exog), dim=2)
 
-        # DilatedRNN forward
+        # DilatedRNN forward, from the encoder state [B, state_size] of stateful inference if given
+        stateful = "encoder_state" in windows_batch
+        encoder_state = windows_batch.get("encoder_state")
+        states = []
         for layer_num in range(len(self.rnn_stack)):
             residual = encoder_input
-            output, _ = self.rnn_stack[layer_num](encoder_input)
+            if stateful:
+                state_size = self.rnn_stack[layer_num].state_size
+                state = None if encoder_state is None else encoder_state[:, :state_size]
+                encoder_state = (
+                    None if encoder_state is None else encoder_state[:, state_size:]
+                )
+                output, state = self.rnn_stack[layer_num].forward_stateful(
+                    encoder_input, state
+                )
+                states.append(state)
+            else:
+                output, _ = self.rnn_stack[layer_num](encoder_input)
             if layer_num > 0:
                 output += residual
             encoder_input = output
+        if stateful:
+            windows_batch["encoder_state"] = torch.cat(states, dim=1)
 
         if self.futr_exog_size > 0:
             futr_exog = futr_exog.permute(0, 2, 3, 1)[
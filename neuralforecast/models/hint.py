@@ -180,6 +180,8 @@ class HINT:
         qs = torch.Tensor((np.arange(self.loss.num_samples) / self.loss.num_samples))
         self.sample_quantiles = torch.nn.Parameter(qs, requires_grad=False)
         self.alias = alias
+        # Stateful inference is only supported on the models themselves
+        self.STATEFUL_INFERENCE = False
 
     def __repr__(self):
         return type(self).__name__ if self.alias is None else self.alias
@@ -47,6 +47,7 @@ class RNN(BaseRecurrent):
     `batch_size`: int=32, number of differentseries in each batch.<br>
     `valid_batch_size`: int=None, number of different series in each validation and test batch.<br>
     `scaler_type`: str='robust', type of scaler for temporal inputs normalization see [temporal scalers](https://nixtla.github.io/neuralforecast/common.scalers.html).<br>
+    `precompute_scaler_stats`: bool=False, compute the scaler statistics of each serie once per dataset instead of on every batch.<br>
     `random_seed`: int=1, random_seed for pytorch initializer and numpy generators.<br>
     `num_workers_loader`: int=os.cpu_count(), workers to be used by `TimeSeriesDataLoader`.<br>
     `drop_last_loader`: bool=False, if True `TimeSeriesDataLoader` drops last non-full batch.<br>
@@ -65,6 +66,7 @@ class RNN(BaseRecurrent):
     EXOGENOUS_FUTR = True
     EXOGENOUS_HIST = True
     EXOGENOUS_STAT = True
+    STATEFUL_INFERENCE = True
 
     def __init__(
         self,
@@ -92,6 +94,7 @@ class RNN(BaseRecurrent):
         batch_size=32,
         valid_batch_size: Optional[int] = None,
         scaler_type: str = "robust",
+        precompute_scaler_stats: bool = False,
         random_seed=1,
         num_workers_loader=0,
         drop_last_loader=False,
@@ -116,6 +119,7 @@ class RNN(BaseRecurrent):
             batch_size=batch_size,
             valid_batch_size=valid_batch_size,
             scaler_type=scaler_type,
+            precompute_scaler_stats=precompute_scaler_stats,
             futr_exog_list=futr_exog_list,
             hist_exog_list=hist_exog_list,
             stat_exog_list=stat_exog_list,
@@ -198,10 +202,15 @@ class RNN(BaseRecurrent):
             )  # [B, S] -> [B, seq_len, S]
             encoder_input = torch.cat((encoder_input, stat_exog), dim=2)
 
-        # RNN forward
-        hidden_state, _ = self.hist_encoder(
-            encoder_input
+        # RNN forward, from the encoder state [B, n_layers, hidden] of stateful inference if given
+        encoder_state = windows_batch.get("encoder_state")
+        if encoder_state is not None:
+            encoder_state = encoder_state.permute(1, 0, 2).contiguous()
+        hidden_state, encoder_state = self.hist_encoder(
+            encoder_input, encoder_state
         )  # [B, seq_len, rnn_hidden_state]
+        if "encoder_state" in windows_batch:
+            windows_batch["encoder_state"] = encoder_state.permute(1, 0, 2)
 
         if self.futr_exog_size > 0:
             futr_exog = futr_exog.permute(0, 2, 3, 1)[
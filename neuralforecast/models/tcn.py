@@ -43,6 +43,7 @@ class TCN(BaseRecurrent):
     `early_stop_patience_steps`: int=-1, Number of validation iterations before early stopping.<br>
     `val_check_steps`: int=100, Number of training steps between every validation loss check.<br>    `batch_size`: int=32, number of differentseries in each batch.<br>
     `scaler_type`: str='robust', type of scaler for temporal inputs normalization see [temporal scalers](https://nixtla.github.io/neuralforecast/common.scalers.html).<br>
+    `precompute_scaler_stats`: bool=False, compute the scaler statistics of each serie once per dataset instead of on every batch.<br>
     `random_seed`: int=1, random_seed for pytorch initializer and numpy generators.<br>
     `num_workers_loader`: int=os.cpu_count(), workers to be used by `TimeSeriesDataLoader`.<br>
     `drop_last_loader`: bool=False, if True `TimeSeriesDataLoader` drops last non-full batch.<br>
@@ -86,6 +87,7 @@ class TCN(BaseRecurrent):
         batch_size: int = 32,
         valid_batch_size: Optional[int] = None,
         scaler_type: str = "robust",
+        precompute_scaler_stats: bool = False,
         random_seed: int = 1,
         num_workers_loader=0,
         drop_last_loader=False,
@@ -110,6 +112,7 @@ class TCN(BaseRecurrent):
             batch_size=batch_size,
             valid_batch_size=valid_batch_size,
             scaler_type=scaler_type,
+            precompute_scaler_stats=precompute_scaler_stats,
             futr_exog_list=futr_exog_list,
             hist_exog_list=hist_exog_list,
             stat_exog_list=stat_exog_list,
@@ -0,0 +1,414 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/serve.ipynb.
+
+# %% auto 0
+__all__ = ['ForecastServer', 'make_http_server', 'main']
+
+# %% ../nbs/serve.ipynb 4
+import argparse
+import json
+import queue
+import socket
+import socketserver
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .core import NeuralForecast
+
+# %% ../nbs/serve.ipynb 5
+@dataclass
+class _Request:
+    df: pd.DataFrame
+    futr_df: Optional[pd.DataFrame]
+    static_df: Optional[pd.DataFrame]
+    n_series: int
+    future: Future = field(default_factory=Future)
+    start: float = field(default_factory=time.perf_counter)
+
+
+class ForecastServer:
+    """Forecast server
+
+    Keeps a fitted `NeuralForecast` in memory and micro-batches concurrent forecast requests.
+    Requests that arrive within `max_wait_ms` of the first one, up to `max_batch_size` series,
+    are predicted together with a single `NeuralForecast.predict` call, so every model runs
+    one forward pass per batch instead of one per request.
+
+    Parameters
+    ----------
+    nf : NeuralForecast or str
+        Fitted `NeuralForecast` object or directory where it was saved with `NeuralForecast.save`.
+    max_batch_size : int (default=1024)
+        Maximum number of series predicted together.
+    max_wait_ms : float (default=5.0)
+        Milliseconds the first request of a batch waits for others to arrive.
+    engine : str (default='torch')
+        Inference engine of the models, see `NeuralForecast.predict`.
+    level : list of ints or floats, optional (default=None)
+        Confidence levels of the prediction intervals returned with every forecast.
+    latency_window : int (default=10_000)
+        Number of most recent requests used to compute the latency metrics.
+    """
+
+    def __init__(
+        self,
+        nf: Union[NeuralForecast, str],
+        max_batch_size: int = 1024,
+        max_wait_ms: float = 5.0,
+        engine: str = "torch",
+        level: Optional[List[Union[int, float]]] = None,
+        latency_window: int = 10_000,
+    ):
+        if isinstance(nf, str):
+            nf = NeuralForecast.load(nf)
+        if not nf._fitted:
+            raise ValueError("You must fit the model before serving it.")
+        if nf.scalers_:
+            raise ValueError(
+                "Historic scaling isn't supported by the server, its statistics are tied to the series seen during fit. "
+                "Please use the models' `scaler_type` instead."
+            )
+        self.nf = nf
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.engine = engine
+        self.level = level
+
+        self._queue = queue.Queue()
+        self._worker = None
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=latency_window)
+        self._n_requests = 0
+        self._n_batches = 0
+        self._n_series = 0
+
+    def start(self) -> "ForecastServer":
+        """Start the thread that batches and predicts the submitted requests."""
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run, daemon=True)
+            self._worker.start()
+        return self
+
+    def stop(self):
+        """Predict the pending requests and stop the worker thread."""
+        if self._worker is not None:
+            self._queue.put(None)
+            self._worker.join()
+            self._worker = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def submit(
+        self,
+        df: pd.DataFrame,
+        futr_df: Optional[pd.DataFrame] = None,
+        static_df: Optional[pd.DataFrame] = None,
+    ) -> Future:
+        """Queue a forecast request.
+
+        Parameters
+        ----------
+        df : pandas DataFrame
+            History of the series to forecast with columns [`unique_id`, `ds`, `y`] and historic exogenous.
+        futr_df : pandas DataFrame, optional (default=None)
+            DataFrame with [`unique_id`, `ds`] columns and the future exogenous of the next `h` steps.
+        static_df : pandas DataFrame, optional (default=None)
+            DataFrame with columns [`unique_id`] and static exogenous.
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+            Future with the forecasts DataFrame of the request.
+        """
+        if self._worker is None:
+            raise RuntimeError("The server must be started before submitting requests.")
+        missing_cols = {self.nf.id_col, self.nf.time_col, self.nf.target_col} - set(
+            df.columns
+        )
+        if missing_cols:
+            raise ValueError(
+                f"The following columns are missing from `df`: {missing_cols}"
+            )
+        request = _Request(
+            df=df,
+            futr_df=futr_df,
+            static_df=static_df,
+            n_series=df[self.nf.id_col].nunique(),
+        )
+        self._queue.put(request)
+        return request.future
+
+    def forecast(
+        self,
+        df: pd.DataFrame,
+        futr_df: Optional[pd.DataFrame] = None,
+        static_df: Optional[pd.DataFrame] = None,
+        timeout: Optional[float] = None,
+    ) -> pd.DataFrame:
+        """Forecast the series of `df`, blocking until its batch is predicted. See `ForecastServer.submit`."""
+        return self.submit(df=df, futr_df=futr_df, static_df=static_df).result(
+            timeout=timeout
+        )
+
+    def metrics(self) -> Dict[str, float]:
+        """Number of requests and batches served, mean series per batch and latency percentiles in milliseconds."""
+        with self._lock:
+            latencies = np.array(self._latencies)
+            n_requests, n_batches, n_series = (
+                self._n_requests,
+                self._n_batches,
+                self._n_series,
+            )
+        p50, p99 = (
+            np.percentile(latencies, [50, 99]) if latencies.size else (np.nan, np.nan)
+        )
+        return {
+            "requests": n_requests,
+            "batches": n_batches,
+            "mean_batch_series": n_series / n_batches if n_batches else np.nan,
+            "latency_p50_ms": 1_000 * p50,
+            "latency_p99_ms": 1_000 * p99,
+        }
+
+    def _run(self):
+        stop = False
+        while not stop:
+            request = self._queue.get()
+            if request is None:
+                break
+            batch = [request]
+            n_series = request.n_series
+            deadline = time.perf_counter() + self.max_wait_ms / 1_000
+            while n_series < self.max_batch_size:
+                try:
+                    request = self._queue.get(
+                        timeout=max(deadline - time.perf_counter(), 0)
+                    )
+                except queue.Empty:
+                    break
+                if request is None:
+                    stop = True
+                    break
+                batch.append(request)
+                n_series += request.n_series
+            self._predict_batch(batch)
+
+    def _predict_batch(self, requests: List[_Request]):
+        error = None
+        try:
+            results = self._predict(requests)
+        except Exception as e:
+            # Predict the requests separately so that only the failing ones get the error
+            if len(requests) > 1:
+                for request in requests:
+                    self._predict_batch([request])
+                return
+            error = e
+        end = time.perf_counter()
+        with self._lock:
+            self._n_batches += 1
+            self._n_series += sum(request.n_series for request in requests)
+            self._n_requests += len(requests)
+            self._latencies.extend(end - request.start for request in requests)
+        if error is not None:
+            requests[0].future.set_exception(error)
+            return
+        for request, result in zip(requests, results):
+            request.future.set_result(result)
+
+    def _predict(self, requests: List[_Request]) -> List[pd.DataFrame]:
+        id_col = self.nf.id_col
+
+        # Requests can share ids, so their series are relabeled with consecutive integers
+        batch = {"df": [], "futr_df": [], "static_df": []}
+        requests_uids = []
+        offset = 0
+        for request in requests:
+            uids = np.sort(request.df[id_col].unique())
+            codes = pd.Series(np.arange(offset, offset + uids.size), index=uids)
+            for name in batch:
+                df = getattr(request, name)
+                if df is not None:
+                    batch[name].append(df.assign(**{id_col: df[id_col].map(codes)}))
+            requests_uids.append(uids)
+            offset += uids.size
+        batch = {
+            name: pd.concat(dfs, ignore_index=True) if dfs else None
+            for name, dfs in batch.items()
+        }
+
+        fcsts = self.nf.predict(**batch, engine=self.engine, level=self.level)
+        if fcsts.index.name == id_col:
+            fcsts = fcsts.reset_index()
+
+        # Split the forecasts, each request's series are contiguous since they are sorted by id
+        results = []
+        offset = 0
+        for uids in requests_uids:
+            result = fcsts.iloc[
+                offset * self.nf.h : (offset + uids.size) * self.nf.h
+            ].reset_index(drop=True)
+            result[id_col] = uids[result[id_col].to_numpy() - offset]
+            results.append(result)
+            offset += uids.size
+        return results
+
+# %% ../nbs/serve.ipynb 9
+def _payload_to_dfs(payload: Dict, nf: NeuralForecast) -> Dict[str, pd.DataFrame]:
+    dfs = {}
+    for name in ["df", "futr_df", "static_df"]:
+        if payload.get(name) is None:
+            continue
+        df = pd.DataFrame(payload[name])
+        if name != "static_df" and not isinstance(nf.freq, (int, np.integer)):
+            df[nf.time_col] = pd.to_datetime(df[nf.time_col])
+        dfs[name] = df
+    if "df" not in dfs:
+        raise ValueError("The payload must contain the history of the series in `df`.")
+    return dfs
+
+
+def _df_to_payload(df: pd.DataFrame) -> Dict[str, list]:
+    df = df.copy()
+    for col in df.columns:
+        if pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = df[col].astype(str)
+    return df.to_dict(orient="list")
+
+
+class _ForecastHandler(BaseHTTPRequestHandler):
+    """Serves `POST /predict` with JSON payloads of column lists for `df`, `futr_df` and `static_df`,
+    `GET /metrics` and `GET /health`."""
+
+    def do_GET(self):
+        if self.path == "/metrics":
+            self._send(200, self.server.forecast_server.metrics())
+        elif self.path == "/health":
+            self._send(200, {"status": "ok"})
+        else:
+            self._send(404, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/predict":
+            self._send(404, {"error": f"Unknown path {self.path}"})
+            return
+        forecast_server = self.server.forecast_server
+        try:
+            payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            dfs = _payload_to_dfs(payload, forecast_server.nf)
+        except (ValueError, KeyError, TypeError) as e:
+            self._send(400, {"error": str(e)})
+            return
+        try:
+            fcsts = forecast_server.forecast(**dfs)
+        except Exception as e:
+            self._send(500, {"error": str(e)})
+            return
+        self._send(200, {"forecasts": _df_to_payload(fcsts)})
+
+    def _send(self, status: int, content: Dict):
+        body = json.dumps(content).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self):
+        # Unix socket clients don't have an address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+# Unix sockets aren't available on Windows
+if hasattr(socket, "AF_UNIX"):
+
+    class _UnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+
+def make_http_server(
+    forecast_server: ForecastServer,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    unix_socket: Optional[str] = None,
+    verbose: bool = False,
+) -> socketserver.BaseServer:
+    """Make HTTP server
+
+    Builds an HTTP server for a `ForecastServer`, call its `serve_forever` method to start serving.
+    Each connection is handled by its own thread, so concurrent requests are micro-batched.
+
+    Parameters
+    ----------
+    forecast_server : ForecastServer
+        Started forecast server.
+    host : str (default='127.0.0.1')
+        Host to bind.
+    port : int (default=8000)
+        Port to bind, 0 selects a free port.
+    unix_socket : str, optional (default=None)
+        Path of a Unix socket to bind instead of `host` and `port`. Not available on Windows.
+    verbose : bool (default=False)
+        Log every request to stderr.
+
+    Returns
+    -------
+    server : socketserver.BaseServer
+        HTTP server.
+    """
+    if unix_socket is not None:
+        if not hasattr(socket, "AF_UNIX"):
+            raise ValueError(
+                "Unix sockets are not supported on this platform, use `host` and `port` instead."
+            )
+        server = _UnixHTTPServer(unix_socket, _ForecastHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), _ForecastHandler)
+    server.forecast_server = forecast_server
+    server.verbose = verbose
+    return server
+
+
+def main():
+    """Serve a `NeuralForecast` saved with `NeuralForecast.save` over HTTP."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("path", help="Directory with the saved NeuralForecast.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--unix_socket", default=None)
+    parser.add_argument("--max_batch_size", type=int, default=1024)
+    parser.add_argument("--max_wait_ms", type=float, default=5.0)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    with ForecastServer(
+        args.path, max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms
+    ) as forecast_server:
+        server = make_http_server(
+            forecast_server,
+            host=args.host,
+            port=args.port,
+            unix_socket=args.unix_socket,
+            verbose=args.verbose,
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
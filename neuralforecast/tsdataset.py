@@ -5,20 +5,35 @@ __all__ = ['TimeSeriesLoader', 'BaseTimeSeriesDataset', 'TimeSeriesDataset', 'Lo
            'TimeSeriesDataModule']
 
 # %% ../nbs/tsdataset.ipynb 4
+import copy
+import itertools
+import pickle
 import warnings
+from collections import OrderedDict
 from collections.abc import Mapping
 from pathlib import Path
 from typing import List, Optional, Sequence, Union
 
+import fsspec
 import numpy as np
 import pandas as pd
 import pytorch_lightning as pl
 import torch
 import utilsforecast.processing as ufp
-from torch.utils.data import Dataset, DataLoader
+from fsspec.implementations.local import LocalFileSystem
+from torch.utils.data import (
+    BatchSampler,
+    DataLoader,
+    Dataset,
+    RandomSampler,
+    SequentialSampler,
+)
 from utilsforecast.compat import DataFrame, pl_Series
 
 # %% ../nbs/tsdataset.ipynb 5
+_BATCH_KEYS = {"temporal", "temporal_cols", "static", "static_cols", "y_idx"}
+
+
 class TimeSeriesLoader(DataLoader):
     """TimeSeriesLoader DataLoader.
     [Source code](https://github.com/Nixtla/neuralforecast1/blob/main/neuralforecast/tsdataset.py).
@@ -35,14 +50,54 @@ class TimeSeriesLoader(DataLoader):
     `shuffle`: (bool, optional): set to `True` to have the data reshuffled at every epoch (default: `False`).<br>
     `sampler`: (Sampler or Iterable, optional): defines the strategy to draw samples from the dataset.<br>
                 Can be any `Iterable` with `__len__` implemented. If specified, `shuffle` must not be specified.<br>
+    `ragged`: (bool, optional): fetch each batch at once from the flat storage of a `TimeSeriesDataset`, left-padding it only to its longest serie instead of the dataset's `max_size` (default: `False`).<br>
     """
 
-    def __init__(self, dataset, **kwargs):
+    def __init__(self, dataset, ragged=False, **kwargs):
         if "collate_fn" in kwargs:
             kwargs.pop("collate_fn")
-        kwargs_ = {**kwargs, **dict(collate_fn=self._collate_fn)}
+        if ragged:
+            if not isinstance(dataset, TimeSeriesDataset):
+                raise ValueError(
+                    f"ragged=True requires a TimeSeriesDataset, which fetches each batch at once, got {type(dataset).__name__}."
+                )
+            # The dataset is indexed with the list of indices of each batch,
+            # so automatic batching is replaced by a BatchSampler
+            batch_size = kwargs.pop("batch_size", 1)
+            drop_last = kwargs.pop("drop_last", False)
+            shuffle = kwargs.pop("shuffle", False)
+            sampler = kwargs.pop("sampler", None)
+            if sampler is None:
+                sampler = (
+                    RandomSampler(dataset) if shuffle else SequentialSampler(dataset)
+                )
+            batch_sampler = BatchSampler(
+                sampler, batch_size=batch_size, drop_last=drop_last
+            )
+            kwargs_ = {
+                **kwargs,
+                **dict(
+                    sampler=batch_sampler,
+                    batch_size=None,
+                    collate_fn=self._ragged_collate_fn,
+                ),
+            }
+        else:
+            kwargs_ = {**kwargs, **dict(collate_fn=self._collate_fn)}
         DataLoader.__init__(self, dataset=dataset, **kwargs_)
 
+    def _ragged_collate_fn(self, batch):
+        # Batches are already collated by the dataset
+        if batch["static"] is None:
+            out = dict(
+                temporal=batch["temporal"],
+                temporal_cols=batch["temporal_cols"],
+                y_idx=batch["y_idx"],
+            )
+            out.update({k: v for k, v in batch.items() if k not in _BATCH_KEYS})
+            return out
+        return batch
+
     def _collate_fn(self, batch):
         elem = batch[0]
         elem_type = type(elem)
@@ -59,24 +114,31 @@ class TimeSeriesLoader(DataLoader):
 
         elif isinstance(elem, Mapping):
             if elem["static"] is None:
-                return dict(
+                out = dict(
                     temporal=self.collate_fn([d["temporal"] for d in batch]),
                     temporal_cols=elem["temporal_cols"],
                     y_idx=elem["y_idx"],
                 )
-
-            return dict(
-                static=self.collate_fn([d["static"] for d in batch]),
-                static_cols=elem["static_cols"],
-                temporal=self.collate_fn([d["temporal"] for d in batch]),
-                temporal_cols=elem["temporal_cols"],
-                y_idx=elem["y_idx"],
-            )
+            else:
+                out = dict(
+                    static=self.collate_fn([d["static"] for d in batch]),
+                    static_cols=elem["static_cols"],
+                    temporal=self.collate_fn([d["temporal"] for d in batch]),
+                    temporal_cols=elem["temporal_cols"],
+                    y_idx=elem["y_idx"],
+                )
+            # Per-serie tensors attached to the dataset, see `with_series_tensors`
+            for k in elem.keys() - _BATCH_KEYS:
+                out[k] = self.collate_fn([d[k] for d in batch])
+            return out
 
         raise TypeError(f"Unknown {elem_type}")
 
 # %% ../nbs/tsdataset.ipynb 7
 class BaseTimeSeriesDataset(Dataset):
+    # Per-serie tensors of the models, e.g. their scaler statistics, attached
+    # to a copy of the dataset through `with_series_tensors`
+    series_tensors = {}
 
     def __init__(
         self,
@@ -109,11 +171,25 @@ class BaseTimeSeriesDataset(Dataset):
     def __len__(self):
         return self.n_groups
 
+    def with_series_tensors(self, **series_tensors):
+        """Returns a shallow copy of the dataset whose items carry the `[n_groups, ...]` `series_tensors` under their keys."""
+        dataset = copy.copy(self)
+        dataset.series_tensors = {**self.series_tensors, **series_tensors}
+        return dataset
+
+    def _add_series_tensors(self, item, idx):
+        for k, v in self.series_tensors.items():
+            item[k] = v[idx]
+        return item
+
     def _as_torch_copy(
         self,
         x: Union[np.ndarray, torch.Tensor],
         dtype: torch.dtype = torch.float32,
     ) -> torch.Tensor:
+        if isinstance(x, np.memmap) and x.dtype == np.float32:
+            # Memory-mapped arrays are kept on disk, the tensor shares its pages
+            return torch.from_numpy(x)
         if isinstance(x, np.ndarray):
             x = torch.from_numpy(x)
         return x.to(dtype, copy=False).clone()
@@ -193,8 +269,41 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
                 y_idx=self.y_idx,
             )
 
-            return item
-        raise ValueError(f"idx must be int, got {type(idx)}")
+            return self._add_series_tensors(item, idx)
+        if isinstance(idx, (list, np.ndarray)):
+            return self._get_batch(np.asarray(idx, dtype=np.int64))
+        raise ValueError(f"idx must be int or a list of ints, got {type(idx)}")
+
+    def _get_batch(self, idxs):
+        # Gathers the series straight from the flat storage into a
+        # [B, C, T] tensor, left-padded only to the longest serie of the batch
+        starts = self.indptr[idxs]
+        sizes = self.indptr[idxs + 1] - starts
+        max_size = sizes.max()
+
+        # Flat positions of every observation in the source and destination
+        batch_idxs = np.repeat(np.arange(len(idxs)), sizes)
+        offsets = np.arange(sizes.sum()) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        src_idxs = np.repeat(starts, sizes) + offsets
+        time_idxs = np.repeat(max_size - sizes, sizes) + offsets
+
+        temporal = torch.zeros(
+            size=(len(idxs), len(self.temporal_cols), max_size), dtype=torch.float32
+        )
+        temporal[batch_idxs, :, time_idxs] = self.temporal[src_idxs]
+
+        # Add static data if available
+        static = None if self.static is None else self.static[idxs]
+
+        batch = dict(
+            temporal=temporal,
+            temporal_cols=self.temporal_cols,
+            static=static,
+            static_cols=self.static_cols,
+            y_idx=self.y_idx,
+        )
+
+        return self._add_series_tensors(batch, idxs)
 
     def __repr__(self):
         return f"TimeSeriesDataset(n_data={self.temporal.shape[0]:,}, n_groups={self.n_groups:,})"
@@ -248,16 +357,10 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
         new_min_size = np.min(new_sizes)
         new_max_size = np.max(new_sizes)
 
-        for i in range(self.n_groups):
-            curr_slice = slice(self.indptr[i], self.indptr[i + 1])
-            curr_size = curr_slice.stop - curr_slice.start
-            futr_slice = slice(futr_dataset.indptr[i], futr_dataset.indptr[i + 1])
-            new_temporal[new_indptr[i] : new_indptr[i] + curr_size] = self.temporal[
-                curr_slice
-            ]
-            new_temporal[new_indptr[i] + curr_size : new_indptr[i + 1]] = (
-                futr_dataset.temporal[futr_slice]
-            )
+        # Scatter both datasets at once
+        curr_idxs, futr_idxs = self._append_idxs(self.indptr, futr_dataset.indptr)
+        new_temporal.index_copy_(0, torch.from_numpy(curr_idxs), self.temporal)
+        new_temporal.index_copy_(0, torch.from_numpy(futr_idxs), futr_dataset.temporal)
 
         # Define new dataset
         return TimeSeriesDataset(
@@ -272,6 +375,35 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
             sorted=self.sorted,
         )
 
+    def _slice(self, start: int, end: int) -> "TimeSeriesDataset":
+        """Dataset with the series from `start` to `end`."""
+        indptr = self.indptr[start : end + 1]
+        sizes = np.diff(indptr)
+        return TimeSeriesDataset(
+            temporal=self.temporal[indptr[0] : indptr[-1]],
+            temporal_cols=self.temporal_cols.copy(),
+            indptr=indptr - indptr[0],
+            max_size=sizes.max(),
+            min_size=sizes.min(),
+            static=None if self.static is None else self.static[start:end],
+            y_idx=self.y_idx,
+            static_cols=self.static_cols,
+            sorted=self.sorted,
+        )
+
+    @staticmethod
+    def _append_idxs(indptr, futr_indptr):
+        """
+        Positions of the current and future rows in the flat temporal data of the appended
+        dataset, each serie's rows are shifted by the number of rows that precede them from the other dataset.
+        """
+        curr_idxs = np.arange(indptr[-1]) + np.repeat(futr_indptr[:-1], np.diff(indptr))
+        futr_idxs = np.arange(futr_indptr[-1]) + np.repeat(
+            indptr[1:], np.diff(futr_indptr)
+        )
+        # index_copy_ requires int64 indices, which np.arange doesn't return on Windows with numpy<2
+        return curr_idxs.astype(np.int64), futr_idxs.astype(np.int64)
+
     @staticmethod
     def update_dataset(
         dataset, futr_df, id_col="unique_id", time_col="ds", target_col="y"
@@ -294,20 +426,14 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
             )
 
         # Define and fill new temporal with trimmed information
-        len_temporal, col_temporal = dataset.temporal.shape
-        total_trim = (left_trim + right_trim) * dataset.n_groups
-        new_temporal = torch.zeros(size=(len_temporal - total_trim, col_temporal))
-        new_indptr = [0]
-
-        acum = 0
-        for i in range(dataset.n_groups):
-            series_length = dataset.indptr[i + 1] - dataset.indptr[i]
-            new_length = series_length - left_trim - right_trim
-            new_temporal[acum : (acum + new_length), :] = dataset.temporal[
-                dataset.indptr[i] + left_trim : dataset.indptr[i + 1] - right_trim, :
-            ]
-            acum += new_length
-            new_indptr.append(acum)
+        keep = TimeSeriesDataset._trim_mask(
+            dataset.indptr, left_trim=left_trim, right_trim=right_trim
+        )
+        new_temporal = dataset.temporal.index_select(
+            0, torch.from_numpy(np.flatnonzero(keep))
+        )
+        new_sizes = np.diff(dataset.indptr) - left_trim - right_trim
+        new_indptr = np.append(0, np.cumsum(new_sizes))
 
         new_max_size = dataset.max_size - left_trim - right_trim
         new_min_size = dataset.min_size - left_trim - right_trim
@@ -327,6 +453,71 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
 
         return updated_dataset
 
+    @staticmethod
+    def _trim_mask(indptr, left_trim: int = 0, right_trim: int = 0):
+        """
+        Boolean mask over the rows of the flat temporal data that
+        keeps the indexes [t+left:t-right] of every serie.
+        """
+        sizes = np.diff(indptr)
+        positions = np.arange(indptr[-1]) - np.repeat(indptr[:-1], sizes)
+        return (positions >= left_trim) & (
+            positions < np.repeat(sizes - right_trim, sizes)
+        )
+
+    def save(self, path: str):
+        """
+        Write `temporal`, `indptr` and `static` as `.npy` files in the `path` directory,
+        so that `TimeSeriesDataset.load` can memory-map them instead of unpickling.
+        """
+        fs, _, _ = fsspec.get_fs_token_paths(path)
+        fs.makedirs(path, exist_ok=True)
+        arrays = {"temporal": self.temporal.numpy(), "indptr": np.asarray(self.indptr)}
+        if self.static is not None:
+            arrays["static"] = self.static.numpy()
+        for name, array in arrays.items():
+            with fsspec.open(f"{path}/{name}.npy", "wb") as f:
+                np.save(f, array)
+        metadata = dict(
+            temporal_cols=self.temporal_cols,
+            static_cols=self.static_cols,
+            max_size=self.max_size,
+            min_size=self.min_size,
+            y_idx=self.y_idx,
+            sorted=self.sorted,
+        )
+        with fsspec.open(f"{path}/metadata.pkl", "wb") as f:
+            pickle.dump(metadata, f)
+
+    @staticmethod
+    def load(path: str, mmap: bool = True) -> "TimeSeriesDataset":
+        """
+        Load a dataset written by `TimeSeriesDataset.save`.
+        With `mmap=True` and a local `path`, `temporal` and `static` stay on disk and are
+        mapped copy-on-write, so only the slices read by `__getitem__` are paged in
+        and forked DataLoader workers share the same pages.
+        """
+        fs, _, _ = fsspec.get_fs_token_paths(path)
+        mmap_mode = "c" if mmap and isinstance(fs, LocalFileSystem) else None
+
+        def load_array(name, mmap_mode=None):
+            if mmap_mode is not None:
+                return np.load(f"{path}/{name}.npy", mmap_mode=mmap_mode)
+            with fsspec.open(f"{path}/{name}.npy", "rb") as f:
+                return np.load(f)
+
+        with fsspec.open(f"{path}/metadata.pkl", "rb") as f:
+            metadata = pickle.load(f)
+        static = None
+        if fs.exists(f"{path}/static.npy"):
+            static = load_array("static", mmap_mode=mmap_mode)
+        return TimeSeriesDataset(
+            temporal=load_array("temporal", mmap_mode=mmap_mode),
+            indptr=load_array("indptr"),
+            static=static,
+            **metadata,
+        )
+
     @staticmethod
     def from_df(
         df,
@@ -426,6 +617,8 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
         static=None,
         static_cols=None,
         sorted=False,
+        files_index=None,
+        cache_size: int = 0,
     ):
         super().__init__(
             temporal_cols=temporal_cols,
@@ -444,25 +637,26 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
         self.last_times = last_times
         self.indices = indices
         self.n_groups = len(files_ds)
+        # list with the (file, row_group, num_rows) chunks of each timeseries
+        self.files_index = files_index
+        # bounded LRU cache of the decoded timeseries, kept by each process
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
 
     def __getitem__(self, idx):
         if not isinstance(idx, int):
             raise ValueError(f"idx must be int, got {type(idx)}")
 
         temporal_cols = self.temporal_cols.copy()
-        data = pd.read_parquet(
-            self.files_ds[idx], columns=temporal_cols.tolist()
-        ).to_numpy()
-        data, temporal_cols = TimeSeriesDataset._ensure_available_mask(
-            data, temporal_cols
-        )
-        data = self._as_torch_copy(data)
+        if "available_mask" not in temporal_cols:
+            temporal_cols = temporal_cols.append(pd.Index(["available_mask"]))
+        data = self._read_serie(idx)
 
         # Pad the temporal data to the left
         temporal = torch.zeros(
             size=(len(temporal_cols), self.max_size), dtype=torch.float32
         )
-        temporal[: len(temporal_cols), -len(data) :] = data.permute(1, 0)
+        temporal[: len(temporal_cols), -data.shape[1] :] = data
 
         # Add static data if available
         static = None if self.static is None else self.static[idx, :]
@@ -475,7 +669,49 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
             y_idx=self.y_idx,
         )
 
-        return item
+        return self._add_series_tensors(item, idx)
+
+    def _read_serie(self, idx):
+        """Returns the [C, T] float32 data of a serie, with the available_mask as last row if absent from the files."""
+        if idx in self._cache:
+            self._cache.move_to_end(idx)
+            return self._cache[idx]
+
+        if self.files_index is None:
+            data = pd.read_parquet(
+                self.files_ds[idx], columns=self.temporal_cols.tolist()
+            ).to_numpy()
+            data, _ = TimeSeriesDataset._ensure_available_mask(data, self.temporal_cols)
+            data = self._as_torch_copy(data).permute(1, 0)
+        else:
+            data = self._read_row_groups(self.files_index[idx])
+
+        if self.cache_size > 0:
+            self._cache[idx] = data
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return data
+
+    def _read_row_groups(self, chunks):
+        import pyarrow.parquet as pq
+
+        # Decode each row group straight into its slice of the output
+        columns = self.temporal_cols.tolist()
+        n_rows = sum(num_rows for *_, num_rows in chunks)
+        data = torch.ones(
+            size=(len(columns) + ("available_mask" not in columns), n_rows),
+            dtype=torch.float32,
+        )
+        out = data.numpy()
+        start = 0
+        for file, row_groups in itertools.groupby(chunks, key=lambda chunk: chunk[0]):
+            parquet_file = pq.ParquetFile(file)
+            for _, row_group, num_rows in row_groups:
+                table = parquet_file.read_row_group(row_group, columns=columns)
+                for i, col in enumerate(columns):
+                    out[i, start : start + num_rows] = table.column(col).to_numpy()
+                start += num_rows
+        return data
 
     @staticmethod
     def from_data_directories(
@@ -486,10 +722,14 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
         id_col="unique_id",
         time_col="ds",
         target_col="y",
+        cache_size=0,
     ):
         """We expect directories to be a list of directories of the form [unique_id=id_0, unique_id=id_1, ...]. Each directory should contain the timeseries corresponding to that unqiue_id,
         represented as a pandas or polars DataFrame. The timeseries can be entirely contained in one parquet file or split between multiple, but within each parquet files the timeseries should be sorted by time.
-        Static df should also be a pandas or polars DataFrame"""
+        Static df should also be a pandas or polars DataFrame.
+        The files, row groups and row counts of each timeseries are indexed once here, so that reads decode only those row groups.
+        `cache_size` sets how many decoded timeseries are kept in memory (per DataLoader worker), 0 disables the cache.
+        """
         import pyarrow as pa
 
         # Define indices if not given and then extract static features
@@ -501,6 +741,7 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
         min_size = float("inf")
         last_times = []
         ids = []
+        files_index = []
         expected_temporal = {target_col, *exogs}
         available_mask_seen = True
 
@@ -511,7 +752,9 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
             uid = dir_path.name.split("=")[-1]
             total_rows = 0
             last_time = None
-            for file in dir_path.glob("*.parquet"):
+            chunks = []
+            # Files are read in name order, as when reading the whole directory
+            for file in sorted(dir_path.glob("*.parquet")):
                 meta = pa.parquet.read_metadata(file)
                 rg = meta.row_group(0)
                 col2pos = {
@@ -528,6 +771,10 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
                     if last_time is not None
                     else last_time_file
                 )
+                chunks.extend(
+                    (str(file), i, meta.row_group(i).num_rows)
+                    for i in range(meta.num_row_groups)
+                )
                 total_rows += sum(
                     meta.row_group(i).num_rows for i in range(meta.num_row_groups)
                 )
@@ -553,6 +800,7 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
             min_size = min(total_rows, min_size)
             ids.append(uid)
             last_times.append(last_time)
+            files_index.append(chunks)
 
         last_times = pd.Index(last_times, name=time_col)
         ids = pd.Series(ids, name=id_col)
@@ -575,6 +823,8 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
             static=static,
             static_cols=static_cols,
             sorted=sort_df,
+            files_index=files_index,
+            cache_size=cache_size,
         )
         return dataset
 
@@ -588,6 +838,7 @@ class TimeSeriesDataModule(pl.LightningDataModule):
         valid_batch_size=1024,
         drop_last=False,
         shuffle_train=True,
+        ragged=False,
         **dataloaders_kwargs
     ):
         super().__init__()
@@ -596,6 +847,7 @@ class TimeSeriesDataModule(pl.LightningDataModule):
         self.valid_batch_size = valid_batch_size
         self.drop_last = drop_last
         self.shuffle_train = shuffle_train
+        self.ragged = ragged
         self.dataloaders_kwargs = dataloaders_kwargs
 
     def train_dataloader(self):
@@ -604,6 +856,7 @@ class TimeSeriesDataModule(pl.LightningDataModule):
             batch_size=self.batch_size,
             shuffle=self.shuffle_train,
             drop_last=self.drop_last,
+            ragged=self.ragged,
             **self.dataloaders_kwargs
         )
         return loader
@@ -627,7 +880,7 @@ class TimeSeriesDataModule(pl.LightningDataModule):
         )
         return loader
 
-# %% ../nbs/tsdataset.ipynb 27
+# %% ../nbs/tsdataset.ipynb 32
 class _DistributedTimeSeriesDataModule(TimeSeriesDataModule):
     def __init__(
         self,
@@ -636,6 +889,7 @@ class _DistributedTimeSeriesDataModule(TimeSeriesDataModule):
         valid_batch_size=1024,
         drop_last=False,
         shuffle_train=True,
+        ragged=False,
         **dataloaders_kwargs
     ):
         super(TimeSeriesDataModule, self).__init__()
@@ -644,6 +898,7 @@ class _DistributedTimeSeriesDataModule(TimeSeriesDataModule):
         self.valid_batch_size = valid_batch_size
         self.drop_last = drop_last
         self.shuffle_train = shuffle_train
+        self.ragged = ragged
         self.dataloaders_kwargs = dataloaders_kwargs
 
     def setup(self, stage):
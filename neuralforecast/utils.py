@@ -483,6 +483,102 @@ class PredictionIntervals:
         )
 
 # %% ../nbs/utils.ipynb 32
+def _quantile_positions(n_samples: int, cuts: List[float]):
+    """Neighbouring sorted positions and interpolation weights of the quantiles `cuts`,
+    with the linear interpolation used by `np.quantile`."""
+    positions = np.asarray(cuts, dtype=np.float64) * (n_samples - 1)
+    lo = np.floor(positions).astype(np.int64)
+    hi = np.minimum(lo + 1, n_samples - 1)
+    return lo, hi, positions - lo
+
+
+def _conformal_intervals(
+    fcsts: np.ndarray,
+    scores: np.ndarray,
+    level: List[Union[int, float]],
+    method: str,
+) -> np.ndarray:
+    """Computes the conformal intervals of all models and levels.
+
+    `fcsts` has shape [model, series, h], `scores` has shape [model, series, window, h]
+    and `level` should be already sorted. Returns an array [series * h, model * 2 * len(level)]
+    with the lower bounds (from the largest level) followed by the upper bounds of each model.
+    The scores are sorted once and every quantile is read from them, instead of selecting
+    each quantile separately as `np.quantile` does."""
+    n_models, n_series, horizon = fcsts.shape
+    # restrict scores to horizon, with the sorted windows in the last axis
+    scores = np.sort(scores[..., :horizon].transpose(0, 1, 3, 2), axis=-1)
+    n_windows = scores.shape[-1]
+    mean = fcsts[..., None]
+    if method == "conformal_distribution":
+        # quantiles of the forecast paths mean - scores and mean + scores, when sorted
+        # they're the lower paths in reverse order followed by the upper paths
+        alphas = [100 - lv for lv in level]
+        cuts = [alpha / 200 for alpha in reversed(alphas)]
+        cuts.extend(1 - alpha / 200 for alpha in alphas)
+        lo, hi, frac = _quantile_positions(2 * n_windows, cuts)
+
+        def paths(idxs):
+            upper = idxs >= n_windows
+            sign = np.where(upper, 1, -1).astype(scores.dtype)
+            return (
+                mean
+                + sign
+                * scores[..., np.where(upper, idxs - n_windows, n_windows - 1 - idxs)]
+            )
+
+        lo_vals, hi_vals = paths(lo), paths(hi)
+        intervals = lo_vals + (hi_vals - lo_vals) * frac.astype(lo_vals.dtype)
+    elif method == "conformal_error":
+        # absolute errors around the forecasts
+        lo, hi, frac = _quantile_positions(n_windows, [lv / 100 for lv in level])
+        quantiles = scores[..., lo] + (scores[..., hi] - scores[..., lo]) * frac.astype(
+            scores.dtype
+        )
+        intervals = np.concatenate(
+            [mean - quantiles[..., ::-1], mean + quantiles], axis=-1
+        )
+    else:
+        raise ValueError(f"prediction intervals method {method} not supported")
+    return intervals.transpose(1, 2, 0, 3).reshape(n_series * horizon, -1)
+
+
+def _scores_from_df(
+    cs_df: DFType,
+    model_names: List[str],
+    cs_n_windows: int,
+    n_series: int,
+) -> np.ndarray:
+    """Conformity scores [model, series, window, h] from a DataFrame sorted by series, window and time."""
+    scores = np.stack([cs_df[model].to_numpy() for model in model_names])
+    return scores.reshape(len(model_names), n_series, cs_n_windows, -1)
+
+
+def _add_conformal_intervals(
+    fcst_df: DFType,
+    scores: np.ndarray,
+    model_names: List[str],
+    level: List[Union[int, float]],
+    method: str,
+) -> DFType:
+    """Adds the conformal intervals of all models to `fcst_df`, built in a single frame."""
+    n_series = scores.shape[1]
+    fcsts = np.stack([fcst_df[model].to_numpy() for model in model_names])
+    fcsts = fcsts.reshape(len(model_names), n_series, -1)
+    intervals = _conformal_intervals(fcsts, scores, level, method)
+    cols = [
+        f"{model}-{side}-{lv}"
+        for model in model_names
+        for side, levels in [("lo", reversed(level)), ("hi", level)]
+        for lv in levels
+    ]
+    if isinstance(fcst_df, pd.DataFrame):
+        intervals_df = pd.DataFrame(intervals, columns=cols, index=fcst_df.index)
+    else:
+        intervals_df = type(fcst_df)(dict(zip(cols, intervals.T)))
+    return ufp.horizontal_concat([fcst_df, intervals_df])
+
+# %% ../nbs/utils.ipynb 33
 def add_conformal_distribution_intervals(
     fcst_df: DFType,
     cs_df: DFType,
@@ -497,30 +593,12 @@ def add_conformal_distribution_intervals(
     `level` should be already sorted. This strategy creates forecasts paths
     based on errors and calculate quantiles using those paths.
     """
-    fcst_df = ufp.copy_if_pandas(fcst_df, deep=False)
-    alphas = [100 - lv for lv in level]
-    cuts = [alpha / 200 for alpha in reversed(alphas)]
-    cuts.extend(1 - alpha / 200 for alpha in alphas)
-    for model in model_names:
-        scores = cs_df[model].to_numpy().reshape(n_series, cs_n_windows, horizon)
-        scores = scores.transpose(1, 0, 2)
-        # restrict scores to horizon
-        scores = scores[:, :, :horizon]
-        mean = fcst_df[model].to_numpy().reshape(1, n_series, -1)
-        scores = np.vstack([mean - scores, mean + scores])
-        quantiles = np.quantile(
-            scores,
-            cuts,
-            axis=0,
-        )
-        quantiles = quantiles.reshape(len(cuts), -1).T
-        lo_cols = [f"{model}-lo-{lv}" for lv in reversed(level)]
-        hi_cols = [f"{model}-hi-{lv}" for lv in level]
-        out_cols = lo_cols + hi_cols
-        fcst_df = ufp.assign_columns(fcst_df, out_cols, quantiles)
-    return fcst_df
+    scores = _scores_from_df(cs_df, model_names, cs_n_windows, n_series)
+    return _add_conformal_intervals(
+        fcst_df, scores, model_names, level, "conformal_distribution"
+    )
 
-# %% ../nbs/utils.ipynb 33
+# %% ../nbs/utils.ipynb 34
 def add_conformal_error_intervals(
     fcst_df: DFType,
     cs_df: DFType,
@@ -535,28 +613,12 @@ def add_conformal_error_intervals(
     `level` should be already sorted. This startegy creates prediction intervals
     based on the absolute errors.
     """
-    fcst_df = ufp.copy_if_pandas(fcst_df, deep=False)
-    cuts = [lv / 100 for lv in level]
-    for model in model_names:
-        mean = fcst_df[model].to_numpy().ravel()
-        scores = cs_df[model].to_numpy().reshape(n_series, cs_n_windows, horizon)
-        scores = scores.transpose(1, 0, 2)
-        # restrict scores to horizon
-        scores = scores[:, :, :horizon]
-        quantiles = np.quantile(
-            scores,
-            cuts,
-            axis=0,
-        )
-        quantiles = quantiles.reshape(len(cuts), -1)
-        lo_cols = [f"{model}-lo-{lv}" for lv in reversed(level)]
-        hi_cols = [f"{model}-hi-{lv}" for lv in level]
-        quantiles = np.vstack([mean - quantiles[::-1], mean + quantiles]).T
-        columns = lo_cols + hi_cols
-        fcst_df = ufp.assign_columns(fcst_df, columns, quantiles)
-    return fcst_df
+    scores = _scores_from_df(cs_df, model_names, cs_n_windows, n_series)
+    return _add_conformal_intervals(
+        fcst_df, scores, model_names, level, "conformal_error"
+    )
 
-# %% ../nbs/utils.ipynb 34
+# %% ../nbs/utils.ipynb 35
 def get_prediction_interval_method(method: str):
     available_methods = {
         "conformal_distribution": add_conformal_distribution_intervals,